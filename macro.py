@@ -1,56 +1,3379 @@
 import os
+import sys
+import abc
 import json
 import time
 import threading
-import schedule
+import itertools
+import heapq
+import bisect
+import math
+import struct
+import mmap
+import sqlite3
+import zlib
+from array import array
 import datetime
-import pyautogui
-import keyboard
+import calendar
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import List, Dict, Tuple, Optional
-import win32api
-import win32con
-import win32gui
 import ctypes
 from ctypes import wintypes
 import logging
 import traceback
+from collections import OrderedDict
+from functools import lru_cache
+
+# Windows 전용 모듈 (없으면 헤드리스 백엔드와 벤치마크만 사용 가능)
+try:
+    import win32api
+    import win32con
+    import win32gui
+except ImportError:
+    win32api = win32con = win32gui = None
+
+try:
+    import win32file
+    import win32event
+except ImportError:
+    win32file = win32event = None
+
+try:
+    import keyboard
+except ImportError:
+    keyboard = None
+
+try:
+    import lzma
+except ImportError:  # lzma 없이 빌드된 Python에서는 zlib만 사용
+    lzma = None
+
+try:
+    import pyautogui
+except Exception:  # 디스플레이가 없는 환경에서는 ImportError 외의 예외도 발생
+    pyautogui = None
 
 # 화면 안전장치 비활성화
-pyautogui.FAILSAFE = False
+if pyautogui is not None:
+    pyautogui.FAILSAFE = False
+
+# 로깅 설정
+class DebugLogger:
+    def __init__(self):
+        self.log_file = os.path.join(os.path.expanduser("~"), "PyMacro", "debug.log")
+        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+        
+        # 로거 설정
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format='%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+            handlers=[
+                logging.FileHandler(self.log_file, encoding='utf-8'),
+                logging.StreamHandler()
+            ]
+        )
+        self.logger = logging.getLogger(__name__)
+        
+    def debug(self, msg):
+        self.logger.debug(msg)
+        
+    def info(self, msg):
+        self.logger.info(msg)
+        
+    def warning(self, msg):
+        self.logger.warning(msg)
+        
+    def error(self, msg):
+        self.logger.error(msg)
+        
+    def exception(self, msg):
+        self.logger.exception(msg)
+
+# 링 버퍼에 기록되는 원시 이벤트 종류 (훅 콜백 -> 드레이너)
+RAW_MOUSE_MOVE = 0
+RAW_MOUSE_BUTTON = 1
+RAW_PYNPUT_KEY = 2
+RAW_KEY_NAME = 3
+
+class EventRingBuffer:
+    """훅 콜백용 고정 크기 링 버퍼
+
+    훅 스레드는 미리 할당된 슬롯에 튜플 하나를 덮어쓰기만 하고 바로 반환한다.
+    시퀀스 번호는 itertools.count로 발급하므로 (GIL 하에서 원자적) 락이 필요 없다.
+    읽기는 드레이너 스레드 하나만 수행하며, 생산자가 한 바퀴 앞질러
+    덮어쓴 구간은 유실 이벤트로 집계한다.
+    훅 스레드가 여럿이면 _head 기록 순서가 뒤바뀌어 값이 뒤로 갈 수 있으므로,
+    드레이너는 지금까지 본 가장 큰 시퀀스 번호(_max_head)와 함께 사용한다.
+    """
+
+    def __init__(self, capacity=65536):
+        # 슬롯 인덱스를 비트 마스크로 계산하도록 2의 거듭제곱으로 맞춤
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self._slots = [None] * size
+        self._seq = itertools.count()
+        self._head = -1
+        self._max_head = -1  # 드레이너가 확인한 가장 큰 시퀀스 번호
+        self._read_seq = 0
+
+        # 통계 (드레이너 스레드에서만 갱신)
+        self.drained_count = 0
+        self.dropped_count = 0
+        self.overflow_count = 0
+        self.high_water = 0
+
+    def push(self, kind, timestamp, x=0, y=0, detail=None, pressed=False):
+        """훅 스레드에서 호출 - 슬롯 하나만 기록하고 즉시 반환"""
+        seq = next(self._seq)
+        self._slots[seq & self._mask] = (seq, kind, timestamp, x, y, detail, pressed)
+        self._head = seq
+
+    def drain(self):
+        """기록된 원시 이벤트를 순서대로 꺼냄 (드레이너 스레드 전용)"""
+        records = []
+        slots = self._slots
+        mask = self._mask
+        start = seq = self._read_seq
+        head = max(self._head, self._max_head)
+
+        while True:
+            slot = slots[seq & mask]
+            if slot is None or slot[0] < seq:
+                # 아직 기록되지 않은 슬롯
+                break
+            if slot[0] > seq:
+                # 생산자가 한 바퀴 앞질러 덮어씀 - 남아 있는 가장 오래된 위치로 이동
+                head = max(head, slot[0], self._head)
+                oldest = max(head - mask, seq + 1)
+                self.dropped_count += oldest - seq
+                self.overflow_count += 1
+                seq = oldest
+                continue
+            records.append(slot)
+            seq += 1
+
+        self._read_seq = seq
+        head = max(head, seq - 1)
+        self._max_head = head
+        backlog = head - start + 1
+        if backlog > self.high_water:
+            self.high_water = backlog
+        self.drained_count += len(records)
+        return records
+
+    def stats(self):
+        """버퍼 상태 통계"""
+        return {
+            "capacity": self.capacity,
+            "written": max(self._head, self._max_head) + 1,
+            "drained": self.drained_count,
+            "dropped": self.dropped_count,
+            "overflows": self.overflow_count,
+            "high_water": self.high_water,
+        }
+
+# 이벤트 시간 단위: 녹화 시작 기준 perf_counter_ns 오프셋을 정수 마이크로초로 저장
+# (구버전 파일은 time_unit 없이 time.time() 기반 초 단위 float)
+TIME_UNIT = "us"
+TIME_UNITS_PER_SECOND = 1_000_000
+EVENT_CLOCK = "perf_counter_ns"
+
+# 이벤트 종류 코드 (EventStream 타입 열) - 표준 종류는 고정 코드를 사용
+EVENT_TYPES = ('mouse_move', 'mouse_down', 'mouse_up', 'key_down', 'key_up')
+EV_MOUSE_MOVE, EV_MOUSE_DOWN, EV_MOUSE_UP, EV_KEY_DOWN, EV_KEY_UP = range(len(EVENT_TYPES))
+
+# 종류별 표준 필드 (이 구성을 벗어난 이벤트는 원본 dict를 그대로 보관)
+_EVENT_FIELDS = {
+    EV_MOUSE_MOVE: ('type', 'x', 'y', 'time'),
+    EV_MOUSE_DOWN: ('type', 'button', 'x', 'y', 'time'),
+    EV_MOUSE_UP: ('type', 'button', 'x', 'y', 'time'),
+    EV_KEY_DOWN: ('type', 'key', 'time'),
+    EV_KEY_UP: ('type', 'key', 'time'),
+}
+
+class EventStream:
+    """열 단위로 저장되는 이벤트 목록
+
+    이벤트마다 dict를 만드는 대신 타입/시간(정수 마이크로초)/좌표/상세(키·버튼 이름)
+    열을 array로 보관한다. 키·버튼 이름과 비표준 이벤트 종류는 문자열 테이블에
+    한 번만 저장하고 인덱스로 참조한다. 기존 JSON dict 스키마와 무손실로
+    상호 변환된다.
+    """
+
+    def __init__(self):
+        self.types = array('B')
+        self.times = array('q')
+        self.xs = array('i')
+        self.ys = array('i')
+        self.details = array('I')  # 문자열 테이블 인덱스 (0: 없음)
+        
+        self.type_names = list(EVENT_TYPES)
+        self._type_codes = {name: code for code, name in enumerate(self.type_names)}
+        self.strings = [None]
+        self._string_index = {}
+        
+        # 표준 스키마에 맞지 않는 이벤트의 원본 (인덱스 -> dict)
+        self.extras = {}
+        
+        # 시간순 정렬이 보장된 경우 True (정렬 플래그가 있는 바이너리 파일 등 - 정렬 검사 생략)
+        self.time_sorted = False
+
+    def __len__(self):
+        return len(self.types)
+
+    def type_code(self, type_name):
+        """이벤트 종류 이름을 타입 코드로 변환 (없으면 새로 등록)"""
+        code = self._type_codes.get(type_name)
+        if code is None:
+            code = len(self.type_names)
+            self.type_names.append(type_name)
+            self._type_codes[type_name] = code
+        return code
+
+    def string_id(self, value):
+        """문자열 테이블 인덱스 (없으면 새로 등록)"""
+        if value is None:
+            return 0
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._string_index[value] = index
+        return index
+
+    def append(self, type_code, event_time, x=0, y=0, detail=None):
+        """이벤트 한 개 추가"""
+        self.types.append(type_code)
+        self.times.append(event_time)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.details.append(self.string_id(detail))
+
+    def append_dict(self, event, legacy_seconds=False):
+        """JSON 스키마의 이벤트 dict 한 개 추가
+
+        legacy_seconds가 True이면 구버전 초 단위 시간을 마이크로초로 변환한다.
+        """
+        code = self.type_code(event.get('type'))
+        fields = _EVENT_FIELDS.get(code)
+        x, y = event.get('x', 0), event.get('y', 0)
+        detail = event.get('key', event.get('button'))
+        event_time = event.get('time', 0)
+        
+        if legacy_seconds and isinstance(event_time, (int, float)):
+            event_time = round(event_time * TIME_UNITS_PER_SECOND)
+            if 'time' in event:
+                event = dict(event, time=event_time)
+        
+        standard = (
+            fields is not None
+            and len(event) == len(fields)
+            and all(field in event for field in fields)
+            and type(x) is int and type(y) is int
+            and type(event_time) is int
+            and (detail is None or isinstance(detail, str))
+        )
+        
+        if not standard:
+            # 비표준 이벤트는 원본을 보관하고 열에는 정렬/재생용 값만 기록
+            self.extras[len(self.types)] = dict(event)
+            x = int(x) if isinstance(x, (int, float)) else 0
+            y = int(y) if isinstance(y, (int, float)) else 0
+            event_time = int(event_time) if isinstance(event_time, (int, float)) else 0
+            detail = detail if isinstance(detail, str) else None
+        
+        self.append(code, event_time, x, y, detail)
+
+    @classmethod
+    def from_dicts(cls, events, legacy_seconds=False):
+        """이벤트 dict 목록에서 생성"""
+        stream = cls()
+        for event in events:
+            stream.append_dict(event, legacy_seconds)
+        return stream
+
+    @classmethod
+    def from_macro_data(cls, macro_data):
+        """매크로 파일 데이터에서 생성 (time_unit이 없는 구버전 파일은 초 단위로 간주)"""
+        legacy_seconds = macro_data.get("time_unit") != TIME_UNIT
+        return cls.from_dicts(macro_data.get("events", []), legacy_seconds)
+
+    def to_dict(self, index):
+        """인덱스 위치의 이벤트를 JSON 스키마 dict로 변환"""
+        extra = self.extras.get(index)
+        if extra is not None:
+            return dict(extra)
+        
+        code = self.types[index]
+        event = {'type': self.type_names[code]}
+        if code == EV_MOUSE_MOVE:
+            event['x'] = self.xs[index]
+            event['y'] = self.ys[index]
+        elif code == EV_MOUSE_DOWN or code == EV_MOUSE_UP:
+            event['button'] = self.strings[self.details[index]]
+            event['x'] = self.xs[index]
+            event['y'] = self.ys[index]
+        else:
+            event['key'] = self.strings[self.details[index]]
+        event['time'] = self.times[index]
+        return event
+
+    def to_dicts(self):
+        """JSON 스키마의 이벤트 dict 목록으로 변환"""
+        return [self.to_dict(i) for i in range(len(self.types))]
+
+    def rows(self):
+        """재생용 (종류 이름, 시간, x, y, 상세) 튜플을 순서대로 생성"""
+        type_names = self.type_names
+        strings = self.strings
+        for code, event_time, x, y, detail in zip(self.types, self.times, self.xs, self.ys, self.details):
+            yield type_names[code], event_time, x, y, strings[detail]
+
+    def is_time_sorted(self):
+        """시간순 정렬 여부"""
+        times = self.times
+        return all(times[i] <= times[i + 1] for i in range(len(times) - 1))
+
+    def sorted_by_time(self):
+        """시간순으로 정렬된 스트림 반환 (이미 정렬되어 있으면 자기 자신)"""
+        if self.time_sorted or self.is_time_sorted():
+            return self
+        
+        order = sorted(range(len(self.times)), key=self.times.__getitem__)
+        result = EventStream()
+        result.type_names = list(self.type_names)
+        result._type_codes = dict(self._type_codes)
+        result.strings = list(self.strings)
+        result._string_index = dict(self._string_index)
+        
+        result.types = array('B', (self.types[i] for i in order))
+        result.times = array('q', (self.times[i] for i in order))
+        result.xs = array('i', (self.xs[i] for i in order))
+        result.ys = array('i', (self.ys[i] for i in order))
+        result.details = array('I', (self.details[i] for i in order))
+        result.extras = {new: self.extras[old] for new, old in enumerate(order) if old in self.extras}
+        result.time_sorted = True
+        return result
+
+    def nbytes(self):
+        """열 데이터가 차지하는 메모리 (바이트)"""
+        return sum(column.itemsize * len(column)
+                   for column in (self.types, self.times, self.xs, self.ys, self.details))
+
+class TrajectorySimplifier:
+    """녹화 중 마우스 이동 경로를 온라인으로 단순화
+
+    마지막으로 확정한 점(앵커)에서 뻗어 나가는 허용 방향 구간(cone)을 유지하며,
+    새 샘플이 구간을 벗어나면 직전 샘플을 꼭짓점으로 확정한다. 샘플당 O(1)이고
+    버려진 샘플은 모두 확정된 선분에서 tolerance 픽셀 이내에 있다.
+    클릭/키 이벤트 직전에는 flush()로 보류 중인 샘플을 확정해 경계 위치를 보존한다.
+    """
+
+    def __init__(self, tolerance=1.0, max_interval=100_000):
+        self.tolerance = tolerance
+        self.max_interval = max_interval  # 꼭짓점 사이 최대 시간 간격 (마이크로초)
+        
+        self._anchor = None   # 마지막으로 확정된 점 (x, y, time)
+        self._pending = None  # 아직 확정되지 않은 마지막 샘플
+        self._base = 0.0      # 허용 구간의 기준 방향 (라디안)
+        self._low = None      # 기준 방향 대비 허용 구간 하한
+        self._high = None     # 기준 방향 대비 허용 구간 상한
+        
+        self.input_count = 0
+        self.output_count = 0
+
+    def _restart(self, point):
+        """새 앵커에서 허용 구간을 다시 시작"""
+        self._anchor = point
+        self._pending = None
+        self._low = self._high = None
+        self.output_count += 1
+
+    def _constrain(self, x, y):
+        """샘플이 허용 구간 안에 있으면 구간을 좁히고 True 반환"""
+        dx = x - self._anchor[0]
+        dy = y - self._anchor[1]
+        distance = math.hypot(dx, dy)
+        if distance <= self.tolerance:
+            return True
+        
+        angle = math.atan2(dy, dx)
+        half = math.asin(self.tolerance / distance)
+        if self._low is None:
+            self._base = angle
+            self._low, self._high = -half, half
+            return True
+        
+        relative = (angle - self._base + math.pi) % (2 * math.pi) - math.pi
+        if relative < self._low or relative > self._high:
+            return False
+        self._low = max(self._low, relative - half)
+        self._high = min(self._high, relative + half)
+        return True
+
+    def push(self, x, y, event_time):
+        """이동 샘플 추가 - 확정된 점이 있으면 (x, y, time) 반환"""
+        self.input_count += 1
+        point = (x, y, event_time)
+        
+        if self.tolerance <= 0:
+            self.output_count += 1
+            return point
+        
+        if self._anchor is None:
+            self._restart(point)
+            return point
+        
+        if self._pending is not None and event_time - self._anchor[2] <= self.max_interval:
+            if self._constrain(x, y):
+                self._pending = point
+                return None
+        elif self._pending is None:
+            self._constrain(x, y)
+            self._pending = point
+            return None
+        
+        # 허용 구간을 벗어났거나 시간 간격 초과 - 직전 샘플을 꼭짓점으로 확정
+        kept = self._pending
+        self._restart(kept)
+        self._constrain(x, y)
+        self._pending = point
+        return kept
+
+    def flush(self):
+        """보류 중인 샘플을 확정하여 반환 (클릭/키 경계, 녹화 종료 시 호출)"""
+        kept = self._pending
+        if kept is not None:
+            self._restart(kept)
+        return kept
+
+def write_macro_file(file_path, header, events):
+    """매크로 JSON 파일을 이벤트 단위로 스트리밍 기록
+
+    events는 이벤트 dict 이터러블이며 전체를 메모리에 올리지 않는다.
+    임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 기존 파일은 유지된다.
+    반환값은 기록된 이벤트 수.
+    """
+    temp_path = file_path + ".tmp"
+    count = 0
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n")
+        f.write('  "events": [')
+        for event in events:
+            f.write(",\n    " if count else "\n    ")
+            f.write(json.dumps(event, ensure_ascii=False))
+            count += 1
+        f.write("\n  ]\n}\n")
+    os.replace(temp_path, file_path)
+    return count
+
+class RecordingJournal:
+    """녹화 중 이벤트를 청크 단위로 디스크에 이어 쓰는 저널
+
+    JSON Lines 형식으로 첫 줄은 매크로 헤더, 이후 각 줄은 이벤트 dict 배열(청크)이다.
+    청크마다 flush하고 fsync_interval마다 fsync하므로 비정상 종료 시에도
+    마지막으로 온전히 기록된 청크까지 복구할 수 있다.
+    """
+
+    SUFFIX = ".journal"
+
+    def __init__(self, path, header, fsync_interval=1.0):
+        self.path = path
+        self.header = header
+        self.fsync_interval = fsync_interval
+        self.event_count = 0
+        self.chunk_count = 0
+        self._last_sync = time.monotonic()
+        
+        self._file = open(path, "w", encoding="utf-8")
+        self._file.write(json.dumps(header, ensure_ascii=False) + "\n")
+        self.sync()
+
+    def append_chunk(self, events):
+        """이벤트 dict 목록 한 청크를 기록"""
+        if not events:
+            return
+        self._file.write(json.dumps(events, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.event_count += len(events)
+        self.chunk_count += 1
+        
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self):
+        """버퍼를 디스크까지 기록"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    @staticmethod
+    def read_header(path):
+        """저널 헤더 읽기 (손상 시 None)"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def iter_events(path):
+        """저널의 이벤트를 청크 순서대로 생성 (잘린 마지막 청크는 무시)"""
+        with open(path, "r", encoding="utf-8") as f:
+            f.readline()  # 헤더
+            for line in f:
+                try:
+                    chunk = json.loads(line)
+                except ValueError:
+                    break
+                yield from chunk
+
+    @classmethod
+    def finalize(cls, path, file_path, header_updates=None, binary_options=None):
+        """저널을 매크로 파일로 변환 - 기록된 이벤트 수 반환"""
+        header = cls.read_header(path)
+        if header is None:
+            raise ValueError(f"저널 헤더 손상: {path}")
+        if header_updates:
+            header.update(header_updates)
+        # 요약 정보 계산을 위해 열 단위로 읽은 뒤 기록 (이벤트별 dict는 보관하지 않음)
+        stream = EventStream.from_dicts(cls.iter_events(path), header.get("time_unit") != TIME_UNIT)
+        return write_macro(file_path, header, stream, binary_options)
+
+class ScheduleJournal:
+    """스케줄 목록 저장소 - 스냅샷 파일 + 추가 전용 저널
+
+    스냅샷(schedules.json)은 압축할 때만 임시 파일에 쓴 뒤 os.replace로 원자적으로 교체하고,
+    편집은 저널(schedules.json.journal)에 JSON Lines 레코드 한 줄씩 덧붙인다.
+      {"op": "add", "schedule": {...}}
+      {"op": "update", "id": ..., "changes": {...}}
+      {"op": "delete", "id": ...}
+    레코드는 여러 번 적용해도 결과가 같으므로, 스냅샷 교체 후 저널을 비우기 전에 중단되어도
+    다음 시작 때 그대로 다시 재생하면 된다. 잘린 마지막 줄은 무시하고 바로 압축한다.
+    """
+
+    SUFFIX = ".journal"
+
+    def __init__(self, snapshot_path, log=None, compact_min_records=256, compact_ratio=1.0):
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path + self.SUFFIX
+        self.log = log or logging.getLogger(__name__)
+        self.compact_min_records = compact_min_records
+        self.compact_ratio = compact_ratio
+        self.record_count = 0  # 마지막 압축 이후 저널 레코드 수
+        self.compactions = 0
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _read_snapshot(self):
+        for path in (self.snapshot_path, self.snapshot_path + ".backup"):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                self.log.error(f"스케줄 스냅샷 읽기 오류 ({path}): {str(e)}")
+        return []
+
+    @staticmethod
+    def apply(schedules, record):
+        """레코드 하나를 id -> 스케줄 OrderedDict에 적용"""
+        op = record.get("op")
+        if op == "add":
+            schedule = record["schedule"]
+            schedules[schedule["id"]] = schedule
+        elif op == "update":
+            if record["id"] in schedules:
+                schedules[record["id"]] = dict(schedules[record["id"]], **record["changes"])
+        elif op == "delete":
+            schedules.pop(record["id"], None)
+        else:
+            raise ValueError(f"알 수 없는 스케줄 저널 레코드: {op}")
+
+    def load(self):
+        """스냅샷을 읽고 저널을 재생한 스케줄 목록 반환"""
+        with self._lock:
+            schedules = OrderedDict((sched["id"], sched) for sched in self._read_snapshot())
+            snapshot_count = len(schedules)
+            
+            records = 0
+            truncated = False
+            if os.path.exists(self.journal_path):
+                with open(self.journal_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            self.apply(schedules, json.loads(line))
+                        except (ValueError, KeyError, TypeError):
+                            truncated = True
+                            break
+                        records += 1
+            self.record_count = records
+            self.log.info(f"스케줄 스냅샷 {snapshot_count}개 + 저널 레코드 {records}개 재생 -> {len(schedules)}개")
+        
+        result = list(schedules.values())
+        if truncated:
+            # 손상된 줄 뒤에 이어 쓰지 않도록 곧바로 스냅샷으로 정리
+            self.log.warning(f"스케줄 저널 끝부분 손상 - 레코드 {records}개까지 복구 후 압축")
+            self.compact(result)
+        elif self.needs_compaction(len(result)):
+            self.compact(result)
+        return result
+
+    def _append(self, *records):
+        # 여러 레코드는 한 번에 쓰고 fsync도 한 번만
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.journal_path, "a", encoding="utf-8")
+            self._file.write("".join(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                                     for record in records))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.record_count += len(records)
+
+    def add(self, schedule):
+        self._append({"op": "add", "schedule": schedule})
+
+    def update(self, schedule_id, changes):
+        self._append({"op": "update", "id": schedule_id, "changes": changes})
+
+    def delete(self, schedule_id):
+        self._append({"op": "delete", "id": schedule_id})
+
+    def update_many(self, updates):
+        """[(id, changes), ...] 여러 갱신을 한 번에 기록"""
+        if updates:
+            self._append(*({"op": "update", "id": schedule_id, "changes": changes}
+                           for schedule_id, changes in updates))
+
+    def needs_compaction(self, schedule_count):
+        return (self.record_count >= self.compact_min_records
+                and self.record_count > schedule_count * self.compact_ratio)
+
+    def compact(self, schedules):
+        """현재 스케줄 목록을 스냅샷으로 원자적으로 기록하고 저널을 비움"""
+        with self._lock:
+            temp_path = self.snapshot_path + ".tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(schedules, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.snapshot_path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+                raise
+            
+            # 스냅샷 교체 후 저널 비우기
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, "w", encoding="utf-8")
+            self.record_count = 0
+            self.compactions += 1
+        self.log.info(f"스케줄 스냅샷 압축 완료: {len(schedules)}개")
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# 매크로 파일 형식 (확장자로 구분)
+MACRO_FORMAT_BINARY = "binary"
+MACRO_FORMAT_JSON = "json"
+MACRO_EXTENSIONS = {MACRO_FORMAT_BINARY: ".pmb", MACRO_FORMAT_JSON: ".json"}
+
+# 바이너리 매크로 파일 (.pmb)
+#   고정 헤더 | 메타데이터 JSON (헤더 필드, 종류/문자열 테이블, 비표준 이벤트) | 고정 길이 이벤트 레코드
+MACRO_BINARY_MAGIC = b"PYMB"
+MACRO_BINARY_VERSION = 2
+MACRO_FLAG_SORTED = 0x0001  # 레코드가 시간순으로 정렬되어 있음
+MACRO_FLAG_DELTA = 0x0002   # 시간/x/y가 이전 레코드 대비 차이값으로 저장됨 (버전 2)
+MACRO_FLAG_ZLIB = 0x0004    # 레코드 영역이 zlib 압축됨 (버전 2)
+MACRO_FLAG_LZMA = 0x0008    # 레코드 영역이 lzma(xz) 압축됨 (버전 2)
+
+# 레코드 영역 압축 방식
+CODEC_NONE = "none"
+CODEC_ZLIB = "zlib"
+CODEC_LZMA = "lzma"
+MACRO_CODECS = (CODEC_NONE, CODEC_ZLIB, CODEC_LZMA)
+_CODEC_FLAGS = {CODEC_NONE: 0, CODEC_ZLIB: MACRO_FLAG_ZLIB, CODEC_LZMA: MACRO_FLAG_LZMA}
+
+# 매직, 버전, 플래그, 이벤트 수, 길이(마이크로초), 메타데이터 길이
+_BINARY_HEADER = struct.Struct("<4sHHIqI")
+# 시간(마이크로초), 종류 코드, (패딩), 문자열 테이블 인덱스, x, y
+_BINARY_RECORD = struct.Struct("<qBxHii")
+
+def macro_file_format(file_path):
+    """확장자로 매크로 파일 형식 판별 (매크로 파일이 아니면 None)"""
+    extension = os.path.splitext(file_path)[1].lower()
+    for macro_format, macro_extension in MACRO_EXTENSIONS.items():
+        if extension == macro_extension:
+            return macro_format
+    return None
+
+def _record_compressor(codec, level):
+    if codec == CODEC_ZLIB:
+        return zlib.compressobj(6 if level is None else level)
+    if codec == CODEC_LZMA:
+        if lzma is None:
+            raise ValueError("이 Python에서는 lzma 압축을 사용할 수 없습니다")
+        return lzma.LZMACompressor(preset=6 if level is None else level)
+    return None
+
+def _record_decompressor(flags):
+    if flags & MACRO_FLAG_ZLIB:
+        return zlib.decompressobj()
+    if flags & MACRO_FLAG_LZMA:
+        if lzma is None:
+            raise ValueError("이 Python에서는 lzma 압축 매크로를 읽을 수 없습니다")
+        return lzma.LZMADecompressor()
+    return None
+
+def summarize_event_stream(stream):
+    """매크로 요약 정보 (이벤트 수, 길이, 종류별 개수, 마우스 좌표 범위, 사용한 키)
+
+    매크로 파일 헤더에 함께 저장되어 이벤트를 읽지 않고도 목록/스케줄러에서 사용된다.
+    """
+    count = len(stream)
+    times = stream.times
+    type_counts = [0] * len(stream.type_names)
+    for code in stream.types:
+        type_counts[code] += 1
+    histogram = {stream.type_names[code]: type_count
+                 for code, type_count in enumerate(type_counts) if type_count}
+    
+    # 마우스 이벤트 좌표 범위와 키 이벤트에 사용된 키
+    mouse_codes = (EV_MOUSE_MOVE, EV_MOUSE_DOWN, EV_MOUSE_UP)
+    min_x = min_y = max_x = max_y = None
+    key_ids = set()
+    for code, x, y, detail in zip(stream.types, stream.xs, stream.ys, stream.details):
+        if code in mouse_codes:
+            if min_x is None:
+                min_x = max_x = x
+                min_y = max_y = y
+            else:
+                if x < min_x:
+                    min_x = x
+                elif x > max_x:
+                    max_x = x
+                if y < min_y:
+                    min_y = y
+                elif y > max_y:
+                    max_y = y
+        elif (code == EV_KEY_DOWN or code == EV_KEY_UP) and detail:
+            key_ids.add(detail)
+    
+    return {
+        "event_count": count,
+        "duration_us": max(times) - min(times) if count else 0,
+        "histogram": histogram,
+        "bbox": [min_x, min_y, max_x, max_y] if min_x is not None else None,
+        "keys": sorted(stream.strings[index] for index in key_ids),
+    }
+
+def describe_macro_summary(summary):
+    """요약 정보를 GUI 표시용 한 줄로 (예: 이동 120, 클릭 3, 키 8 [a, enter])"""
+    if not summary:
+        return ""
+    histogram = summary.get("histogram", {})
+    parts = []
+    for type_name, label in (("mouse_move", "이동"), ("mouse_down", "클릭"), ("key_down", "키")):
+        if histogram.get(type_name):
+            parts.append(f"{label} {histogram[type_name]}")
+    text = ", ".join(parts)
+    
+    keys = summary.get("keys") or []
+    if keys:
+        text += f" [{', '.join(keys[:5])}{' ...' if len(keys) > 5 else ''}]"
+    return text
+
+def write_macro_binary(file_path, header, stream, codec=CODEC_NONE, level=None,
+                       delta=False, min_compress_bytes=0):
+    """EventStream을 바이너리 매크로 파일로 기록 - 기록된 이벤트 수 반환
+
+    delta가 True이면 시간/좌표를 이전 레코드와의 차이로 저장하고, codec으로 레코드 영역을
+    압축한다. 레코드 영역이 min_compress_bytes보다 작으면 압축하지 않는다.
+    """
+    if len(stream.strings) > 0xFFFF or len(stream.type_names) > 0xFF:
+        raise ValueError("문자열/이벤트 종류 테이블이 바이너리 형식 한도를 넘습니다")
+    if codec not in MACRO_CODECS:
+        raise ValueError(f"지원하지 않는 압축 방식: {codec}")
+    
+    # 시간순으로 저장해 정렬 플래그를 세움 (재생 시 정렬 생략, 지연 재생 가능)
+    stream = stream.sorted_by_time()
+    count = len(stream)
+    if count * _BINARY_RECORD.size < min_compress_bytes:
+        codec = CODEC_NONE
+    flags = MACRO_FLAG_SORTED if stream.time_sorted or stream.is_time_sorted() else 0
+    flags |= _CODEC_FLAGS[codec] | (MACRO_FLAG_DELTA if delta else 0)
+    duration = max(stream.times) - min(stream.times) if count else 0
+    compressor = _record_compressor(codec, level)
+    
+    meta = dict(header)
+    meta.pop("events", None)
+    meta["time_unit"] = TIME_UNIT
+    meta["type_names"] = stream.type_names
+    meta["strings"] = stream.strings
+    if stream.extras:
+        meta["extras"] = {str(index): event for index, event in stream.extras.items()}
+    meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    
+    times, xs, ys = stream.times, stream.xs, stream.ys
+    if delta:
+        times = [t - p for t, p in zip(times, itertools.chain((0,), times))]
+        xs = [x - p for x, p in zip(xs, itertools.chain((0,), xs))]
+        ys = [y - p for y, p in zip(ys, itertools.chain((0,), ys))]
+    
+    temp_path = file_path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_BINARY_HEADER.pack(MACRO_BINARY_MAGIC, MACRO_BINARY_VERSION, flags,
+                                    count, duration, len(meta_bytes)))
+        f.write(meta_bytes)
+        
+        pack = _BINARY_RECORD.pack
+        types, details = stream.types, stream.details
+        chunk = 4096
+        for start in range(0, count, chunk):
+            end = min(start + chunk, count)
+            data = b"".join(pack(times[i], types[i], details[i], xs[i], ys[i]) for i in range(start, end))
+            f.write(compressor.compress(data) if compressor is not None else data)
+        if compressor is not None:
+            f.write(compressor.flush())
+    os.replace(temp_path, file_path)
+    return count
+
+def _read_binary_header(data, file_path):
+    """바이너리 매크로의 (헤더 dict, 레코드 시작 위치) - data는 bytes/memoryview"""
+    if len(data) < _BINARY_HEADER.size:
+        raise ValueError(f"바이너리 매크로 헤더가 잘림: {file_path}")
+    magic, version, flags, count, duration, meta_length = _BINARY_HEADER.unpack_from(data)
+    if magic != MACRO_BINARY_MAGIC:
+        raise ValueError(f"바이너리 매크로 파일이 아님: {file_path}")
+    if version > MACRO_BINARY_VERSION:
+        raise ValueError(f"지원하지 않는 바이너리 매크로 버전 {version}: {file_path}")
+    
+    meta_end = _BINARY_HEADER.size + meta_length
+    header = json.loads(bytes(data[_BINARY_HEADER.size:meta_end]).decode("utf-8"))
+    header.update({"format_version": version, "flags": flags,
+                   "event_count": count, "duration_us": duration})
+    return header, meta_end
+
+def _open_macro_binary(file_path):
+    """바이너리 매크로를 열어 (파일 객체, 헤더 dict) 반환 - 파일 위치는 레코드 영역 시작"""
+    f = open(file_path, "rb")
+    try:
+        prefix = f.read(_BINARY_HEADER.size)
+        meta_length = _BINARY_HEADER.unpack_from(prefix)[5] if len(prefix) == _BINARY_HEADER.size else 0
+        header, _ = _read_binary_header(prefix + f.read(meta_length), file_path)
+        return f, header
+    except Exception:
+        f.close()
+        raise
+
+def _iter_record_bytes(f, decompressor, read_size):
+    """레코드 영역을 read_size 이하의 (해제된) 조각으로 생성 - 해제 결과도 read_size로 제한"""
+    if decompressor is None:
+        while True:
+            data = f.read(read_size)
+            if not data:
+                return
+            yield data
+    
+    if hasattr(decompressor, "unconsumed_tail"):  # zlib
+        data = b""
+        while True:
+            if not data:
+                data = f.read(read_size)
+                if not data:
+                    tail = decompressor.flush()
+                    if tail:
+                        yield tail
+                    return
+            out = decompressor.decompress(data, read_size)
+            data = decompressor.unconsumed_tail
+            if out:
+                yield out
+    else:  # lzma
+        while not decompressor.eof:
+            data = b""
+            if decompressor.needs_input:
+                data = f.read(read_size)
+                if not data:
+                    return
+            out = decompressor.decompress(data, read_size)
+            if out:
+                yield out
+
+def iter_binary_chunks(f, header, read_size=256 * 1024):
+    """레코드 영역을 스트리밍 해제/복원하여 (times, types, details, xs, ys) 열 청크를 생성
+
+    압축된 파일도 read_size 단위로 읽으면서 해제하므로 전체 해제를 기다리지 않고
+    앞부분부터 사용할 수 있다. 차이값 저장 파일은 절대값으로 복원해 돌려준다.
+    """
+    count = header["event_count"]
+    flags = header["flags"]
+    decompressor = _record_decompressor(flags)
+    delta = flags & MACRO_FLAG_DELTA
+    record_size = _BINARY_RECORD.size
+    remaining = count
+    pending = b""
+    last_time = last_x = last_y = 0
+    
+    for data in _iter_record_bytes(f, decompressor, read_size):
+        if not remaining:
+            break
+        if pending:
+            data = pending + data
+        
+        usable = min(len(data) // record_size, remaining) * record_size
+        pending = data[usable:]
+        if not usable:
+            continue
+        
+        times, types, details, xs, ys = zip(*_BINARY_RECORD.iter_unpack(memoryview(data)[:usable]))
+        if delta:
+            times = array('q', itertools.accumulate(times, initial=last_time))[1:]
+            xs = array('i', itertools.accumulate(xs, initial=last_x))[1:]
+            ys = array('i', itertools.accumulate(ys, initial=last_y))[1:]
+            last_time, last_x, last_y = times[-1], xs[-1], ys[-1]
+        else:
+            times, xs, ys = array('q', times), array('i', xs), array('i', ys)
+        remaining -= usable // record_size
+        yield times, array('B', types), array('I', details), xs, ys
+    
+    if remaining:
+        raise ValueError(f"바이너리 매크로 이벤트가 잘림: {count - remaining}/{count}")
+
+def _stream_from_binary_header(header):
+    """바이너리 헤더의 테이블로 빈 EventStream 생성 (테이블 항목은 헤더에서 제거)"""
+    stream = EventStream()
+    stream.type_names = header.pop("type_names")
+    stream._type_codes = {name: code for code, name in enumerate(stream.type_names)}
+    stream.strings = header.pop("strings")
+    stream._string_index = {value: index for index, value in enumerate(stream.strings) if index}
+    stream.extras = {int(index): event for index, event in header.pop("extras", {}).items()}
+    stream.time_sorted = bool(header["flags"] & MACRO_FLAG_SORTED)
+    return stream
+
+def read_macro_binary(file_path):
+    """바이너리 매크로 파일을 (헤더 dict, EventStream)으로 읽기 (이벤트별 dict 생성 없음)"""
+    f, header = _open_macro_binary(file_path)
+    with f:
+        stream = _stream_from_binary_header(header)
+        for times, types, details, xs, ys in iter_binary_chunks(f, header):
+            stream.times.extend(times)
+            stream.types.extend(types)
+            stream.details.extend(details)
+            stream.xs.extend(xs)
+            stream.ys.extend(ys)
+    return header, stream
+
+def read_macro_header(file_path):
+    """이벤트를 읽지 않고 매크로 헤더만 읽기 (바이너리는 이벤트 수/길이/플래그 포함)"""
+    if macro_file_format(file_path) == MACRO_FORMAT_BINARY:
+        f, header = _open_macro_binary(file_path)
+        f.close()
+        for key in ("type_names", "strings", "extras"):
+            header.pop(key, None)
+        return header
+    
+    header = _read_json_header_prefix(file_path)
+    if header is not None:
+        return header
+    with open(file_path, "r", encoding="utf-8") as f:
+        macro_data = json.load(f)
+    macro_data.pop("events", None)
+    return macro_data
+
+def _read_json_header_prefix(file_path):
+    """write_macro 형식 JSON에서 events 앞의 헤더 줄만 읽기 (다른 형식이면 None)
+
+    write_macro는 헤더 필드(요약 포함)를 모두 events 앞에 쓴다. 요약이 없는 이전 파일은
+    events 뒤에도 헤더 필드가 있을 수 있으므로 부분 헤더 대신 None을 반환한다.
+    """
+    header = {}
+    with open(file_path, "r", encoding="utf-8") as f:
+        if f.readline().strip() != "{":
+            return None
+        for line in f:
+            text = line.strip()
+            if text.startswith('"events"') or text == "}":
+                return header if "summary" in header else None
+            try:
+                header.update(json.loads("{" + text.rstrip(",") + "}"))
+            except ValueError:
+                return None
+    return None
+
+def load_macro_stream(file_path):
+    """매크로 파일(바이너리/JSON)을 (헤더 dict, EventStream)으로 읽기"""
+    if macro_file_format(file_path) == MACRO_FORMAT_BINARY:
+        return read_macro_binary(file_path)
+    
+    with open(file_path, "r", encoding="utf-8") as f:
+        macro_data = json.load(f)
+    stream = EventStream.from_macro_data(macro_data)
+    macro_data.pop("events", None)
+    if macro_data.get("time_unit") != TIME_UNIT:
+        # 초 단위 구버전 파일은 읽으면서 마이크로초로 변환됨
+        macro_data["time_unit"] = TIME_UNIT
+    return macro_data, stream
+
+def write_macro(file_path, header, events, binary_options=None):
+    """확장자에 맞는 형식으로 매크로 파일 기록 - 기록된 이벤트 수 반환
+
+    events는 EventStream 또는 이벤트 dict 이터러블 (시간 단위는 header의 time_unit 기준).
+    헤더에는 요약 정보(summarize_event_stream)가 함께 기록된다.
+    binary_options는 바이너리 형식일 때 write_macro_binary에 넘길 압축 설정
+    (codec, level, delta, min_compress_bytes).
+    """
+    if not isinstance(events, EventStream):
+        events = EventStream.from_dicts(events, header.get("time_unit") != TIME_UNIT)
+    header = dict(header)
+    header.pop("events", None)
+    header["summary"] = summarize_event_stream(events)
+    
+    if macro_file_format(file_path) == MACRO_FORMAT_BINARY:
+        return write_macro_binary(file_path, header, events, **(binary_options or {}))
+    
+    stream = events
+    header["time_unit"] = TIME_UNIT
+    return write_macro_file(file_path, header, (stream.to_dict(i) for i in range(len(stream))))
+
+def convert_macro_file(source_path, target_path, binary_options=None):
+    """매크로 파일 형식 변환 (바이너리 <-> JSON, 대상 확장자 기준) - 변환된 이벤트 수 반환"""
+    if macro_file_format(target_path) is None:
+        raise ValueError(f"지원하지 않는 매크로 확장자: {target_path}")
+    header, stream = load_macro_stream(source_path)
+    for key in ("format_version", "flags", "event_count", "duration_us", "summary"):
+        header.pop(key, None)
+    return write_macro(target_path, header, stream, binary_options)
+
+def read_macro_summary(file_path):
+    """매크로 요약 정보 - 헤더에 저장된 요약을 이벤트 디코딩 없이 읽음
+
+    요약이 없는 이전 파일만 이벤트를 읽어 계산한다.
+    """
+    summary = read_macro_header(file_path).get("summary")
+    if summary is None:
+        _, stream = load_macro_stream(file_path)
+        summary = summarize_event_stream(stream)
+    return summary
+
+def format_duration(duration_us):
+    """마이크로초 길이를 GUI 표시용 문자열로 (예: 1:05.3, 1:02:03)"""
+    seconds = duration_us / TIME_UNITS_PER_SECOND
+    if seconds >= 3600:
+        return f"{int(seconds // 3600)}:{int(seconds % 3600 // 60):02d}:{int(seconds % 60):02d}"
+    return f"{int(seconds // 60)}:{seconds % 60:04.1f}"
+
+class MacroCatalog:
+    """매크로 디렉토리의 영구 색인 (SQLite, 파일 이름 기준)
+
+    파일 크기/수정 시각/형식과 헤더의 요약 정보(이벤트 수/길이/종류별 개수 등)를 저장해 두고, 디렉토리와의 차이는
+    stat 결과만 비교해 바뀐 파일만 다시 읽는다. 여러 스레드에서 사용할 수 있다.
+    """
+
+    def __init__(self, db_path, macros_dir, log=None):
+        self.db_path = db_path
+        self.macros_dir = macros_dir
+        self.log = log or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS macros (
+                file TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                format TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                created REAL NOT NULL,
+                event_count INTEGER NOT NULL,
+                duration_us INTEGER NOT NULL,
+                summary TEXT
+            )""")
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(macros)")}
+        if "summary" not in columns:
+            # 이전 버전 색인 - 요약 열을 추가하고 해당 행은 다음 동기화 때 다시 읽음
+            self._db.execute("ALTER TABLE macros ADD COLUMN summary TEXT")
+        self._db.commit()
+
+    def _row_values(self, file, stat):
+        path = os.path.join(self.macros_dir, file)
+        summary = read_macro_summary(path)
+        return (file, os.path.splitext(file)[0], macro_file_format(file), stat.st_size,
+                stat.st_mtime_ns, stat.st_ctime, summary["event_count"], summary["duration_us"],
+                json.dumps(summary, ensure_ascii=False))
+
+    def reconcile(self):
+        """디렉토리와 색인 동기화 - (추가, 변경, 삭제) 파일 이름 목록 반환
+
+        크기/수정 시각이 같은 파일은 열지 않는다.
+        """
+        on_disk = {}
+        with os.scandir(self.macros_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and macro_file_format(entry.name) is not None:
+                    on_disk[entry.name] = entry.stat()
+        
+        with self._lock:
+            known = {file: (size, mtime_ns) if has_summary else None for file, size, mtime_ns, has_summary in
+                     self._db.execute("SELECT file, size, mtime_ns, summary IS NOT NULL FROM macros")}
+        
+        added, updated = [], []
+        rows = []
+        for file, stat in on_disk.items():
+            previous = known.get(file)
+            if previous == (stat.st_size, stat.st_mtime_ns):
+                continue
+            try:
+                rows.append(self._row_values(file, stat))
+                (added if file not in known else updated).append(file)
+            except Exception as e:
+                self.log.error(f"매크로 색인 오류 ({file}): {str(e)}")
+        removed = [file for file in known if file not in on_disk]
+        
+        with self._lock:
+            self._db.executemany("INSERT OR REPLACE INTO macros VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.executemany("DELETE FROM macros WHERE file = ?", [(file,) for file in removed])
+            self._db.commit()
+        
+        if added or updated or removed:
+            self.log.info(f"매크로 색인 동기화: 추가 {len(added)}, 변경 {len(updated)}, 삭제 {len(removed)}")
+        return added, updated, removed
+
+    def upsert(self, file):
+        """파일 하나를 색인에 추가/갱신 - 파일이 없으면 제거하고 False 반환"""
+        try:
+            stat = os.stat(os.path.join(self.macros_dir, file))
+        except FileNotFoundError:
+            self.remove(file)
+            return False
+        values = self._row_values(file, stat)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO macros VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            self._db.commit()
+        return True
+
+    def refresh(self, file):
+        """파일 하나를 stat 비교로 색인에 반영 - "added"/"updated"/"removed" (변경 없으면 None)"""
+        existing = self.get(file)
+        try:
+            stat = os.stat(os.path.join(self.macros_dir, file))
+        except FileNotFoundError:
+            if existing is None:
+                return None
+            self.remove(file)
+            return "removed"
+        
+        if (existing is not None and existing["summary"] is not None
+                and (existing["size"], existing["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns)):
+            return None
+        values = self._row_values(file, stat)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO macros VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values)
+            self._db.commit()
+        return "added" if existing is None else "updated"
+
+    def remove(self, file):
+        with self._lock:
+            self._db.execute("DELETE FROM macros WHERE file = ?", (file,))
+            self._db.commit()
+
+    def _entry(self, row):
+        file, name, macro_format, size, mtime_ns, created, event_count, duration_us, summary = row
+        return {
+            "name": name,
+            "file": file,
+            "format": macro_format,
+            "path": os.path.join(self.macros_dir, file),
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "created": datetime.datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S"),
+            "event_count": event_count,
+            "duration_us": duration_us,
+            "summary": json.loads(summary) if summary else None,
+        }
+
+    def get(self, file):
+        """파일 이름의 색인 항목 (없으면 None)"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM macros WHERE file = ?", (file,)).fetchone()
+        return self._entry(row) if row else None
+
+    def entry_for_name(self, name):
+        """매크로 이름의 색인 항목 (같은 이름이면 바이너리 우선, 없으면 None)"""
+        with self._lock:
+            row = self._db.execute("SELECT * FROM macros WHERE name = ? ORDER BY format = 'json' LIMIT 1",
+                                   (name,)).fetchone()
+        return self._entry(row) if row else None
+
+    def entries(self):
+        """매크로 목록 (이름순, 같은 이름이면 바이너리 우선)"""
+        with self._lock:
+            rows = self._db.execute("SELECT * FROM macros ORDER BY name, format = 'json'").fetchall()
+        result = []
+        names = set()
+        for row in rows:
+            if row[1] in names:
+                continue
+            names.add(row[1])
+            result.append(self._entry(row))
+        return result
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+# ReadDirectoryChangesW 알림 종류 (파일 이름/크기/수정 시각 변경)
+FILE_LIST_DIRECTORY = 0x0001
+FILE_NOTIFY_CHANGE_FILE_NAME = 0x0001
+FILE_NOTIFY_CHANGE_SIZE = 0x0008
+FILE_NOTIFY_CHANGE_LAST_WRITE = 0x0010
+
+class MacroDirectoryWatcher:
+    """매크로 디렉토리 감시 - 파일 추가/변경/삭제를 색인에 반영하고 변경분을 알림
+
+    Windows에서는 ReadDirectoryChangesW 알림으로 바뀐 파일만 다시 읽고, 사용할 수 없으면
+    poll_interval마다 stat 비교(MacroCatalog.reconcile)로 대체한다.
+    on_change(added, updated, removed)는 파일 이름 목록으로 감시 스레드에서 호출된다.
+    """
+
+    def __init__(self, catalog, on_change, log=None, poll_interval=2.0, settle_delay=0.2):
+        self.catalog = catalog
+        self.on_change = on_change
+        self.log = log or logging.getLogger(__name__)
+        self.poll_interval = poll_interval
+        self.settle_delay = settle_delay  # 연속 알림을 모아 처리할 대기 시간 (쓰기 중인 파일 대비)
+        self.method = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="macro-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        if win32file is not None and win32event is not None:
+            try:
+                self.method = "native"
+                self.log.info(f"매크로 디렉토리 감시 시작 (ReadDirectoryChangesW): {self.catalog.macros_dir}")
+                self._watch_native()
+                return
+            except Exception as e:
+                self.log.warning(f"디렉토리 변경 알림 사용 불가 - 주기적 검사로 대체: {str(e)}")
+        
+        self.method = "polling"
+        self.log.info(f"매크로 디렉토리 감시 시작 ({self.poll_interval}초 주기 검사): {self.catalog.macros_dir}")
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                added, updated, removed = self.catalog.reconcile()
+                if added or updated or removed:
+                    self._notify(added, updated, removed)
+            except Exception as e:
+                self.log.error(f"매크로 디렉토리 검사 오류: {str(e)}")
+
+    def _watch_native(self):
+        import pywintypes
+        handle = win32file.CreateFile(
+            self.catalog.macros_dir, FILE_LIST_DIRECTORY,
+            win32file.FILE_SHARE_READ | win32file.FILE_SHARE_WRITE | win32file.FILE_SHARE_DELETE,
+            None, win32file.OPEN_EXISTING,
+            win32file.FILE_FLAG_BACKUP_SEMANTICS | win32file.FILE_FLAG_OVERLAPPED, None)
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        buffer = win32file.AllocateReadBuffer(64 * 1024)
+        flags = FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_SIZE | FILE_NOTIFY_CHANGE_LAST_WRITE
+        changed = set()
+        try:
+            # 감시 시작 전 변경분 반영
+            added, updated, removed = self.catalog.reconcile()
+            if added or updated or removed:
+                self._notify(added, updated, removed)
+            
+            while not self._stop_event.is_set():
+                win32file.ReadDirectoryChangesW(handle, buffer, False, flags, overlapped)
+                while not self._stop_event.is_set():
+                    # 알림이 이어지는 동안은 모으고, settle_delay 동안 조용하면 처리
+                    timeout = int(self.settle_delay * 1000) if changed else 500
+                    if win32event.WaitForSingleObject(overlapped.hEvent, timeout) == win32event.WAIT_OBJECT_0:
+                        break
+                    if changed:
+                        self._apply(changed)
+                        changed = set()
+                else:
+                    break
+                
+                size = win32file.GetOverlappedResult(handle, overlapped, True)
+                if not size:
+                    # 버퍼 초과 - 어떤 파일이 바뀌었는지 모르므로 stat 비교로 동기화
+                    added, updated, removed = self.catalog.reconcile()
+                    if added or updated or removed:
+                        self._notify(added, updated, removed)
+                    continue
+                for _action, file in win32file.FILE_NOTIFY_INFORMATION(buffer, size):
+                    if macro_file_format(file) is not None:
+                        changed.add(file)
+        finally:
+            win32file.CancelIo(handle)
+            win32file.CloseHandle(handle)
+
+    def _apply(self, files):
+        """알림받은 파일만 색인에 반영"""
+        deltas = {"added": [], "updated": [], "removed": []}
+        for file in files:
+            try:
+                change = self.catalog.refresh(file)
+                if change is not None:
+                    deltas[change].append(file)
+            except Exception as e:
+                self.log.error(f"매크로 색인 갱신 오류 ({file}): {str(e)}")
+        if deltas["added"] or deltas["updated"] or deltas["removed"]:
+            self._notify(deltas["added"], deltas["updated"], deltas["removed"])
+
+    def _notify(self, added, updated, removed):
+        self.log.debug(f"매크로 디렉토리 변경: 추가 {added}, 변경 {updated}, 삭제 {removed}")
+        try:
+            self.on_change(added, updated, removed)
+        except Exception as e:
+            self.log.exception(f"매크로 변경 처리 오류: {str(e)}")
+
+# 재생 타이밍 모드
+TIMING_STRICT = "strict"            # sleep 후 짧은 spin으로 마감시각을 정확히 맞춤
+TIMING_BEST_EFFORT = "best_effort"  # sleep만 사용 (CPU 사용 최소)
+TIMING_FAST = "fast"                # 대기 없이 최대한 빠르게 실행
+TIMING_MODES = (TIMING_STRICT, TIMING_BEST_EFFORT, TIMING_FAST)
+
+class PlaybackCancelled(Exception):
+    """재생 취소 요청으로 대기가 중단됨"""
+    pass
+
+class PlaybackController:
+    """재생 실행 제어 (시작/일시정지/재개/취소)
+
+    상태 변경은 Condition으로 알리므로 재생 스레드의 긴 대기도 취소/일시정지 요청 즉시
+    깨어난다. GUI(Tk) 호출 없이 어느 스레드에서나 사용할 수 있다.
+    """
+
+    def __init__(self, log=None):
+        self.log = log or logging.getLogger(__name__)
+        self._cond = threading.Condition()
+        self._paused = False
+        self._cancelled = False
+        self.thread = None
+        self.name = ""
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, target, *args, name=""):
+        """재생 스레드 시작 - target(*args, controller=self) 실행. 이미 실행 중이면 False"""
+        with self._cond:
+            if self.is_running():
+                return False
+            self._paused = False
+            self._cancelled = False
+            self.name = name
+            self.thread = threading.Thread(target=target, args=args, kwargs={"controller": self}, daemon=True)
+            self.thread.start()
+        return True
+
+    def pause(self):
+        with self._cond:
+            if not self._paused and not self._cancelled:
+                self._paused = True
+                self.log.info(f"재생 일시정지: {self.name}")
+                self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            if self._paused:
+                self._paused = False
+                self.log.info(f"재생 재개: {self.name}")
+                self._cond.notify_all()
+
+    def cancel(self):
+        with self._cond:
+            if not self._cancelled:
+                self._cancelled = True
+                self.log.info(f"재생 취소 요청: {self.name}")
+                self._cond.notify_all()
+
+    def join(self, timeout=None):
+        thread = self.thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def checkpoint(self):
+        """일시정지 중이면 재개될 때까지 대기 - 일시정지로 지난 시간(나노초) 반환
+
+        취소되었으면 PlaybackCancelled 발생
+        """
+        with self._cond:
+            paused_ns = 0
+            while self._paused and not self._cancelled:
+                started = time.perf_counter_ns()
+                self._cond.wait()
+                paused_ns += time.perf_counter_ns() - started
+            if self._cancelled:
+                raise PlaybackCancelled()
+            return paused_ns
+
+    def sleep(self, seconds):
+        """상태 변경(취소/일시정지) 시 즉시 깨어나는 대기"""
+        with self._cond:
+            if not self._cancelled and not self._paused:
+                self._cond.wait(seconds)
+
+class PlaybackTimer:
+    """재생 시작 시각 기준 절대 마감시각으로 이벤트를 실행하는 타이머
+
+    각 이벤트의 마감시각은 '재생 시작 + 이벤트 오프셋'이므로 입력 주입에 걸린
+    시간이 다음 대기에서 자연히 차감되어 오차가 누적되지 않는다.
+    controller가 있으면 대기 중 취소/일시정지에 즉시 반응하고, 일시정지한 시간만큼
+    이후 마감시각을 미룬다.
+    """
+
+    def __init__(self, mode=TIMING_STRICT, spin_ns=2_000_000, controller=None):
+        self.mode = mode if mode in TIMING_MODES else TIMING_STRICT
+        self.spin_ns = spin_ns  # strict 모드에서 마감 직전 busy-wait 구간
+        self.controller = controller
+        self.origin_ns = 0
+        self._timer_period_set = False
+        
+        # 마감시각 대비 지연 통계 (나노초)
+        self.wait_count = 0
+        self.total_lateness_ns = 0
+        self.max_lateness_ns = 0
+        self.last_lateness_ns = 0
+
+    def start(self, origin_us=0):
+        """재생 시작 - origin_us 오프셋의 이벤트가 지금 실행되도록 기준 설정"""
+        if self.mode != TIMING_FAST:
+            try:
+                # Windows 타이머 해상도를 1ms로 (sleep 정밀도 향상)
+                ctypes.windll.winmm.timeBeginPeriod(1)
+                self._timer_period_set = True
+            except Exception:
+                pass
+        self.origin_ns = time.perf_counter_ns() - origin_us * 1000
+
+    def stop(self):
+        """재생 종료 - 타이머 해상도 복원"""
+        if self._timer_period_set:
+            try:
+                ctypes.windll.winmm.timeEndPeriod(1)
+            except Exception:
+                pass
+            self._timer_period_set = False
+
+    def wait_until(self, offset_us):
+        """이벤트 오프셋(마이크로초)의 마감시각까지 대기 - 지연(나노초) 반환"""
+        controller = self.controller
+        if self.mode == TIMING_FAST:
+            if controller is not None:
+                self.origin_ns += controller.checkpoint()
+            return 0
+        
+        spin_ns = self.spin_ns if self.mode == TIMING_STRICT else 0
+        while True:
+            if controller is not None:
+                self.origin_ns += controller.checkpoint()
+            deadline = self.origin_ns + offset_us * 1000
+            remaining = deadline - time.perf_counter_ns()
+            if remaining <= spin_ns:
+                break
+            if controller is not None:
+                controller.sleep((remaining - spin_ns) / 1e9)
+            else:
+                time.sleep((remaining - spin_ns) / 1e9)
+        
+        if spin_ns:
+            while time.perf_counter_ns() < deadline:
+                if controller is not None and controller.cancelled:
+                    raise PlaybackCancelled()
+                time.sleep(0)
+        
+        lateness = time.perf_counter_ns() - deadline
+        self.last_lateness_ns = lateness
+        self.wait_count += 1
+        self.total_lateness_ns += lateness
+        if lateness > self.max_lateness_ns:
+            self.max_lateness_ns = lateness
+        return lateness
+
+    def stats(self):
+        """마감시각 대비 지연 통계 (밀리초)"""
+        average = self.total_lateness_ns / self.wait_count if self.wait_count else 0
+        return {
+            "mode": self.mode,
+            "waits": self.wait_count,
+            "avg_lateness_ms": round(average / 1e6, 3),
+            "max_lateness_ms": round(self.max_lateness_ns / 1e6, 3),
+        }
+
+# 특수 키 이름 -> 가상 키코드 (Win32 VK_* 값)
+SPECIAL_VIRTUAL_KEYS = {
+    'shift': 0x10,       # VK_SHIFT
+    'ctrl': 0x11,        # VK_CONTROL
+    'alt': 0x12,         # VK_MENU
+    'hangul': 0x15,
+    'han_yeong': 0x15,
+    'hanyeong': 0x15,
+    'ralt': 0x15,
+    'rctrl': 0xA3,       # VK_RCONTROL
+    'rshift': 0xA1,      # VK_RSHIFT
+    'lalt': 0xA4,        # VK_LMENU
+    'lctrl': 0xA2,       # VK_LCONTROL
+    'lshift': 0xA0,      # VK_LSHIFT
+    'capslock': 0x14,    # VK_CAPITAL
+    'esc': 0x1B,         # VK_ESCAPE
+    'escape': 0x1B,
+    'space': 0x20,       # VK_SPACE
+    'tab': 0x09,         # VK_TAB
+    'enter': 0x0D,       # VK_RETURN
+    'backspace': 0x08,   # VK_BACK
+    'delete': 0x2E,      # VK_DELETE
+    'insert': 0x2D,      # VK_INSERT
+    'home': 0x24,        # VK_HOME
+    'end': 0x23,         # VK_END
+    'pageup': 0x21,      # VK_PRIOR
+    'pagedown': 0x22,    # VK_NEXT
+    'page_up': 0x21,
+    'page_down': 0x22,
+    'up': 0x26,          # VK_UP
+    'down': 0x28,        # VK_DOWN
+    'left': 0x25,        # VK_LEFT
+    'right': 0x27,       # VK_RIGHT
+}
+VK_F1 = 0x70
+
+@lru_cache(maxsize=1024)
+def resolve_virtual_keycode(key):
+    """키 이름에서 가상 키코드 가져오기 (결과 캐시)"""
+    if key in SPECIAL_VIRTUAL_KEYS:
+        return SPECIAL_VIRTUAL_KEYS[key]
+    
+    if len(key) == 1:
+        if win32api is not None:
+            return win32api.VkKeyScan(key) & 0xff
+        # Windows가 아니면 영문자/숫자만 가상 키코드와 동일하게 해석
+        if key.isascii() and key.isalnum():
+            return ord(key.upper())
+        return None
+    
+    if key.startswith('f') and len(key) <= 3:
+        try:
+            num = int(key[1:])
+            if 1 <= num <= 12:
+                return VK_F1 + (num - 1)
+        except:
+            pass
+    
+    return None
+
+# 마우스 버튼 이름 -> (누름, 뗌) mouse_event 플래그 (Win32 MOUSEEVENTF_* 값)
+MOUSE_BUTTON_NAMES = ('left', 'right', 'middle')
+MOUSE_BUTTON_FLAGS = {
+    'left': (0x0002, 0x0004),
+    'right': (0x0008, 0x0010),
+    'middle': (0x0020, 0x0040),
+}
+
+# 재생 계획 명령 코드
+OP_MOVE, OP_MOUSE_DOWN, OP_MOUSE_UP, OP_KEY_DOWN, OP_KEY_UP = range(5)
+
+class PlaybackOptions:
+    """실행마다 지정하는 재생 옵션 (스케줄 항목에는 dict로 저장)
+
+    speed: 재생 속도 배율, max_gap_ms: 이벤트 간 최대 대기 (0/None이면 제한 없음),
+    fast_moves: 클릭 직전을 제외한 마우스 이동 대기 생략
+    """
+
+    def __init__(self, speed=1.0, max_gap_ms=None, fast_moves=False):
+        self.speed = float(speed) if speed else 1.0
+        self.max_gap_ms = int(max_gap_ms) if max_gap_ms else None
+        self.fast_moves = bool(fast_moves)
+
+    def is_default(self):
+        return self.speed == 1.0 and not self.max_gap_ms and not self.fast_moves
+
+    def key(self):
+        """캐시 키"""
+        return (self.speed, self.max_gap_ms, self.fast_moves)
+
+    def to_dict(self):
+        return {"speed": self.speed, "max_gap_ms": self.max_gap_ms, "fast_moves": self.fast_moves}
+
+    @classmethod
+    def from_dict(cls, data):
+        if not data:
+            return cls()
+        return cls(data.get("speed", 1.0), data.get("max_gap_ms"), data.get("fast_moves", False))
+
+    def describe(self):
+        """목록 표시용 요약"""
+        if self.is_default():
+            return "기본"
+        parts = []
+        if self.speed != 1.0:
+            parts.append(f"x{self.speed:g}")
+        if self.max_gap_ms:
+            parts.append(f"간격≤{self.max_gap_ms}ms")
+        if self.fast_moves:
+            parts.append("이동 대기 생략")
+        return ", ".join(parts)
+
+class MacroPlan:
+    """재생용으로 미리 컴파일된 매크로
+
+    정렬된 이벤트를 명령/마감시각/좌표/코드 열로 펼친 평면 배열이다.
+    키 이벤트의 code는 가상 키코드, 마우스 버튼 이벤트의 code는 mouse_event 플래그,
+    button은 MOUSE_BUTTON_NAMES 인덱스다. 마감시각은 첫 이벤트 기준 마이크로초.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.ops = array('B')
+        self.deadlines = array('q')
+        self.xs = array('i')
+        self.ys = array('i')
+        self.codes = array('I')
+        self.buttons = array('B')
+        self.event_count = 0  # 원본 이벤트 수 (해석할 수 없는 이벤트 포함)
+        self.skipped_count = 0
+
+    def __len__(self):
+        return len(self.ops)
+
+    @property
+    def duration_us(self):
+        return self.deadlines[-1] if self.deadlines else 0
+
+    def retimed(self, options, state=None, next_op=None):
+        """재생 옵션(속도/최대 간격/이동 대기 생략)을 적용한 마감시각의 계획 반환
+
+        명령/좌표/코드 열은 공유하고 마감시각 열만 새로 계산한다.
+        청크 단위로 재계산할 때는 state([누적 시간, 직전 원래 마감시각])를 이어서 넘기고,
+        next_op에 다음 청크의 첫 명령을 넘긴다.
+        """
+        if options is None or options.is_default():
+            return self
+        
+        plan = MacroPlan(self.name)
+        plan.ops, plan.xs, plan.ys, plan.codes, plan.buttons = (
+            self.ops, self.xs, self.ys, self.codes, self.buttons)
+        plan.event_count = self.event_count
+        plan.skipped_count = self.skipped_count
+        
+        ops = self.ops
+        deadlines = self.deadlines
+        count = len(deadlines)
+        speed = options.speed if options.speed > 0 else 1.0
+        max_gap = options.max_gap_ms * 1000 if options.max_gap_ms else None
+        
+        if state is None:
+            state = [0.0, deadlines[0] if count else 0]
+        elapsed, previous = state
+        new_deadlines = plan.deadlines
+        for i in range(count):
+            gap = deadlines[i] - previous
+            previous = deadlines[i]
+            
+            # 이동 대기 생략: 클릭 직전 이동을 제외한 이동 명령은 즉시 실행
+            following = ops[i + 1] if i + 1 < count else next_op
+            if options.fast_moves and ops[i] == OP_MOVE and not (
+                    following == OP_MOUSE_DOWN or following == OP_MOUSE_UP):
+                gap = 0
+            if max_gap is not None and gap > max_gap:
+                gap = max_gap
+            
+            elapsed += gap / speed
+            new_deadlines.append(int(elapsed))
+        
+        state[0], state[1] = elapsed, previous
+        return plan
+
+    def window_end(self, start, window_us, max_count):
+        """start부터 마감시각이 window_us 이내인 연속 명령 구간의 끝 인덱스"""
+        deadlines = self.deadlines
+        limit = min(len(deadlines), start + max_count)
+        window_end = deadlines[start] + window_us
+        end = start + 1
+        while end < limit and deadlines[end] <= window_end:
+            end += 1
+        return end
+
+    @classmethod
+    def compile(cls, stream, name="", origin=None):
+        """EventStream을 재생 계획으로 컴파일
+
+        origin은 마감시각 0에 해당하는 이벤트 시간 (생략 시 첫 이벤트 - 청크 컴파일용)
+        """
+        plan = cls(name)
+        stream = stream.sorted_by_time()
+        plan.event_count = len(stream)
+        if not stream:
+            return plan
+        
+        # 문자열 테이블 항목별로 한 번만 키코드/버튼 해석
+        keycodes = [None if text is None else resolve_virtual_keycode(text.lower())
+                    for text in stream.strings]
+        buttons = [MOUSE_BUTTON_NAMES.index(text) if text in MOUSE_BUTTON_FLAGS else None
+                   for text in stream.strings]
+        type_ops = {code: op for code, op in (
+            (EV_MOUSE_MOVE, OP_MOVE), (EV_MOUSE_DOWN, OP_MOUSE_DOWN), (EV_MOUSE_UP, OP_MOUSE_UP),
+            (EV_KEY_DOWN, OP_KEY_DOWN), (EV_KEY_UP, OP_KEY_UP))}
+        
+        if origin is None:
+            origin = stream.times[0]
+        ops, deadlines, xs, ys, codes, plan_buttons = (
+            plan.ops, plan.deadlines, plan.xs, plan.ys, plan.codes, plan.buttons)
+        
+        for type_code, event_time, x, y, detail in zip(
+                stream.types, stream.times, stream.xs, stream.ys, stream.details):
+            op = type_ops.get(type_code)
+            code = 0
+            button = 0
+            
+            if op == OP_MOUSE_DOWN or op == OP_MOUSE_UP:
+                button = buttons[detail]
+                if button is None:
+                    op = None
+                else:
+                    code = MOUSE_BUTTON_FLAGS[MOUSE_BUTTON_NAMES[button]][op == OP_MOUSE_UP]
+            elif op == OP_KEY_DOWN or op == OP_KEY_UP:
+                code = keycodes[detail]
+                if code is None:
+                    op = None
+            
+            if op is None:
+                plan.skipped_count += 1
+                continue
+            
+            ops.append(op)
+            deadlines.append(event_time - origin)
+            xs.append(x)
+            ys.append(y)
+            codes.append(code)
+            plan_buttons.append(button)
+        
+        return plan
+
+def load_macro_plan(macro_path):
+    """매크로 파일(바이너리/JSON)을 읽어 재생 계획으로 컴파일"""
+    header, stream = load_macro_stream(macro_path)
+    return MacroPlan.compile(stream, header.get("name", ""))
+
+class MacroEventReader:
+    """mmap 기반 바이너리 매크로 지연 읽기
+
+    레코드 영역을 메모리 맵으로 열고 청크 단위로 해제/복원한 EventStream을 필요할 때마다
+    만들어 준다. 동시에 메모리에 있는 이벤트는 한 청크뿐이므로 매크로 길이와 무관하다.
+    """
+
+    def __init__(self, file_path, chunk_events=8192):
+        if macro_file_format(file_path) != MACRO_FORMAT_BINARY:
+            raise ValueError(f"지연 읽기는 바이너리 매크로만 지원: {file_path}")
+        self.file_path = file_path
+        self.chunk_events = chunk_events
+        self._file, self.header = _open_macro_binary(file_path)
+        self._records_offset = self._file.tell()
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        # 청크가 공유하는 종류/문자열 테이블 (비표준 이벤트는 전체 인덱스 기준)
+        self._tables = _stream_from_binary_header(self.header)
+
+    @property
+    def event_count(self):
+        return self.header["event_count"]
+
+    @property
+    def time_sorted(self):
+        return bool(self.header["flags"] & MACRO_FLAG_SORTED)
+
+    def chunks(self):
+        """레코드를 chunk_events개 안팎의 EventStream 청크로 순서대로 생성"""
+        tables = self._tables
+        self._map.seek(self._records_offset)
+        base = 0
+        for times, types, details, xs, ys in iter_binary_chunks(
+                self._map, self.header, self.chunk_events * _BINARY_RECORD.size):
+            chunk = EventStream()
+            chunk.type_names, chunk._type_codes = tables.type_names, tables._type_codes
+            chunk.strings, chunk._string_index = tables.strings, tables._string_index
+            chunk.times, chunk.types, chunk.details, chunk.xs, chunk.ys = times, types, details, xs, ys
+            if tables.extras:
+                chunk.extras = {index - base: event for index, event in tables.extras.items()
+                                if base <= index < base + len(times)}
+            chunk.time_sorted = tables.time_sorted
+            base += len(times)
+            yield chunk
+
+    def plan_chunks(self, options=None):
+        """재생 계획 청크 생성 (마감시각은 첫 이벤트 기준, 재생 옵션 적용)
+
+        이동 대기 생략 옵션이 청크 경계를 넘어 다음 명령을 볼 수 있도록 한 청크 앞서 컴파일한다.
+        """
+        if not self.time_sorted:
+            raise ValueError(f"시간순 정렬되지 않은 매크로는 지연 재생할 수 없음: {self.file_path}")
+        
+        name = self.header.get("name", "")
+        origin = None
+        state = [0.0, 0]
+        pending = None
+        for chunk in self.chunks():
+            if origin is None and len(chunk):
+                origin = chunk.times[0]
+            plan = MacroPlan.compile(chunk, name, origin)
+            if not len(plan):
+                continue
+            if pending is not None:
+                yield pending.retimed(options, state, plan.ops[0])
+            pending = plan
+        if pending is not None:
+            yield pending.retimed(options, state, None)
+
+    def close(self):
+        try:
+            self._map.close()
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class MacroPlanCache:
+    """컴파일된 재생 계획 LRU 캐시 (파일 경로 + 수정 시각/크기 기준)
+
+    재생 옵션이 적용된 계획은 원본 계획 항목 아래에 옵션 키별로 함께 보관한다.
+    max_events보다 큰 계획은 캐시하지 않는다 (매우 긴 매크로가 메모리에 남지 않도록).
+    """
+
+    def __init__(self, max_entries=16, max_events=500_000):
+        self.max_entries = max_entries
+        self.max_events = max_events
+        self._entries = OrderedDict()  # path -> (mtime_ns, size, plan, {옵션 키: 계획})
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, macro_path, options=None):
+        """캐시된 계획 반환 (파일이 바뀌었거나 없으면 새로 컴파일)"""
+        stat = os.stat(macro_path)
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            entry = self._entries.get(macro_path)
+            if entry is not None and entry[:2] == key:
+                self._entries.move_to_end(macro_path)
+                self.hits += 1
+            else:
+                entry = None
+        
+        if entry is None:
+            plan = load_macro_plan(macro_path)
+            if plan.event_count > self.max_events:
+                with self._lock:
+                    self.misses += 1
+                return plan.retimed(options)
+            entry = (key[0], key[1], plan, {})
+            with self._lock:
+                self.misses += 1
+                self._entries[macro_path] = entry
+                self._entries.move_to_end(macro_path)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        
+        plan, variants = entry[2], entry[3]
+        if options is None or options.is_default():
+            return plan
+        
+        variant = variants.get(options.key())
+        if variant is None:
+            variant = plan.retimed(options)
+            with self._lock:
+                variants[options.key()] = variant
+        return variant
+
+    def invalidate(self, macro_path=None):
+        """캐시 항목 제거 (경로 생략 시 전체)"""
+        with self._lock:
+            if macro_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(macro_path, None)
+
+# SendInput 구조체 (모듈 로드 시 한 번만 정의)
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_VIRTUALDESK = 0x4000
+MOUSEEVENTF_ABSOLUTE = 0x8000
+KEYEVENTF_KEYUP = 0x0002
+SM_XVIRTUALSCREEN, SM_YVIRTUALSCREEN, SM_CXVIRTUALSCREEN, SM_CYVIRTUALSCREEN = 76, 77, 78, 79
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t)
+    ]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t)
+    ]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD)
+    ]
+
+class INPUT_UNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("union", INPUT_UNION)]
+
+class SendInputBatcher:
+    """재생 명령 구간을 SendInput 배열 하나로 묶어 주입
+
+    같은 시간 창에 몰린 연속 명령(수식키 조합 + 키, 이동 + 클릭 등)을 미리 할당된
+    INPUT 배열에 채워 한 번에 전송한다. 마우스 명령은 가상 데스크톱 절대 좌표
+    이동과 버튼 플래그를 한 INPUT에 담는다.
+    """
+
+    def __init__(self, max_batch=64):
+        self.max_batch = max_batch
+        self._inputs = (INPUT * max_batch)()
+        self._input_size = ctypes.sizeof(INPUT)
+        self._screen = (0, 0, 1, 1)
+        
+        # 배치 통계
+        self.batch_count = 0
+        self.requested_count = 0
+        self.injected_count = 0
+        self.largest_batch = 0
+
+    def refresh_screen_metrics(self):
+        """가상 데스크톱 영역 갱신 (재생 시작 시 호출)"""
+        metrics = ctypes.windll.user32.GetSystemMetrics
+        self._screen = (metrics(SM_XVIRTUALSCREEN), metrics(SM_YVIRTUALSCREEN),
+                        max(metrics(SM_CXVIRTUALSCREEN), 2), max(metrics(SM_CYVIRTUALSCREEN), 2))
+
+    def send(self, plan, start, end):
+        """plan[start:end]를 SendInput으로 주입 - 실제 주입된 명령 수 반환
+
+        max_batch개씩 나누어 보내며, 일부만 주입된 묶음이 있으면 거기서 멈춘다.
+        """
+        injected = 0
+        for chunk_start in range(start, end, self.max_batch):
+            chunk_end = min(chunk_start + self.max_batch, end)
+            sent = self._send_chunk(plan, chunk_start, chunk_end)
+            injected += sent
+            if sent < chunk_end - chunk_start:
+                break
+        return injected
+
+    def _send_chunk(self, plan, start, end):
+        left, top, width, height = self._screen
+        inputs = self._inputs
+        ops, xs, ys, codes = plan.ops, plan.xs, plan.ys, plan.codes
+        count = end - start
+        
+        for k in range(count):
+            i = start + k
+            op = ops[i]
+            item = inputs[k]
+            
+            if op == OP_KEY_DOWN or op == OP_KEY_UP:
+                item.type = INPUT_KEYBOARD
+                ki = item.union.ki
+                ki.wVk = codes[i]
+                ki.wScan = 0
+                ki.dwFlags = KEYEVENTF_KEYUP if op == OP_KEY_UP else 0
+                ki.time = 0
+                ki.dwExtraInfo = 0
+            else:
+                item.type = INPUT_MOUSE
+                mi = item.union.mi
+                mi.dx = (xs[i] - left) * 65535 // (width - 1)
+                mi.dy = (ys[i] - top) * 65535 // (height - 1)
+                mi.mouseData = 0
+                mi.dwFlags = (MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE | MOUSEEVENTF_VIRTUALDESK |
+                              (codes[i] if op != OP_MOVE else 0))
+                mi.time = 0
+                mi.dwExtraInfo = 0
+        
+        injected = ctypes.windll.user32.SendInput(count, inputs, self._input_size)
+        
+        self.batch_count += 1
+        self.requested_count += count
+        self.injected_count += injected
+        if count > self.largest_batch:
+            self.largest_batch = count
+        return injected
+
+    def stats(self):
+        """배치 주입 통계"""
+        return {
+            "batches": self.batch_count,
+            "requested": self.requested_count,
+            "injected": self.injected_count,
+            "largest_batch": self.largest_batch,
+        }
+
+class ClickEngine:
+    """세션 동안 성공한 클릭 방법을 기억하는 클릭 엔진
+
+    SetCursorPos + mouse_event, SendInput, PyAutoGUI 순으로 시도하되, 한 번 성공한
+    방법을 다음 클릭부터 가장 먼저 사용한다. 이동/누름 후 대기(settle)는 설정값이며
+    기본 0초이다. 방법별 시도/성공/실패 횟수와 지연 시간을 집계한다.
+    재생 중 클릭은 보통 SendInputBatcher 배치로 주입되므로, 이 엔진(과 통계)은 배치가
+    일부만 주입되었거나 배치를 쓸 수 없을 때의 대체 경로에서만 사용된다.
+    """
+
+    METHODS = ("mouse_event", "send_input", "pyautogui")
+
+    def __init__(self, log=None, move_settle=0.0, press_settle=0.0):
+        self.log = log or logging.getLogger(__name__)
+        self.move_settle = move_settle    # 커서 이동 후 대기 (초)
+        self.press_settle = press_settle  # 버튼 누름 후 대기 (초)
+        self.preferred = None
+        self._lock = threading.Lock()
+        self.counters = {method: {"attempts": 0, "successes": 0, "failures": 0, "total_ns": 0}
+                         for method in self.METHODS}
+        self._handlers = {
+            "mouse_event": self._click_mouse_event,
+            "send_input": self._click_send_input,
+            "pyautogui": self._click_pyautogui,
+        }
+
+    def click(self, x, y, button="left", action="click", flag=None):
+        """클릭 실행 - 성공 여부 반환"""
+        if button not in MOUSE_BUTTON_FLAGS:
+            self.log.warning(f"지원하지 않는 마우스 버튼: {button}")
+            return False
+        
+        preferred = self.preferred
+        order = self.METHODS if preferred is None else (preferred,) + tuple(
+            method for method in self.METHODS if method != preferred)
+        
+        for method in order:
+            start_ns = time.perf_counter_ns()
+            try:
+                success = self._handlers[method](x, y, button, action, flag)
+            except Exception as e:
+                self.log.error(f"{method} 클릭 실패: {str(e)}")
+                success = False
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            
+            with self._lock:
+                counter = self.counters[method]
+                counter["attempts"] += 1
+                counter["total_ns"] += elapsed_ns
+                counter["successes" if success else "failures"] += 1
+            
+            if success:
+                if method != self.preferred:
+                    self.log.info(f"클릭 방법 선택: {method}")
+                    self.preferred = method
+                return True
+            
+            if method == self.preferred:
+                self.preferred = None
+        
+        return False
+
+    def _settle(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def _click_mouse_event(self, x, y, button, action, flag):
+        """방법 1: SetCursorPos + mouse_event"""
+        down_flag, up_flag = MOUSE_BUTTON_FLAGS[button]
+        win32api.SetCursorPos((x, y))
+        self._settle(self.move_settle)
+        
+        if action in ["click", "down"]:
+            win32api.mouse_event(flag if action == "down" and flag is not None else down_flag, 0, 0, 0, 0)
+            self._settle(self.press_settle)
+        if action in ["click", "up"]:
+            win32api.mouse_event(flag if action == "up" and flag is not None else up_flag, 0, 0, 0, 0)
+        return True
+
+    def _click_send_input(self, x, y, button, action, flag):
+        """방법 2: SendInput (이동 + 버튼을 한 번에 전송)"""
+        # 화면 좌표를 정규화
+        screen_width = ctypes.windll.user32.GetSystemMetrics(0)
+        screen_height = ctypes.windll.user32.GetSystemMetrics(1)
+        normalized_x = int(65535 * (x / screen_width))
+        normalized_y = int(65535 * (y / screen_height))
+        
+        down_flag, up_flag = MOUSE_BUTTON_FLAGS[button]
+        flags = [MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE]
+        if action in ["click", "down"]:
+            flags.append(down_flag)
+        if action in ["click", "up"]:
+            flags.append(up_flag)
+        
+        inputs = (INPUT * len(flags))()
+        for item, event_flag in zip(inputs, flags):
+            item.type = INPUT_MOUSE
+            item.union.mi.dx = normalized_x
+            item.union.mi.dy = normalized_y
+            item.union.mi.dwFlags = event_flag
+        
+        result = ctypes.windll.user32.SendInput(len(flags), inputs, ctypes.sizeof(INPUT))
+        if result != len(flags):
+            self.log.warning(f"SendInput 클릭 실패: {x}, {y}, {button}")
+            return False
+        return True
+
+    def _click_pyautogui(self, x, y, button, action, flag):
+        """방법 3: PyAutoGUI (최후의 수단)"""
+        if pyautogui is None:
+            return False
+        pyautogui.FAILSAFE = False
+        if action == "click":
+            pyautogui.click(x=x, y=y, button=button)
+        elif action == "down":
+            pyautogui.mouseDown(x=x, y=y, button=button)
+        elif action == "up":
+            pyautogui.mouseUp(x=x, y=y, button=button)
+        return True
+
+    def stats(self):
+        """방법별 통계 (평균 지연 밀리초 포함)"""
+        with self._lock:
+            result = {"preferred": self.preferred}
+            for method, counter in self.counters.items():
+                attempts = counter["attempts"]
+                result[method] = {
+                    "attempts": attempts,
+                    "successes": counter["successes"],
+                    "failures": counter["failures"],
+                    "avg_latency_ms": round(counter["total_ns"] / attempts / 1e6, 3) if attempts else 0,
+                }
+            return result
+
+class InputBackend(abc.ABC):
+    """재생 입력 주입 백엔드 인터페이스
+
+    MacroPlayer는 재생 계획의 명령 구간 [start, end)를 send_batch로 넘기며,
+    백엔드는 실제로 주입한 명령 수를 반환한다. inject는 반드시 구현해야 한다.
+    """
+
+    name = "base"
+    max_batch = 64
+
+    def prepare(self):
+        """재생 시작 전 준비 (화면 정보 갱신 등)"""
+        pass
+
+    def send_batch(self, plan, start, end):
+        """plan[start:end] 주입 - 주입된 명령 수 반환"""
+        return sum(1 for i in range(start, end) if self.inject(plan, i))
+
+    @abc.abstractmethod
+    def inject(self, plan, i):
+        """명령 하나 주입 - 성공 여부 반환"""
+
+    def stats(self):
+        return {"backend": self.name}
+
+class Win32InputBackend(InputBackend):
+    """SendInput 배치 주입 + 개별 Win32 API 대체 경로를 사용하는 실제 입력 백엔드"""
+
+    name = "win32"
+
+    def __init__(self, click_func=None, log=None, max_batch=64):
+        self.max_batch = max_batch
+        self.click_func = click_func  # (x, y, button, action, flag) -> bool
+        self.log = log or logging.getLogger(__name__)
+        self.batcher = None
+        self.fallback_count = 0
+
+    def prepare(self):
+        try:
+            batcher = SendInputBatcher(self.max_batch)
+            batcher.refresh_screen_metrics()
+            self.batcher = batcher
+        except Exception as e:
+            self.log.warning(f"화면 정보 조회 실패 - 개별 주입 사용: {str(e)}")
+            self.batcher = None
+
+    def send_batch(self, plan, start, end):
+        injected = 0
+        if self.batcher is not None:
+            try:
+                injected = self.batcher.send(plan, start, end)
+            except Exception as e:
+                self.log.error(f"SendInput 배치 주입 오류: {str(e)}")
+            if injected < end - start:
+                self.log.warning(f"SendInput 배치 일부만 주입됨: {injected}/{end - start} - 나머지 개별 주입")
+        
+        # 배치로 주입되지 않은 명령은 기존 방식으로 하나씩 주입
+        for i in range(start + injected, end):
+            self.fallback_count += 1
+            if self.inject(plan, i):
+                injected += 1
+        return injected
+
+    def inject(self, plan, i):
+        op = plan.ops[i]
+        
+        if op == OP_MOVE:
+            try:
+                win32api.SetCursorPos((plan.xs[i], plan.ys[i]))
+                return True
+            except:
+                return False
+        
+        elif op == OP_MOUSE_DOWN or op == OP_MOUSE_UP:
+            x, y = plan.xs[i], plan.ys[i]
+            button = MOUSE_BUTTON_NAMES[plan.buttons[i]]
+            action = "down" if op == OP_MOUSE_DOWN else "up"
+            
+            # 고급 클릭 방법 사용 (미리 해석한 플래그 전달)
+            if self.click_func is not None and self.click_func(x, y, button, action, plan.codes[i]):
+                return True
+            self.log.warning(f"클릭 실패: {x}, {y}, {button}, {action}")
+            return False
+        
+        else:
+            try:
+                flags = KEYEVENTF_KEYUP if op == OP_KEY_UP else 0
+                win32api.keybd_event(plan.codes[i], 0, flags, 0)
+                return True
+            except:
+                return False
+
+    def stats(self):
+        result = {"backend": self.name, "fallback": self.fallback_count}
+        if self.batcher is not None:
+            result.update(self.batcher.stats())
+        return result
+
+class RecordingInputBackend(InputBackend):
+    """실제 입력 없이 주입 요청을 타임스탬프와 함께 기록하는 헤드리스 백엔드
+
+    actions에는 (perf_counter_ns, plan 인덱스, 명령, x, y, code) 튜플이 쌓인다.
+    디스플레이가 없는 환경에서 재생 처리량/타이밍 오차를 측정하는 데 사용한다.
+    """
+
+    name = "recording"
+
+    def __init__(self, max_batch=64, keep_actions=True):
+        self.max_batch = max_batch
+        self.keep_actions = keep_actions
+        self.actions = []
+        self.batch_count = 0
+        self.injected_count = 0
+
+    def send_batch(self, plan, start, end):
+        now = time.perf_counter_ns()
+        if self.keep_actions:
+            ops, xs, ys, codes = plan.ops, plan.xs, plan.ys, plan.codes
+            self.actions.extend((now, i, ops[i], xs[i], ys[i], codes[i]) for i in range(start, end))
+        self.batch_count += 1
+        self.injected_count += end - start
+        return end - start
+
+    def inject(self, plan, i):
+        return self.send_batch(plan, i, i + 1) == 1
+
+    def stats(self):
+        return {"backend": self.name, "batches": self.batch_count, "injected": self.injected_count}
+
+class PlaybackProgress:
+    """재생 진행 상태
+
+    재생 스레드는 명령 구간마다 정수 필드만 갱신하고, GUI 스레드가 일정 주기로
+    읽어 표시한다 (재생 스레드에서 GUI 호출/객체 생성 없음).
+    """
+
+    __slots__ = ("name", "total", "done", "lag_ns", "started_ns", "finished")
+
+    def __init__(self, name=""):
+        self.name = name
+        self.total = 0
+        self.done = 0
+        self.lag_ns = 0
+        self.started_ns = 0
+        self.finished = False
+
+    def describe(self, now_ns=None):
+        """상태 표시줄용 요약 (진행률, 초당 이벤트, 마감시각 대비 지연)"""
+        total, done = self.total, self.done
+        if not total or not self.started_ns:
+            return f"매크로 '{self.name}' 실행 준비 중..."
+        elapsed_ns = (now_ns or time.perf_counter_ns()) - self.started_ns
+        rate = done * 1e9 / elapsed_ns if elapsed_ns > 0 else 0.0
+        return (f"매크로 '{self.name}' 실행 중... {done * 100 // total}% "
+                f"({done}/{total}, {rate:,.0f}개/초, 지연 {self.lag_ns / 1e6:.1f}ms)")
+
+class MacroPlayer:
+    """재생 계획을 마감시각에 맞춰 입력 백엔드로 주입하는 재생 엔진"""
+
+    def __init__(self, backend, timing_mode=TIMING_STRICT, batch_window_us=2000, log=None):
+        self.backend = backend
+        self.timing_mode = timing_mode
+        self.batch_window_us = batch_window_us
+        self.log = log or logging.getLogger(__name__)
+
+    def play(self, plan, controller=None, progress=None):
+        """재생 계획 실행 - 결과 통계 dict 반환
+
+        controller(PlaybackController)로 대기 중에도 즉시 일시정지/취소할 수 있다.
+        취소되면 눌린 채 남은 키와 마우스 버튼을 모두 뗀다.
+        progress(PlaybackProgress)는 명령 구간을 주입할 때마다 갱신된다.
+        """
+        return self.play_chunks((plan,), len(plan), controller, progress, plan.name)
+
+    def play_chunks(self, chunks, total, controller=None, progress=None, name=""):
+        """재생 계획 청크를 순서대로 실행 - 결과 통계 dict 반환
+
+        각 청크의 마감시각은 전체 재생 기준이므로 청크를 읽어 오는 동안에도 타이밍이
+        유지된다. total은 전체 명령 수 (진행률 표시용, 모르면 0).
+        """
+        backend = self.backend
+        timer = PlaybackTimer(self.timing_mode, controller=controller)
+        injected_total = 0
+        done = 0
+        last_deadline = 0
+        cancelled = False
+        finished = False
+        held_keys = set()  # 눌린 가상 키코드
+        held_buttons = {}  # 버튼 인덱스 -> 누른 위치 (x, y)
+        
+        backend.prepare()
+        start_ns = time.perf_counter_ns()
+        timer.start()
+        if progress is not None:
+            progress.total = total
+            progress.started_ns = start_ns
+        
+        try:
+            for plan in chunks:
+                deadlines = plan.deadlines
+                ops = plan.ops
+                count = len(plan)
+                if count:
+                    last_deadline = deadlines[-1]
+                
+                i = 0
+                while i < count:
+                    # 재생 시작 기준 절대 마감시각까지 대기 (취소/일시정지 반영)
+                    timer.wait_until(deadlines[i])
+                    
+                    # 같은 시간 창의 명령은 한 번에 주입
+                    end = plan.window_end(i, self.batch_window_us, backend.max_batch)
+                    injected_total += backend.send_batch(plan, i, end)
+                    
+                    # 눌린 입력 추적 (취소 시 해제용)
+                    for j in range(i, end):
+                        op = ops[j]
+                        if op == OP_KEY_DOWN:
+                            held_keys.add(plan.codes[j])
+                        elif op == OP_KEY_UP:
+                            held_keys.discard(plan.codes[j])
+                        elif op == OP_MOUSE_DOWN:
+                            held_buttons[plan.buttons[j]] = (plan.xs[j], plan.ys[j])
+                        elif op == OP_MOUSE_UP:
+                            held_buttons.pop(plan.buttons[j], None)
+                    done += end - i
+                    i = end
+                    
+                    if progress is not None:
+                        progress.done = done
+                        progress.lag_ns = timer.last_lateness_ns
+            finished = True
+        except PlaybackCancelled:
+            cancelled = True
+            self.log.info(f"재생 취소됨: {done}/{total}개 명령 실행")
+        finally:
+            timer.stop()
+            if progress is not None:
+                progress.finished = True
+            if not finished and (held_keys or held_buttons):
+                self.release_held(name, held_keys, held_buttons)
+        
+        return {
+            "events": done,
+            "injected": injected_total,
+            "completed": finished,
+            "cancelled": cancelled,
+            "origin_ns": timer.origin_ns,
+            "elapsed_ms": (time.perf_counter_ns() - start_ns) // 1_000_000,
+            "recorded_ms": last_deadline // 1000,
+            "timing": timer.stats(),
+            "backend": backend.stats(),
+        }
 
-# 로깅 설정
-class DebugLogger:
-    def __init__(self):
-        self.log_file = os.path.join(os.path.expanduser("~"), "PyMacro", "debug.log")
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+    def release_held(self, name, held_keys, held_buttons):
+        """중단된 재생에서 눌린 채 남은 키/마우스 버튼을 떼는 명령 주입"""
+        release = MacroPlan(f"{name}:release")
+        for code in held_keys:
+            release.ops.append(OP_KEY_UP)
+            release.deadlines.append(0)
+            release.xs.append(0)
+            release.ys.append(0)
+            release.codes.append(code)
+            release.buttons.append(0)
+        for button, (x, y) in held_buttons.items():
+            release.ops.append(OP_MOUSE_UP)
+            release.deadlines.append(0)
+            release.xs.append(x)
+            release.ys.append(y)
+            release.codes.append(MOUSE_BUTTON_FLAGS[MOUSE_BUTTON_NAMES[button]][1])
+            release.buttons.append(button)
         
-        # 로거 설정
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        try:
+            # 백엔드 배치 크기를 넘지 않도록 나누어 주입
+            step = max(1, self.backend.max_batch)
+            released = sum(self.backend.send_batch(release, start, min(start + step, len(release)))
+                           for start in range(0, len(release), step))
+            self.log.info(f"눌린 입력 해제: 키 {len(held_keys)}개, 버튼 {len(held_buttons)}개 ({released}/{len(release)} 주입)")
+        except Exception as e:
+            self.log.error(f"눌린 입력 해제 실패: {str(e)}")
+
+# 실행 중복 정책: 대기열에 추가 / 이미 실행(대기) 중이면 건너뜀 / 실행 중인 것을 취소하고 교체
+RUN_POLICY_QUEUE = "queue"
+RUN_POLICY_SKIP = "skip"
+RUN_POLICY_REPLACE = "replace"
+RUN_POLICIES = (RUN_POLICY_QUEUE, RUN_POLICY_SKIP, RUN_POLICY_REPLACE)
+RUN_POLICY_NAMES = {RUN_POLICY_QUEUE: "대기", RUN_POLICY_SKIP: "건너뜀", RUN_POLICY_REPLACE: "교체"}
+
+# 실행 우선순위 (작을수록 먼저)
+PRIORITY_MANUAL = 0
+PRIORITY_SCHEDULED = 10
+
+class ExecutionJob:
+    """실행 대기열 항목"""
+
+    __slots__ = ("key", "name", "target", "prepare", "priority", "seq", "policy",
+                 "controller", "enqueued_ns", "started_ns", "discarded", "prepared")
+
+    def __init__(self, key, name, target, prepare, priority, seq, policy, log):
+        self.key = key
+        self.name = name
+        self.target = target
+        self.prepare = prepare
+        self.priority = priority
+        self.seq = seq
+        self.policy = policy
+        self.controller = PlaybackController(log)
+        self.controller.name = name
+        self.enqueued_ns = time.perf_counter_ns()
+        self.started_ns = 0
+        self.discarded = False
+        self.prepared = False
+
+    def __lt__(self, other):
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+class ExecutionScheduler:
+    """입력 장치를 독점하는 매크로 실행 스케줄러
+
+    실행 요청은 우선순위 큐에 쌓이고 고정 크기 워커 풀이 꺼내 실행한다.
+    워커는 준비 단계(prepare - 재생 계획 컴파일 등)를 병렬로 수행한 뒤 장치를 배정받아
+    target(controller=...)을 실행하므로 입력 주입은 항상 한 번에 하나씩만 일어난다.
+    장치는 기다리는 작업 중 (우선순위, 요청 순서)가 가장 앞선 작업에 배정하며,
+    기다리는 동안 대기열에 더 급한 작업이 들어오면 잡고 있던 작업을 대기열에 되돌리고 그 작업을 꺼낸다.
+    같은 key(매크로)에 대한 중복 요청은 정책(RUN_POLICIES)에 따라 처리한다.
+    """
+
+    def __init__(self, workers=2, max_pending=64, log=None, on_change=None):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.log = log or logging.getLogger(__name__)
+        self.on_change = on_change  # 대기열/실행 상태 변경 시 호출 (인자 없음)
+        self._cond = threading.Condition()
+        self._heap = []
+        self._pending = {}  # key -> 대기 중인 작업 수
+        self._running = {}  # key -> 실행 중인 작업 목록
+        self._seq = itertools.count()
+        self._threads = []
+        self._stopped = False
+        self._device_busy = False
+        self._device_waiters = []  # 준비를 마치고 장치를 기다리는 작업
+        # 통계
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.replaced = 0
+        self.dropped = 0
+        self.requeued = 0
+        self.started = 0
+        self.wait_total_ns = 0
+        self.wait_max_ns = 0
+
+    def _ensure_workers(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"macro-exec-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def submit(self, key, target, name="", priority=PRIORITY_SCHEDULED,
+               policy=RUN_POLICY_QUEUE, prepare=None):
+        """실행 요청 - "queued" / "skipped" / "dropped" 중 하나 반환"""
+        policy = policy if policy in RUN_POLICIES else RUN_POLICY_QUEUE
+        with self._cond:
+            self.submitted += 1
+            active = self._pending.get(key, 0) + len(self._running.get(key, ()))
+            
+            if policy == RUN_POLICY_SKIP and active:
+                self.skipped += 1
+                self.log.info(f"실행 건너뜀 (이미 실행/대기 중): {name or key}")
+                return "skipped"
+            
+            if policy == RUN_POLICY_REPLACE and active:
+                # 대기 중인 같은 작업은 버리고 실행 중인 것은 취소
+                for job in self._heap:
+                    if job.key == key and not job.discarded:
+                        job.discarded = True
+                        self._pending[key] -= 1
+                self._heap = [job for job in self._heap if not job.discarded]
+                heapq.heapify(self._heap)
+                for job in self._running.get(key, ()):
+                    job.controller.cancel()
+                self.replaced += 1
+                self.log.info(f"실행 교체: {name or key}")
+            
+            # 힙에는 교체/취소로 버려진 항목이 남아 있을 수 있으므로 실제 대기 수로 판단
+            if self._pending_count() >= self.max_pending:
+                self.dropped += 1
+                self.log.warning(f"실행 대기열 가득 참 ({self.max_pending}) - 요청 버림: {name or key}")
+                return "dropped"
+            
+            if self._stopped:
+                self._stopped = False
+            job = ExecutionJob(key, name or str(key), target, prepare, priority,
+                               next(self._seq), policy, self.log)
+            heapq.heappush(self._heap, job)
+            self._pending[key] = self._pending.get(key, 0) + 1
+            self._ensure_workers()
+            # 장치를 기다리는 워커도 더 급한 작업인지 다시 확인하도록 모두 깨움
+            self._cond.notify_all()
+            pending = self._pending_count()
         
-    def debug(self, msg):
-        self.logger.debug(msg)
+        self.log.debug(f"실행 대기열 추가: {job.name} (우선순위 {priority}, 정책 {policy}, 대기 {pending})")
+        self._notify_change()
+        return "queued"
+
+    def _pending_count(self):
+        return sum(self._pending.values())
+
+    def _next_job(self):
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0].discarded:
+                    heapq.heappop(self._heap)
+                if self._heap:
+                    job = heapq.heappop(self._heap)
+                    self._pending[job.key] -= 1
+                    if not self._pending[job.key]:
+                        del self._pending[job.key]
+                    self._running.setdefault(job.key, []).append(job)
+                    return job
+                if self._stopped:
+                    return None
+                self._cond.wait()
+
+    def _acquire_device(self, job):
+        """장치 배정 대기 - 배정되면 True, 더 급한 작업 때문에 job을 대기열에 되돌렸으면 False"""
+        with self._cond:
+            self._device_waiters.append(job)
+            try:
+                while True:
+                    while self._heap and self._heap[0].discarded:
+                        heapq.heappop(self._heap)
+                    if self._heap and self._heap[0] < job and not job.controller.cancelled:
+                        self._requeue(job)
+                        return False
+                    if not self._device_busy and min(self._device_waiters) is job:
+                        self._device_busy = True
+                        return True
+                    self._cond.wait()
+            finally:
+                self._device_waiters.remove(job)
+
+    def _release_device(self):
+        with self._cond:
+            self._device_busy = False
+            self._cond.notify_all()
+
+    def _requeue(self, job):
+        # 실행 목록에서 빼서 원래 순서(seq) 그대로 대기열에 되돌림 (_cond를 잡은 상태에서 호출)
+        jobs = self._running.get(job.key, [])
+        if job in jobs:
+            jobs.remove(job)
+        if not jobs:
+            self._running.pop(job.key, None)
+        heapq.heappush(self._heap, job)
+        self._pending[job.key] = self._pending.get(job.key, 0) + 1
+        self.requeued += 1
+        self.log.debug(f"더 급한 작업이 있어 대기열로 되돌림: {job.name}")
+        self._cond.notify_all()
+
+    def _finish_job(self, job):
+        with self._cond:
+            jobs = self._running.get(job.key, [])
+            if job in jobs:
+                jobs.remove(job)
+            if not jobs:
+                self._running.pop(job.key, None)
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            self._notify_change()
+            requeued = False
+            try:
+                if job.prepare is not None and not job.prepared:
+                    job.prepare()
+                    job.prepared = True
+                if not self._acquire_device(job):
+                    requeued = True
+                    continue
+                try:
+                    # 장치 대기 중 취소/교체되었으면 실행하지 않음
+                    if not job.controller.cancelled:
+                        job.started_ns = time.perf_counter_ns()
+                        wait_ns = job.started_ns - job.enqueued_ns
+                        with self._cond:
+                            self.started += 1
+                            self.wait_total_ns += wait_ns
+                            self.wait_max_ns = max(self.wait_max_ns, wait_ns)
+                        self.log.debug(f"실행 시작: {job.name} (대기 {wait_ns / 1e6:.1f}ms)")
+                        job.target(controller=job.controller)
+                        with self._cond:
+                            self.completed += 1
+                finally:
+                    self._release_device()
+            except Exception as e:
+                with self._cond:
+                    self.failed += 1
+                self.log.exception(f"실행 작업 오류 ({job.name}): {str(e)}")
+            finally:
+                if not requeued:
+                    self._finish_job(job)
+                self._notify_change()
+
+    def _notify_change(self):
+        if self.on_change is not None:
+            try:
+                self.on_change()
+            except Exception as e:
+                self.log.error(f"실행 상태 알림 오류: {str(e)}")
+
+    def is_active(self, key):
+        """key 작업이 대기 또는 실행 중인지 여부"""
+        with self._cond:
+            return bool(self._pending.get(key) or self._running.get(key))
+
+    def running_controllers(self):
+        with self._cond:
+            return [job.controller for jobs in self._running.values() for job in jobs]
+
+    def cancel_all(self):
+        """대기 중인 작업을 버리고 실행 중인 작업을 취소 - 취소한 작업 수 반환"""
+        with self._cond:
+            count = 0
+            for job in self._heap:
+                if not job.discarded:
+                    job.discarded = True
+                    count += 1
+            self._heap.clear()
+            self._pending.clear()
+            for jobs in self._running.values():
+                for job in jobs:
+                    job.controller.cancel()
+                    count += 1
+        self._notify_change()
+        return count
+
+    def stop(self):
+        """모든 작업 취소 후 워커 종료"""
+        self.cancel_all()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            started = self.started
+            return {
+                "pending": self._pending_count(),
+                "running": sum(len(jobs) for jobs in self._running.values()),
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+                "replaced": self.replaced,
+                "dropped": self.dropped,
+                "requeued": self.requeued,
+                "avg_wait_ms": round(self.wait_total_ns / started / 1e6, 1) if started else 0.0,
+                "max_wait_ms": round(self.wait_max_ns / 1e6, 1),
+            }
+
+    def describe(self):
+        """GUI 표시용 상태 요약"""
+        stats = self.stats()
+        return (f"실행 대기 {stats['pending']}개, 실행 중 {stats['running']}개 "
+                f"(평균 대기 {stats['avg_wait_ms']}ms, 최대 {stats['max_wait_ms']}ms)")
+
+# 스케줄 반복 규칙 - 요일 이름 (datetime.weekday() 순서, 월=0)
+WEEKDAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+WEEKDAY_LABELS = ("월", "화", "수", "목", "금", "토", "일")
+WEEKDAY_GROUPS = {"weekdays": 0x1f, "평일": 0x1f, "weekends": 0x60, "주말": 0x60}
+ALL_WEEKDAYS = 0x7f
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600}
+SECONDS_PER_DAY = 86400
+# 다음 실행 시각을 찾을 때 살펴볼 최대 일수 (2월 29일 같은 드문 규칙 포함)
+SCHEDULE_SEARCH_DAYS = 366 * 8
+
+def _parse_time_of_day(text):
+    """"HH:MM" 또는 "HH:MM:SS" -> 자정 기준 초"""
+    parts = text.split(":")
+    if len(parts) not in (2, 3) or not all(part.isdigit() for part in parts):
+        raise ValueError(f"시간 형식이 올바르지 않습니다: {text} (HH:MM)")
+    hour, minute = int(parts[0]), int(parts[1])
+    second = int(parts[2]) if len(parts) == 3 else 0
+    if not (0 <= hour < 24 and 0 <= minute < 60 and 0 <= second < 60):
+        raise ValueError(f"시간 범위가 올바르지 않습니다: {text}")
+    return hour * 3600 + minute * 60 + second
+
+def _format_time_of_day(seconds):
+    hour, rest = divmod(seconds, 3600)
+    minute, second = divmod(rest, 60)
+    return f"{hour:02d}:{minute:02d}" + (f":{second:02d}" if second else "")
+
+def _weekday_index(name):
+    name = name.lower()
+    if name in WEEKDAY_NAMES:
+        return WEEKDAY_NAMES.index(name)
+    if name in WEEKDAY_LABELS:
+        return WEEKDAY_LABELS.index(name)
+    raise ValueError(f"알 수 없는 요일: {name}")
+
+def _parse_weekday_mask(text):
+    """"mon-fri", "mon,wed,fri", "weekdays", "월-금" -> 요일 비트마스크 (월=bit0)"""
+    mask = 0
+    for part in text.split(","):
+        if part.lower() in WEEKDAY_GROUPS:
+            mask |= WEEKDAY_GROUPS[part.lower()]
+        elif "-" in part:
+            start, end = (_weekday_index(name) for name in part.split("-", 1))
+            day = start
+            while True:
+                mask |= 1 << day
+                if day == end:
+                    break
+                day = (day + 1) % 7
+        else:
+            mask |= 1 << _weekday_index(part)
+    if not mask:
+        raise ValueError(f"요일이 비어 있습니다: {text}")
+    return mask
+
+def _describe_weekday_mask(mask):
+    if mask == ALL_WEEKDAYS:
+        return ""
+    if mask == 0x1f:
+        return "평일"
+    if mask == 0x60:
+        return "주말"
+    return ",".join(label for day, label in enumerate(WEEKDAY_LABELS) if mask >> day & 1)
+
+def _parse_cron_field(text, low, high, names=None):
+    """cron 필드 ("*", "*/5", "1-5", "1,3", "10-40/10") -> 값 집합"""
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"cron 간격이 올바르지 않습니다: {text}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start, end = (int(names(v)) if names and not v.isdigit() else int(v) for v in part.split("-", 1))
+        else:
+            start = int(names(part)) if names and not part.isdigit() else int(part)
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high and start <= end):
+            raise ValueError(f"cron 값 범위가 올바르지 않습니다: {text} ({low}-{high})")
+        values.update(range(start, end + 1, step))
+    return values
+
+def _cron_weekday(name):
+    # cron 요일 이름 -> cron 숫자 (일=0)
+    return (_weekday_index(name) + 1) % 7
+
+class ScheduleRule:
+    """스케줄 반복 규칙 - 한 번 파싱해 두고 다음 실행 시각을 바로 계산
+
+    표현식:
+      "09:30", "09:30,18:00"          매일 지정한 시각
+      "every 5m", "every 2h 09:00-18:00"
+                                      간격 반복 (매일 시작 시각(기본 00:00)부터 끝 시각까지)
+      "*/5 9-17 * * 1-5"              cron (분 시 일 월 요일, 일: L=말일, LW=마지막 평일, 요일: 0/7=일)
+    뒤에 붙이는 조건:
+      "@mon-fri", "@weekdays", "@월,수,금"   요일 제한
+      "!2026-12-25,2027-01-01"               제외 날짜
+
+    하루 안의 실행 시각은 정렬된 목록(이진 탐색) 또는 등차수열(산술 계산)로,
+    날짜 조건은 월/일/요일 비트마스크로 두므로 분 단위로 훑지 않고 날짜 단위로만 넘어간다.
+    """
+
+    __slots__ = ("expression", "kind", "slots", "interval", "window", "months", "month_days",
+                 "last_day", "last_weekday", "dom_star", "cron_weekdays", "dow_star",
+                 "weekday_mask", "excluded")
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.kind = "times"
+        self.slots = None  # 자정 기준 초 (정렬)
+        self.interval = 0
+        self.window = (0, SECONDS_PER_DAY - 1)
+        self.months = 0x1ffe  # bit 1..12
+        self.month_days = 0xfffffffe  # bit 1..31
+        self.last_day = False
+        self.last_weekday = False
+        self.dom_star = True  # 일 필드가 "*"로 시작 (일/요일 OR 규칙 판단용)
+        self.cron_weekdays = ALL_WEEKDAYS
+        self.dow_star = True
+        self.weekday_mask = ALL_WEEKDAYS  # "@" 요일 제한
+        self.excluded = frozenset()
+
+    @classmethod
+    def parse(cls, expression):
+        """표현식 파싱 - 잘못된 표현식이면 ValueError"""
+        expression = " ".join(expression.split())
+        if not expression:
+            raise ValueError("스케줄 표현식이 비어 있습니다.")
+        rule = cls(expression)
         
-    def info(self, msg):
-        self.logger.info(msg)
+        core = []
+        excluded = set()
+        for token in expression.split(" "):
+            if token.startswith("@"):
+                rule.weekday_mask &= _parse_weekday_mask(token[1:])
+            elif token.startswith("!"):
+                try:
+                    excluded.update(datetime.date.fromisoformat(day) for day in token[1:].split(","))
+                except ValueError:
+                    raise ValueError(f"제외 날짜 형식이 올바르지 않습니다: {token[1:]} (YYYY-MM-DD)")
+            else:
+                core.append(token)
+        rule.excluded = frozenset(excluded)
+        if not rule.weekday_mask:
+            raise ValueError("요일 제한에 해당하는 요일이 없습니다.")
         
-    def warning(self, msg):
-        self.logger.warning(msg)
+        if core and core[0].lower() == "every":
+            rule._parse_interval(core[1:])
+        elif len(core) == 5:
+            rule._parse_cron(core)
+        elif len(core) == 1:
+            rule.slots = sorted({_parse_time_of_day(part) for part in core[0].split(",")})
+        else:
+            raise ValueError(f"스케줄 표현식을 해석할 수 없습니다: {expression}")
+        return rule
+
+    def _parse_interval(self, tokens):
+        self.kind = "interval"
+        if not tokens or len(tokens) > 2:
+            raise ValueError("간격 형식: every 5m [HH:MM-HH:MM]")
+        text = tokens[0].lower()
+        unit = INTERVAL_UNITS.get(text[-1:])
+        if unit is None or not text[:-1].isdigit() or int(text[:-1]) <= 0:
+            raise ValueError(f"간격 형식이 올바르지 않습니다: {tokens[0]} (예: 30s, 5m, 2h)")
+        self.interval = int(text[:-1]) * unit
+        if len(tokens) == 2:
+            if "-" not in tokens[1]:
+                raise ValueError(f"시간 범위 형식이 올바르지 않습니다: {tokens[1]} (HH:MM-HH:MM)")
+            start, end = (_parse_time_of_day(part) for part in tokens[1].split("-", 1))
+            if end < start:
+                raise ValueError(f"시간 범위의 끝이 시작보다 빠릅니다: {tokens[1]}")
+            self.window = (start, end)
+
+    def _parse_cron(self, fields):
+        self.kind = "cron"
+        minute, hour, dom, month, dow = fields
+        try:
+            minutes = _parse_cron_field(minute, 0, 59)
+            hours = _parse_cron_field(hour, 0, 23)
+            self.slots = sorted(h * 3600 + m * 60 for h in hours for m in minutes)
+            
+            # "*/2"처럼 "*"로 시작해도 값은 항상 파싱하고, 별 여부는 OR/AND 판단에만 사용
+            self.dom_star = dom.startswith("*")
+            self.month_days = 0
+            plain = []
+            for part in dom.split(","):
+                if part.upper() == "L":
+                    self.last_day = True
+                elif part.upper() == "LW":
+                    self.last_weekday = True
+                else:
+                    plain.append(part)
+            if plain:
+                for day in _parse_cron_field(",".join(plain), 1, 31):
+                    self.month_days |= 1 << day
+            
+            self.months = 0
+            for value in _parse_cron_field(month, 1, 12):
+                self.months |= 1 << value
+            
+            self.dow_star = dow.startswith("*")
+            self.cron_weekdays = 0
+            for value in _parse_cron_field(dow, 0, 7, names=_cron_weekday):
+                # cron 요일(일=0/7) -> 월=0
+                self.cron_weekdays |= 1 << ((value + 6) % 7)
+        except ValueError as e:
+            if "cron" in str(e):
+                raise
+            raise ValueError(f"cron 표현식이 올바르지 않습니다: {' '.join(fields)} ({str(e)})")
+
+    def _day_matches(self, day):
+        if not self.weekday_mask >> day.weekday() & 1 or day in self.excluded:
+            return False
+        if self.kind != "cron":
+            return True
         
-    def error(self, msg):
-        self.logger.error(msg)
+        dom_ok = bool(self.month_days >> day.day & 1)
+        if not dom_ok and (self.last_day or self.last_weekday):
+            last = calendar.monthrange(day.year, day.month)[1]
+            if self.last_day and day.day == last:
+                dom_ok = True
+            elif self.last_weekday:
+                # 말일이 주말이면 직전 금요일
+                last_date = day.replace(day=last)
+                dom_ok = day == last_date - datetime.timedelta(days=max(0, last_date.weekday() - 4))
+        dow_ok = bool(self.cron_weekdays >> day.weekday() & 1)
+        # cron과 같이 일/요일 모두 "*"로 시작하지 않으면 둘 중 하나만 맞아도 실행
+        if not self.dom_star and not self.dow_star:
+            return dom_ok or dow_ok
+        return dom_ok and dow_ok
+
+    def _next_slot(self, second):
+        """second 이상인 그날의 첫 실행 시각 (자정 기준 초, 없으면 None)"""
+        if self.slots is not None:
+            index = bisect.bisect_left(self.slots, second)
+            return self.slots[index] if index < len(self.slots) else None
+        start, end = self.window
+        if second <= start:
+            return start
+        slot = start + -(-(second - start) // self.interval) * self.interval
+        return slot if slot <= end else None
+
+    def next_fire(self, after):
+        """after(epoch 초) 이후 첫 실행 시각 (epoch 초, 실행할 날이 없으면 None)"""
+        current = datetime.datetime.fromtimestamp(after)
+        day = current.date()
+        second = current.hour * 3600 + current.minute * 60 + current.second + 1
+        one_day = datetime.timedelta(days=1)
+        last_day = day + datetime.timedelta(days=SCHEDULE_SEARCH_DAYS)
         
-    def exception(self, msg):
-        self.logger.exception(msg)
+        while day <= last_day:
+            if not self.months >> day.month & 1:
+                # 해당하지 않는 달은 통째로 건너뜀
+                day = (day.replace(day=1) + datetime.timedelta(days=32)).replace(day=1)
+                second = 0
+                continue
+            if self._day_matches(day):
+                midnight = datetime.datetime.combine(day, datetime.time())
+                slot = self._next_slot(second)
+                while slot is not None:
+                    fire = (midnight + datetime.timedelta(seconds=slot)).timestamp()
+                    if fire > after:
+                        return fire
+                    # 서머타임 전환 등으로 시각이 겹치면 다음 슬롯
+                    slot = self._next_slot(slot + 1)
+            day += one_day
+            second = 0
+        return None
+
+    def fires_between(self, start, end, limit):
+        """start 이후 end 이하의 실행 시각 목록 (앞에서부터 최대 limit개)"""
+        fires = []
+        fire = start
+        while len(fires) < limit:
+            fire = self.next_fire(fire)
+            if fire is None or fire > end:
+                break
+            fires.append(fire)
+        return fires
+
+    def describe(self):
+        """GUI 표시용 설명"""
+        if self.kind == "interval":
+            value, unit = self.interval, "초"
+            for size, name in ((3600, "시간"), (60, "분")):
+                if value % size == 0:
+                    value, unit = value // size, name
+                    break
+            text = f"{value}{unit}마다"
+            if self.window != (0, SECONDS_PER_DAY - 1):
+                text += f" {_format_time_of_day(self.window[0])}~{_format_time_of_day(self.window[1])}"
+        elif self.kind == "cron":
+            text = f"cron {' '.join(token for token in self.expression.split(' ') if token[:1] not in '@!')} (하루 최대 {len(self.slots)}회)"
+        else:
+            text = ", ".join(_format_time_of_day(slot) for slot in self.slots)
+        
+        weekdays = _describe_weekday_mask(self.weekday_mask)
+        if weekdays:
+            text = f"{weekdays} {text}"
+        elif self.kind == "times":
+            text = f"매일 {text}"
+        if self.excluded:
+            text += f", 제외 {len(self.excluded)}일"
+        return text
+
+@lru_cache(maxsize=1024)
+def compile_schedule_rule(expression):
+    """스케줄 표현식 파싱 (결과 캐시) - 잘못된 표현식이면 ValueError"""
+    return ScheduleRule.parse(expression)
+
+def one_shot_fire(fire_time):
+    """fire_time에 한 번만 실행하는 next_fire 함수"""
+    return lambda after: fire_time if after < fire_time else None
+
+# 놓친 실행 처리 정책 (스케줄 항목의 "catchup")
+CATCHUP_SKIP = "skip"
+CATCHUP_ONCE = "once"
+CATCHUP_ALL = "all"
+CATCHUP_POLICIES = (CATCHUP_SKIP, CATCHUP_ONCE, CATCHUP_ALL)
+CATCHUP_POLICY_NAMES = {CATCHUP_SKIP: "건너뜀", CATCHUP_ONCE: "한 번 실행", CATCHUP_ALL: "모두 실행"}
+
+# 스케줄 실행 결과 (스케줄 항목의 "last_outcome")
+SCHEDULE_OUTCOME_NAMES = {
+    "queued": "실행",
+    "skipped": "건너뜀(중복)",
+    "dropped": "버림(대기열 가득)",
+    "missing": "매크로 없음",
+    "error": "오류",
+    "missed": "놓침",
+}
+
+class TimerEntry:
+    """타이머 스케줄러 항목"""
+
+    __slots__ = ("key", "name", "next_fire", "callback", "due", "removed",
+                 "fired", "last_fired", "last_lateness_ms", "max_lateness_ms")
+
+    def __init__(self, key, name, next_fire, callback, due):
+        self.key = key
+        self.name = name
+        self.next_fire = next_fire  # next_fire(after) -> 다음 실행 시각 (epoch 초, 없으면 None)
+        self.callback = callback
+        self.due = due
+        self.removed = False
+        self.fired = 0
+        self.last_fired = None
+        self.last_lateness_ms = 0.0
+        self.max_lateness_ms = 0.0
+
+class TimerScheduler:
+    """다음 실행 시각 최소 힙 기반 타이머 스케줄러
+
+    스레드는 가장 이른 실행 시각까지(또는 항목이 바뀔 때까지) 조건 변수에서 잠들고,
+    깨어나면 시각이 된 항목만 실행한 뒤 다음 실행 시각으로 다시 힙에 넣는다.
+    추가/삭제는 O(log n)/O(1)이며 삭제된 항목은 힙에서 꺼낼 때 버린다(지연 삭제).
+    시스템 절전이나 시계 변경에 대비해 최대 max_wait초마다 현재 시각을 다시 확인한다.
+    콜백 callback(due)는 잠금 밖에서 호출되므로 빨리 끝나야 한다 (재생은 실행 대기열에 넘김).
+    missed_after초보다 늦게 꺼낸 항목(절전/시계 변경으로 놓친 실행)은 실행하지 않고
+    on_missed([(key, due), ...])로 한꺼번에 넘긴다.
+    같은 시각에 꺼낸 항목들의 콜백 반환값(None 제외)은 on_batch([...])로 한 번에 넘기므로
+    실행 기록 같은 디스크 쓰기를 항목마다가 아니라 묶음마다 한 번만 할 수 있다.
+    """
+
+    def __init__(self, log=None, max_wait=60.0, missed_after=None, on_missed=None, on_batch=None):
+        self.log = log or logging.getLogger(__name__)
+        self.max_wait = max_wait
+        self.missed_after = missed_after
+        self.on_missed = on_missed
+        self.on_batch = on_batch
+        self._cond = threading.Condition()
+        self._heap = []  # (due, seq, entry)
+        self._entries = {}  # key -> TimerEntry
+        self._seq = itertools.count()
+        self._stale = 0
+        self._thread = None
+        self._running = False
+        # 통계
+        self.fired = 0
+        self.failed = 0
+        self.missed = 0
+        self.wakeups = 0
+        self.lateness_total_ms = 0.0
+        self.lateness_max_ms = 0.0
+
+    def _push(self, entry):
+        heapq.heappush(self._heap, (entry.due, next(self._seq), entry))
+
+    def _discard(self, entry):
+        entry.removed = True
+        self._stale += 1
+        # 버려진 항목이 절반을 넘으면 힙 재구성
+        if self._stale > 64 and self._stale * 2 > len(self._heap):
+            self._heap = [item for item in self._heap if not item[2].removed]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def _drop_removed_head(self):
+        while self._heap and self._heap[0][2].removed:
+            heapq.heappop(self._heap)
+            self._stale = max(0, self._stale - 1)
+
+    def add(self, key, next_fire, callback, name="", now=None):
+        """항목 추가 (같은 key가 있으면 교체) - 첫 실행 시각(epoch 초) 반환, 실행할 시각이 없으면 None"""
+        with self._cond:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._discard(old)
+            due = next_fire(time.time() if now is None else now)
+            if due is None:
+                return None
+            entry = TimerEntry(key, name or str(key), next_fire, callback, due)
+            self._entries[key] = entry
+            self._push(entry)
+            # 가장 이른 실행 시각이 바뀌었을 때만 스레드를 깨움
+            if self._heap[0][2] is entry:
+                self._cond.notify()
+            return due
+
+    def remove(self, key):
+        """항목 삭제 - 있었으면 True"""
+        with self._cond:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._discard(entry)
+            return True
+
+    def clear(self):
+        with self._cond:
+            for entry in self._entries.values():
+                entry.removed = True
+            self._entries.clear()
+            self._heap.clear()
+            self._stale = 0
+            self._cond.notify()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._cond:
+            return key in self._entries
+
+    def _pop_due(self, now):
+        """시각이 된 항목을 꺼내 다음 실행 시각으로 다시 넣음
+
+        (실행할 (entry, due, 지연 ms) 목록, 놓친 (key, due) 목록) 반환
+        """
+        due_entries = []
+        missed = []
+        while True:
+            self._drop_removed_head()
+            if not self._heap or self._heap[0][0] > now:
+                break
+            due, _, entry = heapq.heappop(self._heap)
+            lateness_ms = (now - due) * 1000.0
+            if (self.missed_after is not None and self.on_missed is not None
+                    and lateness_ms > self.missed_after * 1000.0):
+                self.missed += 1
+                missed.append((entry.key, due))
+            else:
+                due_entries.append((entry, due, lateness_ms))
+                self._record_lateness(entry, now, lateness_ms)
+            
+            # 다음 실행 시각 (오래 밀린 경우 지난 회차는 건너뜀)
+            try:
+                after = max(now, due)
+                entry.due = entry.next_fire(after)
+                if entry.due is not None and entry.due <= after:
+                    raise ValueError(f"다음 실행 시각이 앞으로 가지 않음: {entry.due}")
+            except Exception as e:
+                self.log.error(f"다음 실행 시각 계산 오류 ({entry.name}): {str(e)}")
+                entry.due = None
+            if entry.due is None:
+                entry.removed = True
+                self._entries.pop(entry.key, None)
+            else:
+                self._push(entry)
+        return due_entries, missed
+
+    def _record_lateness(self, entry, now, lateness_ms):
+        entry.fired += 1
+        entry.last_fired = now
+        entry.last_lateness_ms = lateness_ms
+        entry.max_lateness_ms = max(entry.max_lateness_ms, lateness_ms)
+        self.fired += 1
+        self.lateness_total_ms += lateness_ms
+        self.lateness_max_ms = max(self.lateness_max_ms, lateness_ms)
+
+    def _run(self):
+        self.log.info("타이머 스케줄러 시작")
+        while True:
+            with self._cond:
+                if not self._running:
+                    break
+                now = time.time()
+                due_entries, missed = self._pop_due(now)
+                if not due_entries and not missed:
+                    self._drop_removed_head()
+                    timeout = self.max_wait
+                    if self._heap:
+                        timeout = min(timeout, max(0.0, self._heap[0][0] - now))
+                    self._cond.wait(timeout)
+                    self.wakeups += 1
+                    continue
+            
+            if missed:
+                self.log.warning(f"놓친 실행 {len(missed)}건 감지 (절전/시계 변경)")
+                try:
+                    self.on_missed(missed)
+                except Exception as e:
+                    self.log.exception(f"놓친 실행 처리 오류: {str(e)}")
+            
+            results = []
+            for entry, due, lateness_ms in due_entries:
+                self.log.info(f"스케줄 실행: {entry.name} (지연 {lateness_ms:.1f}ms)")
+                try:
+                    result = entry.callback(due)
+                    if result is not None:
+                        results.append(result)
+                except Exception as e:
+                    with self._cond:
+                        self.failed += 1
+                    self.log.exception(f"스케줄 작업 오류 ({entry.name}): {str(e)}")
+            
+            if results and self.on_batch is not None:
+                try:
+                    self.on_batch(results)
+                except Exception as e:
+                    self.log.exception(f"스케줄 실행 결과 처리 오류: {str(e)}")
+        self.log.info("타이머 스케줄러 종료")
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="macro-timer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=2.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                self.log.warning("타이머 스케줄러 스레드가 정상 종료되지 않음")
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._running
+
+    def next_due(self):
+        """가장 이른 실행 시각 (epoch 초, 없으면 None)"""
+        with self._cond:
+            self._drop_removed_head()
+            return self._heap[0][0] if self._heap else None
+
+    def jobs(self):
+        """디버그/GUI용 항목 목록 (실행 시각 순)"""
+        with self._cond:
+            entries = sorted(self._entries.values(), key=lambda entry: entry.due)
+            return [{
+                "key": entry.key,
+                "name": entry.name,
+                "due": entry.due,
+                "fired": entry.fired,
+                "last_fired": entry.last_fired,
+                "last_lateness_ms": round(entry.last_lateness_ms, 1),
+                "max_lateness_ms": round(entry.max_lateness_ms, 1),
+            } for entry in entries]
+
+    def stats(self):
+        with self._cond:
+            fired = self.fired
+            return {
+                "entries": len(self._entries),
+                "heap": len(self._heap),
+                "fired": fired,
+                "failed": self.failed,
+                "missed": self.missed,
+                "wakeups": self.wakeups,
+                "avg_lateness_ms": round(self.lateness_total_ms / fired, 1) if fired else 0.0,
+                "max_lateness_ms": round(self.lateness_max_ms, 1),
+            }
+
+    def describe(self):
+        stats = self.stats()
+        return (f"등록 {stats['entries']}개, 실행 {stats['fired']}회 "
+                f"(평균 지연 {stats['avg_lateness_ms']}ms, 최대 {stats['max_lateness_ms']}ms)")
 
 class MacroRecorder:
     def __init__(self):
@@ -69,21 +3392,42 @@ class MacroRecorder:
             # 기본 디렉토리 설정
             self.base_dir = os.path.join(os.path.expanduser("~"), "PyMacro")
             self.macros_dir = os.path.join(self.base_dir, "macros")
+            self.journal_dir = os.path.join(self.base_dir, "journal")
             self.schedules_file = os.path.join(self.base_dir, "schedules.json")
             
+            # 새 매크로 저장 형식 (기존 JSON 매크로도 그대로 읽을 수 있음)
+            self.macro_format = MACRO_FORMAT_BINARY
+            
+            # 바이너리 매크로 압축 (차이값 저장 + 압축, 레코드 영역이 임계값보다 작으면 압축 안 함)
+            self.macro_compression = CODEC_ZLIB
+            self.macro_compression_level = 6
+            self.macro_compress_min_bytes = 64 * 1024
+            self.macro_delta_encoding = True
+            
             self.log.info(f"기본 디렉토리: {self.base_dir}")
             self.log.info(f"매크로 디렉토리: {self.macros_dir}")
             self.log.info(f"스케줄 파일: {self.schedules_file}")
             
             # 디렉토리 생성
             os.makedirs(self.macros_dir, exist_ok=True)
+            os.makedirs(self.journal_dir, exist_ok=True)
+            
+            # 이전 실행에서 중단된 녹화 저널 복구
+            self.recovered_macros = self.recover_recording_journals()
+            
+            # 매크로 색인 (디렉토리 전체를 다시 읽지 않고 바뀐 파일만 갱신)
+            self.catalog = MacroCatalog(os.path.join(self.base_dir, "catalog.db"), self.macros_dir, self.log)
             
             # 스케줄 관련 락 (데드락 방지)
             self.schedule_lock = threading.Lock()
             self.gui_update_lock = threading.Lock()
             
-            # 매크로 및 스케줄 데이터
+            # 스케줄 저장소 (스냅샷 + 추가 전용 저널)
+            self.schedule_store = ScheduleJournal(self.schedules_file, log=self.log)
+            
+            # 매크로 및 스케줄 데이터 (macro_index: 매크로 이름 -> 색인 항목)
             self.recorded_macros = []
+            self.macro_index = {}
             self.schedules = []
             self.load_macros()
             self.load_schedules()
@@ -92,7 +3436,55 @@ class MacroRecorder:
             self.is_recording = False
             self.current_macro = None
             self.recording_thread = None
-            self.current_events = []
+            self.current_events = EventStream()
+            
+            # 훅 콜백 -> 드레이너 링 버퍼
+            self.event_buffer_capacity = 65536
+            self.event_buffer = None
+            self.drain_interval = 0.01
+            self.drain_thread = None
+            self.drain_stop_event = threading.Event()
+            
+            # 녹화 저널 (청크 크기/플러시 주기 단위로 디스크에 기록)
+            self.journal = None
+            self.journal_chunk_size = 2000
+            self.journal_flush_interval = 1.0
+            self.last_journal_flush = 0
+            
+            # 재생 타이밍 모드 (strict / best_effort / fast)
+            self.timing_mode = TIMING_STRICT
+            
+            # 클릭 엔진 (성공한 방법 캐시, 이동/누름 후 대기 초 - 기본 0)
+            self.click_move_settle = 0.0
+            self.click_press_settle = 0.0
+            self.click_engine = ClickEngine(self.log, self.click_move_settle, self.click_press_settle)
+            
+            # 재생 옵션 (속도 배율, 최대 대기 간격, 이동 대기 생략)
+            self.playback_options = PlaybackOptions()
+            
+            # 지연 재생 (이벤트 수가 임계값을 넘는 정렬된 바이너리 매크로는 청크 단위로 읽으며 재생)
+            self.stream_playback_min_events = 200_000
+            self.stream_playback_chunk_events = 8192
+            
+            # 재생 진행 표시 (GUI 스레드가 progress_interval_ms마다 읽음)
+            self.active_progress = None
+            self.progress_interval_ms = 100
+            
+            # 재생 제어 (실행 중인 모든 재생의 컨트롤러)
+            self.active_controllers = set()
+            self.controllers_lock = threading.Lock()
+            
+            # 입력 장치 실행 스케줄러 (수동/스케줄 재생이 서로 섞이지 않도록 한 번에 하나씩 주입)
+            self.execution_scheduler = ExecutionScheduler(workers=2, log=self.log,
+                                                          on_change=self.on_execution_state_changed)
+            
+            # SendInput 배치 주입 시간 창 (마이크로초, 0이면 같은 시각의 명령만 묶음)
+            self.injection_batch_window_us = 2000
+            
+            # 마우스 경로 단순화 (허용 오차 픽셀, 0이면 모든 샘플 저장)
+            self.default_simplify_tolerance = 1.0
+            self.simplify_tolerance = self.default_simplify_tolerance
+            self.move_simplifier = TrajectorySimplifier(0)
             
             # 후킹 관련
             self.mouse_hook = None
@@ -101,10 +3493,23 @@ class MacroRecorder:
             self.start_time = 0
             self.hook_method = "none"  # 사용된 후킹 방법 추적
             
-            # 스케줄 실행 스레드
-            self.schedule_thread = None
+            # 컴파일된 재생 계획 캐시
+            self.plan_cache = MacroPlanCache()
+            
+            # 놓친 실행 처리 (schedule_missed_after초 넘게 늦은 회차는 놓친 것으로 보고
+            # 스케줄의 catchup 정책 적용, 따라잡기 실행은 catchup_spacing초 간격으로 예약)
+            self.schedule_missed_after = 60.0
+            self.catchup_max_runs = 10    # 스케줄 하나당 "모두 실행" 최대 횟수
+            self.catchup_max_total = 100  # 한 번의 처리에서 예약하는 최대 횟수
+            self.catchup_spacing = 5.0
+            self.catchup_next_slot = 0.0
+            self.catchup_stats = {"passes": 0, "schedules": 0, "scheduled": 0, "limited": 0}
+            
+            # 스케줄 타이머 (다음 실행 시각까지 잠들었다가 실행 대기열에 넘김)
+            self.timer_scheduler = TimerScheduler(log=self.log, missed_after=self.schedule_missed_after,
+                                                  on_missed=self.on_schedule_runs_missed,
+                                                  on_batch=self.record_schedule_runs)
             self.is_schedule_running = False
-            self.schedule_health_check_thread = None  # 헬스체크 스레드 추가
             
             # GUI 초기화
             self.root = None
@@ -113,6 +3518,10 @@ class MacroRecorder:
             # 전역 키보드 후킹 먼저 설정 (F11/F12용)
             self.setup_global_hotkeys()
             
+            # 매크로 디렉토리 감시 (외부에서 추가/삭제된 매크로를 목록에 바로 반영)
+            self.macro_watcher = MacroDirectoryWatcher(self.catalog, self.on_macro_files_changed, self.log)
+            self.macro_watcher.start()
+            
             self.init_gui()
             
         except Exception as e:
@@ -417,50 +3826,22 @@ class MacroRecorder:
             self.log.debug("pynput 후킹 설정 시작")
             from pynput import mouse, keyboard as pynput_keyboard
             
+            # 훅 스레드에서는 링 버퍼에 원시 튜플만 기록 (변환은 드레이너 스레드에서)
             def on_move(x, y):
                 if self.is_recording:
-                    current_time = time.time() - self.start_time
-                    self.current_events.append({
-                        'type': 'mouse_move', 'x': x, 'y': y, 'time': current_time
-                    })
+                    self.event_buffer.push(RAW_MOUSE_MOVE, time.perf_counter_ns(), x, y)
 
             def on_click(x, y, button, pressed):
                 if self.is_recording:
-                    current_time = time.time() - self.start_time
-                    button_name = str(button).split('.')[-1].lower()
-                    event_type = 'mouse_down' if pressed else 'mouse_up'
-                    self.current_events.append({
-                        'type': event_type, 'button': button_name, 
-                        'x': x, 'y': y, 'time': current_time
-                    })
+                    self.event_buffer.push(RAW_MOUSE_BUTTON, time.perf_counter_ns(), x, y, button, pressed)
 
             def on_press(key):
                 if self.is_recording:
-                    current_time = time.time() - self.start_time
-                    try:
-                        key_name = key.char if hasattr(key, 'char') and key.char else str(key).split('.')[-1].lower()
-                    except:
-                        key_name = str(key).split('.')[-1].lower()
-                    
-                    # F11/F12는 녹화에서 제외 (전역 핫키로 처리)
-                    if key_name not in ['f11', 'f12']:
-                        self.current_events.append({
-                            'type': 'key_down', 'key': key_name, 'time': current_time
-                        })
+                    self.event_buffer.push(RAW_PYNPUT_KEY, time.perf_counter_ns(), 0, 0, key, True)
 
             def on_release(key):
                 if self.is_recording:
-                    current_time = time.time() - self.start_time
-                    try:
-                        key_name = key.char if hasattr(key, 'char') and key.char else str(key).split('.')[-1].lower()
-                    except:
-                        key_name = str(key).split('.')[-1].lower()
-                    
-                    # F11/F12는 녹화에서 제외
-                    if key_name not in ['f11', 'f12']:
-                        self.current_events.append({
-                            'type': 'key_up', 'key': key_name, 'time': current_time
-                        })
+                    self.event_buffer.push(RAW_PYNPUT_KEY, time.perf_counter_ns(), 0, 0, key, False)
 
             # 리스너 생성
             self.mouse_listener = mouse.Listener(on_move=on_move, on_click=on_click)
@@ -489,15 +3870,9 @@ class MacroRecorder:
                 if not self.is_recording:
                     return
                 
-                current_time = time.time() - self.start_time
-                event_type = 'key_down' if e.event_type == keyboard.KEY_DOWN else 'key_up'
                 key_name = e.name if hasattr(e, 'name') else str(e)
-                
-                # F11/F12는 녹화에서 제외
-                if key_name.lower() not in ['f11', 'f12']:
-                    self.current_events.append({
-                        'type': event_type, 'key': key_name.lower(), 'time': current_time
-                    })
+                self.event_buffer.push(RAW_KEY_NAME, time.perf_counter_ns(), 0, 0, key_name,
+                                       e.event_type == keyboard.KEY_DOWN)
             
             # 키보드 후킹
             keyboard.hook(on_key_event)
@@ -552,14 +3927,12 @@ class MacroRecorder:
         
         while self.is_recording:
             try:
-                current_time = time.time() - self.start_time
+                current_time = time.perf_counter_ns()
                 
                 # 마우스 위치 확인
                 current_x, current_y = win32api.GetCursorPos()
                 if (current_x, current_y) != (last_x, last_y):
-                    self.current_events.append({
-                        'type': 'mouse_move', 'x': current_x, 'y': current_y, 'time': current_time
-                    })
+                    self.event_buffer.push(RAW_MOUSE_MOVE, current_time, current_x, current_y)
                     last_x, last_y = current_x, current_y
                 
                 # 마우스 버튼 상태 확인
@@ -572,11 +3945,8 @@ class MacroRecorder:
                 # 버튼 상태 변화 감지
                 for button, current_state in current_buttons.items():
                     if current_state != last_buttons[button]:
-                        event_type = 'mouse_down' if current_state else 'mouse_up'
-                        self.current_events.append({
-                            'type': event_type, 'button': button,
-                            'x': current_x, 'y': current_y, 'time': current_time
-                        })
+                        self.event_buffer.push(RAW_MOUSE_BUTTON, current_time,
+                                               current_x, current_y, button, current_state)
                         last_buttons[button] = current_state
                 
                 # CPU 사용량 조절
@@ -588,6 +3958,142 @@ class MacroRecorder:
         
         self.log.debug("폴링 방식 녹화 종료")
 
+    @staticmethod
+    def _pynput_key_name(key):
+        """pynput 키 객체에서 키 이름 추출"""
+        try:
+            return key.char if hasattr(key, 'char') and key.char else str(key).split('.')[-1].lower()
+        except:
+            return str(key).split('.')[-1].lower()
+
+    def _convert_raw_events(self, records):
+        """링 버퍼의 원시 튜플을 current_events 스트림에 추가"""
+        events = self.current_events
+        start_time = self.start_time
+        
+        simplifier = self.move_simplifier
+        
+        for _, kind, timestamp, x, y, detail, pressed in records:
+            # 녹화 시작 기준 정수 마이크로초
+            current_time = (timestamp - start_time) // 1000
+            
+            if kind == RAW_MOUSE_MOVE:
+                point = simplifier.push(x, y, current_time)
+                if point is not None:
+                    events.append(EV_MOUSE_MOVE, point[2], point[0], point[1])
+                continue
+            
+            # 클릭/키 경계에서는 보류 중인 이동 샘플을 확정
+            point = simplifier.flush()
+            if point is not None:
+                events.append(EV_MOUSE_MOVE, point[2], point[0], point[1])
+            
+            if kind == RAW_MOUSE_BUTTON:
+                button_name = detail if isinstance(detail, str) else str(detail).split('.')[-1].lower()
+                events.append(EV_MOUSE_DOWN if pressed else EV_MOUSE_UP, current_time, x, y, button_name)
+            
+            else:
+                if kind == RAW_PYNPUT_KEY:
+                    key_name = self._pynput_key_name(detail)
+                else:
+                    key_name = detail.lower()
+                
+                # F11/F12는 녹화에서 제외 (전역 핫키로 처리)
+                if key_name not in ['f11', 'f12']:
+                    events.append(EV_KEY_DOWN if pressed else EV_KEY_UP, current_time, 0, 0, key_name)
+
+    def flush_recording_journal(self):
+        """메모리의 이벤트를 저널 청크로 기록 (드레이너 스레드 또는 녹화 중지 후 호출)"""
+        self.last_journal_flush = time.monotonic()
+        if self.journal is None or not self.current_events:
+            return
+        
+        events = self.current_events
+        self.current_events = EventStream()
+        self.journal.append_chunk(events.to_dicts())
+
+    def recorded_event_count(self):
+        """현재 녹화의 전체 이벤트 수 (저널 기록분 + 메모리 보관분)"""
+        journal_count = self.journal.event_count if self.journal else 0
+        return journal_count + len(self.current_events)
+
+    def recover_recording_journals(self):
+        """비정상 종료로 남은 녹화 저널을 매크로 파일로 복구"""
+        recovered = []
+        try:
+            for file in os.listdir(self.journal_dir):
+                if not file.endswith(RecordingJournal.SUFFIX):
+                    continue
+                
+                journal_path = os.path.join(self.journal_dir, file)
+                try:
+                    header = RecordingJournal.read_header(journal_path)
+                    if header is None:
+                        self.log.warning(f"헤더가 손상된 저널 삭제: {journal_path}")
+                        os.remove(journal_path)
+                        continue
+                    
+                    # 같은 이름의 녹화가 여럿 중단되었어도 앞서 복구한 파일을 덮어쓰지 않도록 빈 이름 선택
+                    base_name = f"{header.get('name', file[:-len(RecordingJournal.SUFFIX)])}_복구"
+                    macro_name = base_name
+                    suffix = 1
+                    while any(os.path.exists(self.macro_file_path(macro_name, macro_format))
+                              for macro_format in MACRO_EXTENSIONS):
+                        suffix += 1
+                        macro_name = f"{base_name}{suffix}"
+                    file_path = self.macro_file_path(macro_name)
+                    
+                    # 저널 디렉토리의 임시 파일로 변환한 뒤 이번에 만든 파일만 옮기거나 지움
+                    temp_path = journal_path + os.path.splitext(file_path)[1]
+                    count = RecordingJournal.finalize(journal_path, temp_path,
+                                                      {"name": macro_name, "recovered": True},
+                                                      self.macro_binary_options())
+                    if count:
+                        os.replace(temp_path, file_path)
+                        recovered.append(macro_name)
+                        self.log.info(f"중단된 녹화 복구: {file_path} ({count}개 이벤트)")
+                    else:
+                        os.remove(temp_path)
+                        self.log.info(f"이벤트가 없는 저널 정리: {journal_path}")
+                    os.remove(journal_path)
+                        
+                except Exception as e:
+                    self.log.error(f"저널 복구 오류 ({file}): {str(e)}")
+                    
+        except Exception as e:
+            self.log.exception(f"저널 복구 중 오류: {str(e)}")
+        
+        return recovered
+
+    def _run_event_drainer(self):
+        """링 버퍼를 주기적으로 비워 이벤트 목록을 만드는 드레이너 스레드"""
+        self.log.debug("이벤트 드레이너 시작")
+        buffer = self.event_buffer
+        
+        while not self.drain_stop_event.wait(self.drain_interval):
+            try:
+                records = buffer.drain()
+                if records:
+                    self._convert_raw_events(records)
+                
+                # 청크가 차거나 플러시 주기가 지나면 저널에 기록하고 메모리 비움
+                if (len(self.current_events) >= self.journal_chunk_size or
+                        time.monotonic() - self.last_journal_flush >= self.journal_flush_interval):
+                    self.flush_recording_journal()
+            except Exception as e:
+                self.log.error(f"이벤트 드레이너 오류: {str(e)}")
+        
+        # 종료 전 남은 이벤트 모두 처리
+        try:
+            self._convert_raw_events(buffer.drain())
+            point = self.move_simplifier.flush()
+            if point is not None:
+                self.current_events.append(EV_MOUSE_MOVE, point[2], point[0], point[1])
+        except Exception as e:
+            self.log.error(f"이벤트 드레이너 마무리 오류: {str(e)}")
+        
+        self.log.debug("이벤트 드레이너 종료")
+
     def stop_all_hooks(self):
         """모든 후킹 해제"""
         try:
@@ -611,153 +4117,11 @@ class MacroRecorder:
         except Exception as e:
             self.log.error(f"후킹 해제 오류: {str(e)}")
 
-    def advanced_click_methods(self, x, y, button="left", action="click"):
-        """고급 클릭 방법들"""
-        success = False
-        
-        # 방법 1: SetCursorPos + mouse_event (가장 기본적이고 안정적)
-        try:
-            win32api.SetCursorPos((x, y))
-            time.sleep(0.05)
-            
-            if button == "left":
-                if action in ["click", "down"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-                    time.sleep(0.05)
-                if action in ["click", "up"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
-            elif button == "right":
-                if action in ["click", "down"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
-                    time.sleep(0.05)
-                if action in ["click", "up"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
-            elif button == "middle":
-                if action in ["click", "down"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_MIDDLEDOWN, 0, 0, 0, 0)
-                    time.sleep(0.05)
-                if action in ["click", "up"]:
-                    win32api.mouse_event(win32con.MOUSEEVENTF_MIDDLEUP, 0, 0, 0, 0)
-            
-            success = True
-            self.log.debug(f"기본 클릭 성공: {x}, {y}, {button}")
-            
-        except Exception as e:
-            self.log.error(f"기본 클릭 실패: {str(e)}")
-        
-        if success:
-            return True
-        
-        # 방법 2: SendInput API 사용
-        try:
-            # INPUT 구조체 정의
-            class MOUSEINPUT(ctypes.Structure):
-                _fields_ = [
-                    ("dx", ctypes.c_long),
-                    ("dy", ctypes.c_long),
-                    ("mouseData", wintypes.DWORD),
-                    ("dwFlags", wintypes.DWORD),
-                    ("time", wintypes.DWORD),
-                    ("dwExtraInfo", ctypes.POINTER(wintypes.ULONG))
-                ]
-
-            class INPUT_UNION(ctypes.Union):
-                _fields_ = [("mi", MOUSEINPUT)]
-
-            class INPUT(ctypes.Structure):
-                _fields_ = [("type", wintypes.DWORD), ("union", INPUT_UNION)]
-
-            # 화면 좌표를 정규화
-            screen_width = ctypes.windll.user32.GetSystemMetrics(0)
-            screen_height = ctypes.windll.user32.GetSystemMetrics(1)
-            
-            normalized_x = int(65535 * (x / screen_width))
-            normalized_y = int(65535 * (y / screen_height))
-            
-            inputs = []
-            
-            # 마우스 이동
-            move_input = INPUT()
-            move_input.type = 0  # INPUT_MOUSE
-            move_input.union.mi.dx = normalized_x
-            move_input.union.mi.dy = normalized_y
-            move_input.union.mi.mouseData = 0
-            move_input.union.mi.dwFlags = 0x0001 | 0x8000  # MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
-            move_input.union.mi.time = 0
-            move_input.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
-            inputs.append(move_input)
-            
-            # 버튼 플래그 설정
-            if button == "left":
-                down_flag = 0x0002  # MOUSEEVENTF_LEFTDOWN
-                up_flag = 0x0004    # MOUSEEVENTF_LEFTUP
-            elif button == "right":
-                down_flag = 0x0008  # MOUSEEVENTF_RIGHTDOWN
-                up_flag = 0x0010    # MOUSEEVENTF_RIGHTUP
-            elif button == "middle":
-                down_flag = 0x0020  # MOUSEEVENTF_MIDDLEDOWN
-                up_flag = 0x0040    # MOUSEEVENTF_MIDDLEUP
-            else:
-                return False
-            
-            # 클릭 이벤트 추가
-            if action in ["click", "down"]:
-                down_input = INPUT()
-                down_input.type = 0
-                down_input.union.mi.dx = normalized_x
-                down_input.union.mi.dy = normalized_y
-                down_input.union.mi.mouseData = 0
-                down_input.union.mi.dwFlags = down_flag
-                down_input.union.mi.time = 0
-                down_input.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
-                inputs.append(down_input)
-            
-            if action in ["click", "up"]:
-                up_input = INPUT()
-                up_input.type = 0
-                up_input.union.mi.dx = normalized_x
-                up_input.union.mi.dy = normalized_y
-                up_input.union.mi.mouseData = 0
-                up_input.union.mi.dwFlags = up_flag
-                up_input.union.mi.time = 0
-                up_input.union.mi.dwExtraInfo = ctypes.pointer(ctypes.c_ulong(0))
-                inputs.append(up_input)
-            
-            # 입력 전송
-            input_array = (INPUT * len(inputs))(*inputs)
-            result = ctypes.windll.user32.SendInput(len(inputs), ctypes.pointer(input_array), ctypes.sizeof(INPUT))
-            
-            success = (result == len(inputs))
-            if success:
-                self.log.debug(f"SendInput 클릭 성공: {x}, {y}, {button}")
-            else:
-                self.log.warning(f"SendInput 클릭 실패: {x}, {y}, {button}")
-                
-        except Exception as e:
-            self.log.error(f"SendInput 방법 실패: {str(e)}")
-        
-        if success:
-            return True
-        
-        # 방법 3: PyAutoGUI 사용 (최후의 수단)
-        try:
-            pyautogui.FAILSAFE = False
-            if action == "click":
-                pyautogui.click(x=x, y=y, button=button)
-            elif action == "down":
-                pyautogui.mouseDown(x=x, y=y, button=button)
-            elif action == "up":
-                pyautogui.mouseUp(x=x, y=y, button=button)
-            
-            success = True
-            self.log.debug(f"PyAutoGUI 클릭 성공: {x}, {y}, {button}")
-            
-        except Exception as e:
-            self.log.error(f"PyAutoGUI 클릭 실패: {str(e)}")
-        
-        return success
+    def advanced_click_methods(self, x, y, button="left", action="click", flag=None):
+        """고급 클릭 방법들 (이번 세션에서 성공한 방법을 우선 사용하는 클릭 엔진에 위임)"""
+        return self.click_engine.click(x, y, button, action, flag)
 
-    def start_recording(self, macro_name: str):
+    def start_recording(self, macro_name: str, simplify_tolerance: Optional[float] = None):
         """매크로 녹화 시작"""
         try:
             self.log.info(f"매크로 녹화 시작 요청: {macro_name}")
@@ -765,11 +4129,24 @@ class MacroRecorder:
             if self.is_recording:
                 self.log.warning("이미 녹화 중입니다.")
                 return
+            
+            if simplify_tolerance is None:
+                simplify_tolerance = self.simplify_tolerance
+            self.move_simplifier = TrajectorySimplifier(simplify_tolerance)
+            self.log.debug(f"마우스 경로 허용 오차: {simplify_tolerance}px")
                 
-            self.is_recording = True
             self.current_macro = macro_name
-            self.current_events = []
-            self.start_time = time.time()
+            self.current_events = EventStream()
+            self.journal = None
+            self.last_journal_flush = time.monotonic()
+            self.event_buffer = EventRingBuffer(self.event_buffer_capacity)
+            self.start_time = time.perf_counter_ns()
+            
+            # 드레이너 스레드를 먼저 띄운 뒤 녹화 플래그 설정
+            self.drain_stop_event.clear()
+            self.drain_thread = threading.Thread(target=self._run_event_drainer, daemon=True)
+            self.drain_thread.start()
+            self.is_recording = True
             
             # 녹화 방법 설정
             if not self.setup_recording_method():
@@ -782,8 +4159,26 @@ class MacroRecorder:
                     "   pip install pynput\n"
                     "4. 프로그램을 관리자 권한으로 재실행해보세요")
                 self.is_recording = False
+                self.drain_stop_event.set()
                 return
             
+            # 녹화 저널 생성
+            try:
+                journal_path = os.path.join(self.journal_dir,
+                                            f"{macro_name.replace(' ', '_')}{RecordingJournal.SUFFIX}")
+                self.journal = RecordingJournal(journal_path, {
+                    "name": macro_name,
+                    "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "hook_method": self.hook_method,
+                    "simplify_tolerance": self.move_simplifier.tolerance,
+                    "time_unit": TIME_UNIT,
+                    "clock": EVENT_CLOCK
+                })
+                self.log.debug(f"녹화 저널 생성: {journal_path}")
+            except Exception as e:
+                self.journal = None
+                self.log.error(f"녹화 저널 생성 실패 - 메모리에만 기록: {str(e)}")
+            
             # GUI 업데이트
             self.log.debug("녹화 시작 GUI 업데이트")
             self.safe_gui_update(lambda: self.update_recording_buttons_gui(True))
@@ -800,6 +4195,7 @@ class MacroRecorder:
         except Exception as e:
             self.log.exception(f"녹화 시작 중 오류: {str(e)}")
             self.is_recording = False
+            self.drain_stop_event.set()
 
     def stop_recording(self):
         """매크로 녹화 중지"""
@@ -820,15 +4216,34 @@ class MacroRecorder:
                 self.log.debug("녹화 스레드 종료 대기 중...")
                 self.recording_thread.join(1)
             
-            # 매크로 저장
-            if self.current_events:
+            # 드레이너가 남은 이벤트를 모두 변환할 때까지 대기
+            self.drain_stop_event.set()
+            if self.drain_thread and self.drain_thread.is_alive():
+                self.log.debug("이벤트 드레이너 종료 대기 중...")
+                self.drain_thread.join(2)
+            
+            simplifier = self.move_simplifier
+            if simplifier.input_count:
+                self.log.info(f"마우스 경로 단순화: {simplifier.input_count} -> {simplifier.output_count}개 "
+                              f"(허용 오차 {simplifier.tolerance}px)")
+            
+            buffer_stats = self.event_buffer.stats()
+            self.log.info(f"링 버퍼 통계: {buffer_stats}")
+            if buffer_stats["dropped"]:
+                self.log.warning(f"링 버퍼 오버플로로 유실된 이벤트: {buffer_stats['dropped']}개 "
+                                 f"(오버플로 {buffer_stats['overflows']}회)")
+            
+            # 매크로 저장 (저널을 매크로 파일로 변환)
+            event_count = self.recorded_event_count()
+            if event_count:
                 self.save_recorded_macro()
-                self.log.info(f"녹화된 이벤트 수: {len(self.current_events)}")
+                self.log.info(f"녹화된 이벤트 수: {event_count}")
             else:
                 self.log.warning("녹화된 이벤트가 없습니다.")
+                self.discard_recording_journal()
             
-            # 매크로 목록 새로고침
-            self.load_macros()
+            # 매크로 목록 새로고침 (저장 시 색인에 반영됨)
+            self.refresh_macro_entries()
             self.safe_gui_update(self.update_macro_list)
             
             # GUI 업데이트
@@ -908,270 +4323,312 @@ class MacroRecorder:
         except Exception as e:
             self.log.exception(f"녹화 버튼 상태 업데이트 오류: {str(e)}")
 
-    def play_macro(self, macro_path: str):
-        """매크로 재생"""
+    def play_macro(self, macro_path: str, timing_mode: Optional[str] = None,
+                   options: Optional[PlaybackOptions] = None,
+                   controller: Optional[PlaybackController] = None):
+        """매크로 재생 (options 생략 시 GUI에서 설정한 재생 옵션 사용)
+
+        controller를 넘기면 재생 중 일시정지/취소할 수 있다.
+        """
+        if controller is None:
+            controller = PlaybackController(self.log)
+        with self.controllers_lock:
+            self.active_controllers.add(controller)
         try:
-            self.log.info(f"매크로 재생 시작: {macro_path}")
-            
-            # 매크로 파일 로드
-            with open(macro_path, "r", encoding="utf-8") as f:
-                macro_data = json.load(f)
-            
-            events = macro_data["events"]
-            if not events:
-                self.log.warning("재생할 이벤트가 없습니다.")
-                messagebox.showinfo("알림", "재생할 이벤트가 없습니다.")
-                return
-            
-            # 상태 업데이트
-            macro_name = macro_data["name"]
-            self.safe_gui_update(lambda: setattr(self.status_var, 'value', f"매크로 '{macro_name}' 실행 중..."))
-            
-            # 이벤트를 시간순으로 정렬
-            sorted_events = sorted(events, key=lambda e: e["time"])
-            
-            if sorted_events:
-                start_time = sorted_events[0]["time"]
-                last_event_time = start_time
-                
-                self.log.info(f"매크로 실행 시작: {len(sorted_events)}개 이벤트")
-                
-                # 이벤트 처리 루프
-                for i, event in enumerate(sorted_events):
-                    if not self.root or not self.root.winfo_exists():
-                        break
-                    
-                    # 대기 시간 계산 및 적용
-                    wait_time = event["time"] - last_event_time
-                    if wait_time > 0.01:
-                        time.sleep(wait_time)
-                    
-                    # 이벤트 처리
-                    event_type = event["type"]
-                    
-                    if event_type == "mouse_move":
-                        x, y = event["x"], event["y"]
-                        try:
-                            win32api.SetCursorPos((x, y))
-                        except:
-                            pass
-                    
-                    elif event_type in ["mouse_down", "mouse_up"]:
-                        x, y = event["x"], event["y"]
-                        button = event["button"]
-                        action = "down" if event_type == "mouse_down" else "up"
-                        
-                        # 고급 클릭 방법 사용
-                        if not self.advanced_click_methods(x, y, button, action):
-                            self.log.warning(f"클릭 실패: {x}, {y}, {button}, {action}")
-                    
-                    elif event_type == "key_down":
-                        key = event["key"].lower()
-                        key_code = self.get_virtual_keycode(key)
-                        
-                        if key_code is not None:
-                            try:
-                                win32api.keybd_event(key_code, 0, 0, 0)
-                            except:
-                                pass
-                    
-                    elif event_type == "key_up":
-                        key = event["key"].lower()
-                        key_code = self.get_virtual_keycode(key)
-                        
-                        if key_code is not None:
-                            try:
-                                win32api.keybd_event(key_code, 0, win32con.KEYEVENTF_KEYUP, 0)
-                            except:
-                                pass
-                    
-                    last_event_time = event["time"]
-                    
-                    # 진행률 표시 (매 10개 이벤트마다)
-                    if i % 10 == 0:
-                        progress = int((i / len(sorted_events)) * 100)
-                        self.safe_gui_update(lambda p=progress, n=macro_name: 
-                            setattr(self.status_var, 'value', f"매크로 '{n}' 실행 중... ({p}%)"))
+            if options is None:
+                options = self.playback_options
+            self.log.info(f"매크로 재생 시작: {macro_path} (재생 옵션: {options.describe()})")
+            
+            # 매우 긴 바이너리 매크로는 mmap 청크 단위로 읽으며 재생 (전체 계획을 만들지 않음)
+            reader = self.open_streaming_reader(macro_path)
+            try:
+                if reader is not None:
+                    macro_name = reader.header.get("name") or os.path.splitext(os.path.basename(macro_path))[0]
+                    total = reader.event_count
+                    chunks = reader.plan_chunks(options)
+                    self.log.info(f"지연 재생: {total}개 이벤트를 {reader.chunk_events}개 단위로 읽음")
+                else:
+                    # 컴파일된 재생 계획 (캐시에 있으면 파싱/정렬/키 해석 생략)
+                    compile_start_ns = time.perf_counter_ns()
+                    plan = self.plan_cache.get(macro_path, options)
+                    compile_ms = (time.perf_counter_ns() - compile_start_ns) / 1e6
+                    self.log.debug(f"재생 계획 준비: {compile_ms:.1f}ms "
+                                   f"(캐시 적중 {self.plan_cache.hits}, 미스 {self.plan_cache.misses})")
+                    if plan.skipped_count:
+                        self.log.warning(f"해석할 수 없는 이벤트 {plan.skipped_count}개 제외")
+                    macro_name = plan.name
+                    total = len(plan)
+                    chunks = (plan,)
+                
+                if not total:
+                    self.log.warning("재생할 이벤트가 없습니다.")
+                    self.safe_gui_update(lambda: messagebox.showinfo("알림", "재생할 이벤트가 없습니다."))
+                    return
+                
+                # 상태 업데이트 (진행 상황은 GUI 스레드가 주기적으로 읽어 표시)
+                progress = PlaybackProgress(macro_name)
+                self.active_progress = progress
+                
+                player = MacroPlayer(
+                    Win32InputBackend(self.advanced_click_methods, self.log),
+                    timing_mode or self.timing_mode,
+                    self.injection_batch_window_us,
+                    self.log
+                )
+                self.log.info(f"매크로 실행 시작: {total}개 이벤트 (타이밍: {player.timing_mode})")
+                
+                result = player.play_chunks(chunks, total, controller, progress, macro_name)
+            finally:
+                if reader is not None:
+                    reader.close()
+            
+            self.log.info(f"재생 시간: {result['elapsed_ms']}ms (녹화 시간 {result['recorded_ms']}ms)")
+            self.log.info(f"타이밍 통계: {result['timing']}")
+            self.log.info(f"주입 통계: {result['backend']}")
+            self.log.debug(f"클릭 엔진 통계 (배치 주입 대체 경로): {self.click_engine.stats()}")
+            
+            if result["cancelled"]:
+                self.safe_gui_update(lambda: self.status_var.set(f"매크로 '{macro_name}' 실행 취소됨"))
+                self.log.info("매크로 실행 취소됨")
+                return
             
             # 상태 업데이트
-            self.safe_gui_update(lambda: setattr(self.status_var, 'value', f"매크로 '{macro_data['name']}' 실행 완료"))
+            self.safe_gui_update(lambda: self.status_var.set(f"매크로 '{macro_name}' 실행 완료"))
             self.log.info("매크로 실행 완료")
         
         except Exception as e:
             error_msg = f"매크로 실행 오류: {str(e)}"
             self.log.exception(error_msg)
-            self.safe_gui_update(lambda: setattr(self.status_var, 'value', error_msg))
+            self.safe_gui_update(lambda: self.status_var.set(error_msg))
+        finally:
+            self.active_progress = None
+            with self.controllers_lock:
+                self.active_controllers.discard(controller)
+
+    def open_streaming_reader(self, macro_path: str):
+        """지연 재생 대상이면 MacroEventReader 반환 (정렬된 바이너리 매크로가 임계값보다 길 때)"""
+        if macro_file_format(macro_path) != MACRO_FORMAT_BINARY:
+            return None
+        reader = MacroEventReader(macro_path, self.stream_playback_chunk_events)
+        if reader.time_sorted and reader.event_count > self.stream_playback_min_events:
+            return reader
+        reader.close()
+        return None
+
+    def prepare_playback(self, macro_path: str, options: PlaybackOptions):
+        """실행 대기 중 재생 준비 - 캐시할 계획을 미리 컴파일 (지연 재생 대상은 건너뜀)"""
+        reader = self.open_streaming_reader(macro_path)
+        if reader is not None:
+            reader.close()
+            return
+        self.plan_cache.get(macro_path, options)
+
+    def poll_playback_progress(self):
+        """재생 진행 상황을 일정 주기로 상태 표시줄에 반영 (GUI 스레드에서 root.after로 반복)"""
+        try:
+            if not self.root or not self.root.winfo_exists():
+                return
+            progress = self.active_progress
+            if progress is not None and not progress.finished:
+                text = progress.describe()
+                if text != self.status_var.get():
+                    self.status_var.set(text)
+            self.root.after(self.progress_interval_ms, self.poll_playback_progress)
+        except Exception as e:
+            self.log.error(f"재생 진행 표시 오류: {str(e)}")
+
+    def running_controllers(self):
+        """실행 중인 재생 컨트롤러 목록"""
+        with self.controllers_lock:
+            return list(self.active_controllers)
+
+    def pause_playback(self):
+        """실행 중인 모든 재생 일시정지"""
+        for controller in self.running_controllers():
+            controller.pause()
+
+    def resume_playback(self):
+        """일시정지된 모든 재생 재개"""
+        for controller in self.running_controllers():
+            controller.resume()
+
+    def cancel_playback(self):
+        """대기 중인 실행을 버리고 실행 중인 모든 재생 취소 - 취소한 수 반환"""
+        cancelled = self.execution_scheduler.cancel_all()
+        for controller in self.running_controllers():
+            controller.cancel()
+        return cancelled
+
+    def on_execution_state_changed(self):
+        """실행 대기열 상태 변경 시 GUI 표시 갱신 (워커 스레드에서 호출됨)"""
+        if getattr(self, "execution_status_var", None) is None:
+            return
+        summary = self.execution_scheduler.describe()
+        self.safe_gui_update(lambda: self.execution_status_var.set(summary))
+
+    def submit_playback(self, macro_path: str, name: str = "", options: Optional[PlaybackOptions] = None,
+                        priority: int = PRIORITY_SCHEDULED, policy: str = RUN_POLICY_QUEUE):
+        """매크로 재생을 실행 대기열에 추가 - ExecutionScheduler.submit 결과 반환
+
+        재생 계획 컴파일은 대기 중에 미리 수행하고, 입력 주입은 장치 잠금을 잡은 뒤 시작한다.
+        """
+        if options is None:
+            options = self.playback_options
+        return self.execution_scheduler.submit(
+            macro_path,
+            lambda controller: self.play_macro(macro_path, options=options, controller=controller),
+            name=name or os.path.basename(macro_path),
+            priority=priority,
+            policy=policy,
+            prepare=lambda: self.prepare_playback(macro_path, options)
+        )
 
     def get_virtual_keycode(self, key: str):
         """키 이름에서 가상 키코드 가져오기"""
-        special_keys = {
-            'shift': win32con.VK_SHIFT,
-            'ctrl': win32con.VK_CONTROL,
-            'alt': win32con.VK_MENU,
-            'hangul': 0x15,
-            'han_yeong': 0x15,
-            'hanyeong': 0x15,
-            'ralt': 0x15,
-            'rctrl': win32con.VK_RCONTROL,
-            'rshift': win32con.VK_RSHIFT,
-            'lalt': win32con.VK_LMENU,
-            'lctrl': win32con.VK_LCONTROL,
-            'lshift': win32con.VK_LSHIFT,
-            'capslock': win32con.VK_CAPITAL,
-            'esc': win32con.VK_ESCAPE,
-            'escape': win32con.VK_ESCAPE,
-            'space': win32con.VK_SPACE,
-            'tab': win32con.VK_TAB,
-            'enter': win32con.VK_RETURN,
-            'backspace': win32con.VK_BACK,
-            'delete': win32con.VK_DELETE,
-            'insert': win32con.VK_INSERT,
-            'home': win32con.VK_HOME,
-            'end': win32con.VK_END,
-            'pageup': win32con.VK_PRIOR,
-            'pagedown': win32con.VK_NEXT,
-            'page_up': win32con.VK_PRIOR,
-            'page_down': win32con.VK_NEXT,
-            'up': win32con.VK_UP,
-            'down': win32con.VK_DOWN,
-            'left': win32con.VK_LEFT,
-            'right': win32con.VK_RIGHT,
-        }
-        
-        if key in special_keys:
-            return special_keys[key]
-        
-        if len(key) == 1:
-            return win32api.VkKeyScan(key) & 0xff
-        
-        if key.startswith('f') and len(key) <= 3:
-            try:
-                num = int(key[1:])
-                if 1 <= num <= 12:
-                    return win32con.VK_F1 + (num - 1)
-            except:
-                pass
-        
-        return None
+        return resolve_virtual_keycode(key)
 
     def save_recorded_macro(self):
-        """녹화된 매크로를 파일로 저장"""
+        """녹화된 매크로를 파일로 저장 (녹화 저널을 매크로 파일로 변환)"""
         try:
             self.log.debug(f"매크로 저장 시작: {self.current_macro}")
             
-            if not self.current_events:
+            if not self.recorded_event_count():
                 self.log.warning("저장할 이벤트가 없습니다.")
                 return
-                
-            macro_data = {
-                "name": self.current_macro,
-                "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "events": self.current_events,
-                "hook_method": self.hook_method
-            }
-            
-            filename = f"{self.current_macro.replace(' ', '_')}.json"
-            file_path = os.path.join(self.macros_dir, filename)
             
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(macro_data, f, ensure_ascii=False, indent=2)
+            file_path = self.macro_file_path(self.current_macro)
+            
+            if self.journal is not None:
+                # 남은 이벤트를 저널에 기록한 뒤 스트리밍 변환
+                self.flush_recording_journal()
+                self.journal.close()
+                RecordingJournal.finalize(self.journal.path, file_path, {"hook_method": self.hook_method},
+                                          self.macro_binary_options())
+                os.remove(self.journal.path)
+                self.log.debug(f"녹화 저널 변환 완료: {self.journal.path}")
+                self.journal = None
+            else:
+                header = {
+                    "name": self.current_macro,
+                    "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "hook_method": self.hook_method,
+                    "simplify_tolerance": self.move_simplifier.tolerance,
+                    "time_unit": TIME_UNIT,
+                    "clock": EVENT_CLOCK
+                }
+                write_macro(file_path, header, self.current_events, self.macro_binary_options())
+                self.current_events = EventStream()
             
+            self.catalog.upsert(os.path.basename(file_path))
             self.log.info(f"매크로 저장 완료: {file_path}")
             
         except Exception as e:
             self.log.exception(f"매크로 저장 중 오류: {str(e)}")
 
+    def discard_recording_journal(self):
+        """이벤트 없이 끝난 녹화의 저널 삭제"""
+        if self.journal is None:
+            return
+        try:
+            self.journal.close()
+            os.remove(self.journal.path)
+        except Exception as e:
+            self.log.error(f"녹화 저널 삭제 실패: {str(e)}")
+        self.journal = None
+
+    def macro_binary_options(self):
+        """바이너리 매크로 저장 시 사용할 압축 설정"""
+        return {
+            "codec": self.macro_compression,
+            "level": self.macro_compression_level,
+            "delta": self.macro_delta_encoding,
+            "min_compress_bytes": self.macro_compress_min_bytes,
+        }
+
+    def macro_file_path(self, macro_name: str, macro_format: Optional[str] = None):
+        """매크로 이름의 저장 경로 (형식 생략 시 설정된 저장 형식)"""
+        extension = MACRO_EXTENSIONS[macro_format or self.macro_format]
+        return os.path.join(self.macros_dir, f"{macro_name.replace(' ', '_')}{extension}")
+
     def load_macros(self):
-        """저장된 매크로 파일 목록 로드"""
+        """매크로 색인을 디렉토리와 동기화(stat 비교)한 뒤 매크로 목록 로드"""
         try:
             self.log.debug("매크로 목록 로드 시작")
-            self.recorded_macros = []
-            
-            if os.path.exists(self.macros_dir):
-                for file in os.listdir(self.macros_dir):
-                    if file.endswith(".json"):
-                        try:
-                            macro_path = os.path.join(self.macros_dir, file)
-                            macro_name = file[:-5]  # .json 제거
-                            
-                            created_time = datetime.datetime.fromtimestamp(
-                                os.path.getctime(macro_path)
-                            ).strftime("%Y-%m-%d %H:%M:%S")
-                            
-                            self.recorded_macros.append({
-                                "name": macro_name,
-                                "file": file,
-                                "created": created_time,
-                                "path": macro_path
-                            })
-                        except Exception as e:
-                            self.log.error(f"매크로 파일 로드 오류 ({file}): {str(e)}")
-            
-            self.log.info(f"매크로 {len(self.recorded_macros)}개 로드 완료")
+            self.catalog.reconcile()
+            self.refresh_macro_entries()
             
         except Exception as e:
             self.log.exception(f"매크로 목록 로드 중 오류: {str(e)}")
     
+    def refresh_macro_entries(self):
+        """디렉토리를 읽지 않고 색인에서 매크로 목록 갱신 (이름이 같으면 바이너리 우선)"""
+        try:
+            entries = self.catalog.entries()
+            self.macro_index = {macro["name"]: macro for macro in entries}
+            self.recorded_macros = entries
+            self.log.info(f"매크로 {len(self.recorded_macros)}개 로드 완료")
+        except Exception as e:
+            self.log.exception(f"매크로 색인 조회 오류: {str(e)}")
+    
+    def find_macro(self, macro_name: str):
+        """매크로 이름의 색인 항목 (없으면 None)"""
+        return self.macro_index.get(macro_name)
+    
+    def on_macro_files_changed(self, added, updated, removed):
+        """매크로 파일 변경분 반영 (감시 스레드에서 호출) - 바뀐 이름만 목록/GUI/스케줄에 반영"""
+        names = {os.path.splitext(file)[0] for file in itertools.chain(added, updated, removed)}
+        index = dict(self.macro_index)
+        for name in names:
+            entry = self.catalog.entry_for_name(name)
+            previous = index.get(name)
+            if previous is not None:
+                self.plan_cache.invalidate(previous["path"])
+            if entry is None:
+                index.pop(name, None)
+            else:
+                index[name] = entry
+        
+        self.macro_index = index
+        self.recorded_macros = sorted(index.values(), key=lambda macro: macro["name"])
+        self.log.info(f"매크로 목록 변경 반영: {sorted(names)} (전체 {len(index)}개)")
+        self.safe_gui_update(lambda: self.update_macro_rows(names))
+        
+        # 바뀐 매크로를 사용하는 스케줄만 다시 등록 (경로는 실행 시점에 색인에서 찾음)
+        if self.is_schedule_running:
+            with self.schedule_lock:
+                affected = [sched for sched in self.schedules if sched["macro"] in names]
+            for sched in affected:
+                self.register_schedule(sched)
+    
     def load_schedules(self):
-        """저장된 스케줄 목록 로드"""
+        """저장된 스케줄 목록 로드 (스냅샷 + 저널 재생)"""
         try:
             self.log.debug("스케줄 목록 로드 시작")
-            
-            if os.path.exists(self.schedules_file):
-                try:
-                    with open(self.schedules_file, "r", encoding="utf-8") as f:
-                        self.schedules = json.load(f)
-                    self.log.info(f"스케줄 {len(self.schedules)}개 로드 완료")
-                except json.JSONDecodeError as e:
-                    self.log.error(f"스케줄 파일 JSON 파싱 오류: {str(e)}")
-                    self.schedules = []
-                except Exception as e:
-                    self.log.error(f"스케줄 파일 읽기 오류: {str(e)}")
-                    self.schedules = []
-            else:
-                self.schedules = []
-                self.log.info("스케줄 파일이 없습니다. 빈 목록으로 초기화.")
+            self.schedules = self.schedule_store.load()
+            self.log.info(f"스케줄 {len(self.schedules)}개 로드 완료")
                 
         except Exception as e:
             self.log.exception(f"스케줄 목록 로드 중 오류: {str(e)}")
             self.schedules = []
     
-    def save_schedules(self):
-        """스케줄 정보 저장"""
+    def record_schedule_change(self, op, schedule_id=None, schedule=None, changes=None):
+        """스케줄 편집 하나를 저널에 기록 (schedule_lock을 잡은 상태에서 호출)
+
+        저널이 충분히 길어지면 현재 목록으로 스냅샷을 압축한다.
+        """
         try:
-            self.log.debug("스케줄 저장 시작")
-            
-            # 백업 생성
-            if os.path.exists(self.schedules_file):
-                backup_file = self.schedules_file + ".backup"
-                try:
-                    import shutil
-                    shutil.copy2(self.schedules_file, backup_file)
-                    self.log.debug(f"스케줄 백업 생성: {backup_file}")
-                except Exception as e:
-                    self.log.warning(f"스케줄 백업 생성 실패: {str(e)}")
-            
-            # 임시 파일에 먼저 저장
-            temp_file = self.schedules_file + ".tmp"
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(self.schedules, f, ensure_ascii=False, indent=2)
-            
-            # 원자적 교체
-            if os.path.exists(self.schedules_file):
-                os.remove(self.schedules_file)
-            os.rename(temp_file, self.schedules_file)
-            
-            self.log.info(f"스케줄 저장 완료: {len(self.schedules)}개")
+            if op == "add":
+                self.schedule_store.add(schedule)
+            elif op == "update":
+                self.schedule_store.update(schedule_id, changes)
+            else:
+                self.schedule_store.delete(schedule_id)
             
+            if self.schedule_store.needs_compaction(len(self.schedules)):
+                self.schedule_store.compact(self.schedules)
+                
         except Exception as e:
-            self.log.exception(f"스케줄 저장 중 오류: {str(e)}")
-            # 임시 파일 정리
-            temp_file = self.schedules_file + ".tmp"
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
+            self.log.exception(f"스케줄 저널 기록 중 오류: {str(e)}")
     
     def delete_macro(self, macro_path: str):
         """매크로 삭제"""
@@ -1181,22 +4638,26 @@ class MacroRecorder:
             if os.path.exists(macro_path):
                 os.remove(macro_path)
                 self.log.info(f"매크로 파일 삭제 완료: {macro_path}")
+            self.plan_cache.invalidate(macro_path)
+            self.catalog.remove(os.path.basename(macro_path))
                 
             # 매크로가 삭제되었으므로 관련 스케줄도 삭제
-            macro_name = os.path.basename(macro_path)[:-5]  # .json 제거
-            old_count = len(self.schedules)
-            
+            macro_name = os.path.splitext(os.path.basename(macro_path))[0]
             with self.schedule_lock:
-                self.schedules = [s for s in self.schedules 
-                                if s["macro"] != macro_name]
+                removed = [s for s in self.schedules if s["macro"] == macro_name]
+                if removed:
+                    self.schedules = [s for s in self.schedules 
+                                    if s["macro"] != macro_name]
+                    for sched in removed:
+                        self.record_schedule_change("delete", sched["id"])
                 
-            new_count = len(self.schedules)
-            if old_count != new_count:
-                self.log.info(f"관련 스케줄 {old_count - new_count}개 삭제")
-                self.save_schedules()
+            for sched in removed:
+                self.timer_scheduler.remove(sched["id"])
+            if removed:
+                self.log.info(f"관련 스케줄 {len(removed)}개 삭제")
             
             # 목록 새로고침
-            self.load_macros()
+            self.refresh_macro_entries()
             self.safe_gui_update(self.update_macro_list)
             self.safe_gui_update(self.update_schedule_list)
             
@@ -1209,19 +4670,22 @@ class MacroRecorder:
             messagebox.showerror("오류", error_msg)
             return False
     
-    def add_schedule(self, macro_name: str, time_str: str):
-        """스케줄 추가"""
+    def add_schedule(self, macro_name: str, time_str: str, options: Optional[PlaybackOptions] = None,
+                     policy: str = RUN_POLICY_QUEUE, catchup: str = CATCHUP_SKIP):
+        """스케줄 추가 (time_str: 실행 규칙 표현식 - ScheduleRule 참고,
+        options: 이 스케줄 실행에 사용할 재생 옵션, policy: 중복 실행 정책, catchup: 놓친 실행 처리)"""
         try:
             self.log.info(f"스케줄 추가 요청: {macro_name} at {time_str}")
             
-            # 시간 형식 확인 (HH:MM)
+            # 실행 규칙 확인 (HH:MM, every 5m, cron ...)
             try:
-                hour, minute = map(int, time_str.split(":"))
-                if not (0 <= hour < 24 and 0 <= minute < 60):
-                    raise ValueError("시간 범위가 올바르지 않습니다.")
-                self.log.debug(f"시간 형식 검증 완료: {hour:02d}:{minute:02d}")
+                rule = compile_schedule_rule(" ".join(time_str.split()))
+                if rule.next_fire(time.time()) is None:
+                    raise ValueError("실행할 날짜가 없습니다.")
+                time_str = rule.expression
+                self.log.debug(f"실행 규칙 검증 완료: {time_str} ({rule.describe()})")
             except ValueError as e:
-                error_msg = f"시간 형식이 올바르지 않습니다: {str(e)}"
+                error_msg = f"실행 규칙이 올바르지 않습니다: {str(e)}"
                 self.log.error(error_msg)
                 messagebox.showerror("오류", error_msg)
                 return False
@@ -1236,7 +4700,12 @@ class MacroRecorder:
                 "id": schedule_id,
                 "macro": macro_name,
                 "time": time_str,
-                "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "playback": (options or PlaybackOptions()).to_dict(),
+                "policy": policy if policy in RUN_POLICIES else RUN_POLICY_QUEUE,
+                "catchup": catchup if catchup in CATCHUP_POLICIES else CATCHUP_SKIP,
+                "last_fire": None,
+                "last_outcome": None
             }
             
             # 스케줄 목록에 안전하게 추가
@@ -1244,13 +4713,12 @@ class MacroRecorder:
                 self.schedules.append(new_schedule)
                 self.log.debug(f"스케줄 목록에 추가: {new_schedule}")
                 
-                # 파일 저장
-                self.save_schedules()
+                # 저널에 추가 기록
+                self.record_schedule_change("add", schedule_id, schedule=new_schedule)
             
-            # 실행 중인 경우 스케줄 갱신
+            # 실행 중인 경우 이 스케줄만 타이머에 등록
             if self.is_schedule_running:
-                self.log.debug("스케줄러 실행 중이므로 스케줄 갱신")
-                threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
+                self.register_schedule(new_schedule)
             
             # 목록 새로고침
             self.safe_gui_update(self.update_schedule_list)
@@ -1281,13 +4749,11 @@ class MacroRecorder:
                 
                 self.log.debug(f"스케줄 삭제됨: {old_count} -> {new_count}")
                 
-                # 파일 저장
-                self.save_schedules()
+                # 저널에 삭제 기록
+                self.record_schedule_change("delete", schedule_id)
             
-            # 실행 중인 경우 스케줄 갱신
-            if self.is_schedule_running:
-                self.log.debug("스케줄러 실행 중이므로 스케줄 갱신")
-                threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
+            # 타이머에서 이 스케줄만 제거
+            self.timer_scheduler.remove(schedule_id)
             
             # 목록 새로고침
             self.safe_gui_update(self.update_schedule_list)
@@ -1317,19 +4783,10 @@ class MacroRecorder:
             self.log.debug("스케줄러 GUI 업데이트 시작")
             self.safe_gui_update(lambda: self.update_scheduler_buttons_gui(True))
             
-            # 스케줄 설정
-            self.log.debug("스케줄러 갱신 스레드 시작")
-            threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
-            
-            # 스케줄러 스레드 시작
-            self.log.debug("스케줄러 메인 스레드 시작")
-            self.schedule_thread = threading.Thread(target=self._run_scheduler)
-            self.schedule_thread.daemon = True
-            self.schedule_thread.start()
-            
-            # 헬스체크 스레드 추가
-            self.schedule_health_check_thread = threading.Thread(target=self._run_health_check, daemon=True)
-            self.schedule_health_check_thread.start()
+            # 타이머 스레드 시작 후 스케줄 등록
+            self.log.debug("스케줄 타이머 시작")
+            self.timer_scheduler.start()
+            threading.Thread(target=self.update_scheduler_safe, kwargs={"catch_up": True}, daemon=True).start()
             
             self.log.info("스케줄러 시작 완료")
             
@@ -1355,83 +4812,119 @@ class MacroRecorder:
             self.log.debug("스케줄러 중지 GUI 업데이트 시작")
             self.safe_gui_update(lambda: self.update_scheduler_buttons_gui(False))
             
-            # 모든 스케줄 작업 취소
+            # 모든 스케줄 작업 취소 후 타이머 스레드 종료
             try:
-                schedule.clear()
+                self.timer_scheduler.clear()
                 self.log.debug("스케줄 작업 모두 취소")
             except Exception as e:
                 self.log.error(f"스케줄 작업 취소 오류: {str(e)}")
-            
-            # 스케줄러 스레드 종료 대기
-            if self.schedule_thread and self.schedule_thread.is_alive():
-                self.log.debug("스케줄러 스레드 종료 대기 중...")
-                self.schedule_thread.join(timeout=2)
-                if self.schedule_thread.is_alive():
-                    self.log.warning("스케줄러 스레드가 정상 종료되지 않음")
-                else:
-                    self.log.debug("스케줄러 스레드 종료 완료")
-            
-            # 헬스체크 스레드 종료 대기
-            if self.schedule_health_check_thread and self.schedule_health_check_thread.is_alive():
-                self.log.debug("헬스체크 스레드 종료 대기 중...")
-                self.schedule_health_check_thread.join(timeout=2)
+            self.timer_scheduler.stop()
             
             self.log.info("스케줄러 중지 완료")
             
         except Exception as e:
             self.log.exception(f"스케줄러 중지 중 오류: {str(e)}")
     
-    def update_scheduler_safe(self):
-        """안전한 스케줄 작업 갱신"""
+    def schedule_overrun_warnings(self, schedules=None, now=None):
+        """매크로 길이가 다음 스케줄 실행까지의 간격보다 긴 스케줄 경고 목록
+
+        매크로 파일 헤더의 요약 정보(길이)와 스케줄의 재생 속도로 실행 시간을 추정하고,
+        각 스케줄의 다음 두 실행 시각을 모아 정렬한 뒤 다음 실행까지의 간격과 비교한다.
+        겹친 실행은 실행 대기열에서 대기하거나 중복 실행 정책에 따라 건너뛴다.
+        """
+        warnings = []
         try:
-            self.log.debug("스케줄러 갱신 시작")
+            if schedules is None:
+                with self.schedule_lock:
+                    schedules = self.schedules.copy()
+            now = time.time() if now is None else now
+            
+            firsts = []
+            fire_times = []
+            for sched in schedules:
+                try:
+                    rule = compile_schedule_rule(sched["time"])
+                except ValueError:
+                    firsts.append(None)
+                    continue
+                first = rule.next_fire(now)
+                second = rule.next_fire(first) if first is not None else None
+                firsts.append(first)
+                fire_times.extend(t for t in (first, second) if t is not None)
+            fire_times.sort()
+            
+            for sched, first in zip(schedules, firsts):
+                macro = self.find_macro(sched["macro"])
+                if macro is None or first is None:
+                    continue
+                index = bisect.bisect_right(fire_times, first)
+                if index == len(fire_times):
+                    continue
+                gap_seconds = fire_times[index] - first
+                options = PlaybackOptions.from_dict(sched.get("playback"))
+                run_seconds = macro["duration_us"] / TIME_UNITS_PER_SECOND / (options.speed if options.speed > 0 else 1.0)
+                if run_seconds > gap_seconds:
+                    warnings.append(
+                        f"'{sched['macro']}' ({sched['time']}) 실행 시간 약 {format_duration(int(run_seconds * TIME_UNITS_PER_SECOND))}"
+                        f"이 다음 실행까지 간격 {format_duration(int(gap_seconds * TIME_UNITS_PER_SECOND))}보다 깁니다")
+        except Exception as e:
+            self.log.error(f"스케줄 실행 시간 검사 오류: {str(e)}")
+        return warnings
+    
+    def register_schedule(self, sched):
+        """스케줄 하나를 타이머에 등록 (같은 ID가 있으면 교체) - 등록되면 True
+
+        매크로 파일 경로는 실행 시점에 이름 색인(macro_index)으로 찾으므로
+        매크로 파일이 바뀌어도 다시 등록할 필요가 없다.
+        """
+        macro_name = sched["macro"]
+        time_str = sched["time"]
+        try:
+            if self.find_macro(macro_name) is None:
+                self.timer_scheduler.remove(sched["id"])
+                self.log.warning(f"매크로 파일을 찾을 수 없음: {macro_name}")
+                return False
+            
+            rule = compile_schedule_rule(time_str)
+            
+            def run_job(due):
+                return self.fire_schedule(sched, due)
+            
+            if self.timer_scheduler.add(sched["id"], rule.next_fire, run_job,
+                                        name=f"{macro_name} [{rule.describe()}]") is None:
+                self.log.warning(f"실행할 시각이 없는 스케줄: {macro_name} ({time_str})")
+                return False
+            self.log.debug(f"스케줄 등록 완료: {macro_name} at {time_str}")
+            return True
             
-            # 기존 스케줄 모두 취소
-            schedule.clear()
-            self.log.debug("기존 스케줄 모두 취소")
+        except ValueError as e:
+            self.log.error(f"실행 규칙 오류 ({time_str}): {str(e)}")
+        except Exception as e:
+            self.log.error(f"개별 스케줄 등록 오류: {str(e)}")
+        return False
+    
+    def update_scheduler_safe(self, catch_up=False):
+        """전체 스케줄을 타이머에 다시 등록 (스케줄러 시작 시) - catch_up이면 이어서 놓친 실행 처리"""
+        try:
+            self.log.debug("스케줄러 갱신 시작")
             
             # 스케줄 목록 복사 (동시성 문제 방지)
             with self.schedule_lock:
                 schedules_copy = self.schedules.copy()
             
-            # 각 스케줄 등록
-            registered_count = 0
-            for sched in schedules_copy:
-                try:
-                    macro_name = sched["macro"]
-                    time_str = sched["time"]
-                    
-                    self.log.debug(f"스케줄 등록 시도: {macro_name} at {time_str}")
-                    
-                    # 매크로 파일 경로 찾기
-                    macro_path = None
-                    for macro in self.recorded_macros:
-                        if macro["name"] == macro_name:
-                            macro_path = macro["path"]
-                            break
-                    
-                    if macro_path and os.path.exists(macro_path):
-                        # 시간 파싱
-                        try:
-                            hour, minute = map(int, time_str.split(":"))
-                            
-                            # 스케줄 등록 (매일 반복) - 더 안정적인 방법 사용
-                            def create_job(path):
-                                return lambda: self.play_macro_scheduled_safe(path)
-                            
-                            schedule.every().day.at(time_str).do(create_job(macro_path))
-                            registered_count += 1
-                            self.log.debug(f"스케줄 등록 완료: {macro_name} at {time_str}")
-                            
-                        except ValueError as e:
-                            self.log.error(f"시간 파싱 오류 ({time_str}): {str(e)}")
-                    else:
-                        self.log.warning(f"매크로 파일을 찾을 수 없음: {macro_name}")
-                        
-                except Exception as e:
-                    self.log.error(f"개별 스케줄 등록 오류: {str(e)}")
+            # 목록에 없는 항목 제거 후 각 스케줄 등록 (기존 항목은 교체되므로 실행 공백 없음)
+            current_ids = {sched["id"] for sched in schedules_copy}
+            for job in self.timer_scheduler.jobs():
+                if job["key"] not in current_ids:
+                    self.timer_scheduler.remove(job["key"])
+            registered_count = sum(1 for sched in schedules_copy if self.register_schedule(sched))
             
             self.log.info(f"스케줄 갱신 완료: {registered_count}/{len(schedules_copy)}개 등록")
+            for warning in self.schedule_overrun_warnings(schedules_copy):
+                self.log.warning(f"스케줄 경고: {warning}")
+            
+            if catch_up:
+                self.catch_up_missed_runs(reason="스케줄러 시작")
             
         except Exception as e:
             self.log.exception(f"스케줄러 갱신 중 오류: {str(e)}")
@@ -1440,12 +4933,22 @@ class MacroRecorder:
         """스케줄 작업 갱신 (기존 호환성)"""
         threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
     
-    def play_macro_scheduled(self, macro_path: str):
+    def play_macro_scheduled(self, macro_path: str, options: Optional[PlaybackOptions] = None,
+                             policy: str = RUN_POLICY_QUEUE):
         """스케줄에 의해 매크로 실행 (기본 버전)"""
-        return self.play_macro_scheduled_safe(macro_path)
+        return self.play_macro_scheduled_safe(macro_path, options, policy)
+    
+    def play_macro_scheduled_safe(self, macro_path: str, options: Optional[PlaybackOptions] = None,
+                                  policy: str = RUN_POLICY_QUEUE):
+        """스케줄에 의해 매크로 실행 (안전한 버전) - 실행 대기열을 통해 순서대로 실행
+
+        policy: 같은 매크로가 이미 실행/대기 중일 때의 처리 (RUN_POLICIES)
+        """
+        return self.submit_scheduled_playback(macro_path, options, policy) == "queued"
     
-    def play_macro_scheduled_safe(self, macro_path: str):
-        """스케줄에 의해 매크로 실행 (안전한 버전) - 여러 스케줄 동시 실행 지원"""
+    def submit_scheduled_playback(self, macro_path: str, options: Optional[PlaybackOptions] = None,
+                                  policy: str = RUN_POLICY_QUEUE):
+        """스케줄 실행 요청 - 결과 코드 반환 (SCHEDULE_OUTCOME_NAMES)"""
         try:
             current_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.log.info(f"[{current_time}] 스케줄된 매크로 실행 시작: {macro_path}")
@@ -1453,100 +4956,159 @@ class MacroRecorder:
             # 매크로 파일 존재 확인
             if not os.path.exists(macro_path):
                 self.log.error(f"매크로 파일이 존재하지 않음: {macro_path}")
-                return False
-            
-            # 별도 스레드에서 매크로 실행 (여러 스케줄 동시 실행 가능)
-            def execute_macro():
-                try:
-                    macro_name = os.path.basename(macro_path)[:-5]  # .json 제거
-                    self.log.info(f"스케줄된 매크로 '{macro_name}' 실행 중...")
-                    
-                    self.play_macro(macro_path)
-                    
-                    next_run = datetime.datetime.now() + datetime.timedelta(days=1)
-                    self.log.info(f"스케줄된 매크로 '{macro_name}' 실행 완료. 다음 실행: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                except Exception as e:
-                    self.log.exception(f"스케줄된 매크로 실행 중 오류: {str(e)}")
+                return "missing"
             
-            # 각 스케줄마다 독립적인 스레드에서 실행 (동시 실행 보장)
-            macro_thread = threading.Thread(target=execute_macro, daemon=True)
-            macro_thread.start()
-            
-            return True
+            # 실행 대기열에 추가 (입력 장치는 한 번에 하나의 매크로만 사용)
+            macro_name = os.path.splitext(os.path.basename(macro_path))[0]
+            result = self.submit_playback(macro_path, macro_name, options or PlaybackOptions(),
+                                          PRIORITY_SCHEDULED, policy)
+            self.log.info(f"스케줄된 매크로 '{macro_name}' 실행 요청: {result} "
+                          f"(정책: {RUN_POLICY_NAMES.get(policy, policy)}) - {self.execution_scheduler.describe()}")
+            return result
             
         except Exception as e:
             self.log.exception(f"스케줄된 매크로 실행 오류: {str(e)}")
-            return False
+            return "error"
     
-    def _run_scheduler(self):
-        """스케줄러 실행 루프 (개선된 버전)"""
-        self.log.info("스케줄러 루프 시작")
-        
-        consecutive_errors = 0
-        max_consecutive_errors = 10
-        
-        while self.is_schedule_running:
-            try:
-                # 예약된 작업 실행
-                schedule.run_pending()
-                consecutive_errors = 0  # 성공 시 오류 카운터 리셋
-                
-                # CPU 사용량 감소
-                time.sleep(1)
-                
-            except Exception as e:
-                consecutive_errors += 1
-                self.log.error(f"스케줄러 루프 오류 ({consecutive_errors}/{max_consecutive_errors}): {str(e)}")
-                
-                # 연속 오류가 너무 많으면 더 긴 대기
-                if consecutive_errors >= max_consecutive_errors:
-                    self.log.warning(f"연속 오류 {max_consecutive_errors}회 발생. 60초 대기 후 재시작...")
-                    time.sleep(60)
-                    consecutive_errors = 0
-                    
-                    # 스케줄 재등록 시도
-                    try:
-                        threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
-                        self.log.info("스케줄 재등록 시도 완료")
-                    except Exception as re_error:
-                        self.log.error(f"스케줄 재등록 실패: {str(re_error)}")
-                else:
-                    time.sleep(5)  # 오류 시 잠시 대기
+    def fire_schedule(self, sched, due, catchup=False):
+        """스케줄 한 회차 실행 요청 (due: 예정 시각, epoch 초) - 실행 기록 (스케줄, 실행 시각, 결과) 반환
+
+        타이머 콜백에서 호출되며, 반환한 실행 기록은 타이머가 같은 묶음의 다른 기록과 함께
+        on_batch(record_schedule_runs)로 넘겨 저널에 한 번에 기록한다.
+        """
+        if catchup:
+            with self.schedule_lock:
+                if not any(s["id"] == sched["id"] for s in self.schedules):
+                    self.log.info(f"삭제된 스케줄의 따라잡기 실행 생략: {sched['macro']}")
+                    return None
         
-        self.log.info("스케줄러 루프 종료")
+        macro = self.find_macro(sched["macro"])
+        if macro is None:
+            self.log.error(f"스케줄된 매크로를 찾을 수 없음: {sched['macro']}")
+            outcome = "missing"
+        else:
+            outcome = self.submit_scheduled_playback(macro["path"], PlaybackOptions.from_dict(sched.get("playback")),
+                                                     sched.get("policy", RUN_POLICY_QUEUE))
+        return sched, due, outcome
     
-    def _run_health_check(self):
-        """스케줄러 헬스체크 (매 10분마다 스케줄 상태 확인)"""
-        self.log.info("스케줄러 헬스체크 시작")
-        
-        while self.is_schedule_running:
-            try:
-                time.sleep(600)  # 10분 대기
-                
-                if not self.is_schedule_running:
-                    break
-                
-                # 현재 등록된 스케줄 수 확인
-                current_jobs = len(schedule.jobs)
-                expected_jobs = len(self.schedules)
-                
-                self.log.debug(f"헬스체크: 현재 작업 {current_jobs}개, 예상 작업 {expected_jobs}개")
-                
-                # 스케줄이 누락된 경우 재등록
-                if current_jobs != expected_jobs:
-                    self.log.warning(f"스케줄 불일치 감지. 재등록 시도...")
-                    threading.Thread(target=self.update_scheduler_safe, daemon=True).start()
+    def record_schedule_runs(self, runs):
+        """[(스케줄, 실행 시각, 결과), ...]를 스케줄 항목에 반영하고 저널에 한 번에 기록"""
+        try:
+            updates = []
+            with self.schedule_lock:
+                for sched, fire_time, outcome in runs:
+                    changes = {"last_fire": round(max(fire_time, sched.get("last_fire") or 0.0), 3),
+                               "last_outcome": outcome}
+                    sched.update(changes)
+                    updates.append((sched["id"], changes))
+                self.schedule_store.update_many(updates)
+                if self.schedule_store.needs_compaction(len(self.schedules)):
+                    self.schedule_store.compact(self.schedules)
+            
+            ids = [schedule_id for schedule_id, _ in updates]
+            self.safe_gui_update(lambda: self.update_schedule_rows(ids))
+            
+        except Exception as e:
+            self.log.exception(f"스케줄 실행 기록 중 오류: {str(e)}")
+    
+    def schedule_anchor(self, sched):
+        """놓친 실행을 계산할 기준 시각 - 마지막 실행 시각, 없으면 생성 시각 (epoch 초)"""
+        if sched.get("last_fire"):
+            return float(sched["last_fire"])
+        try:
+            return datetime.datetime.strptime(sched["created"], "%Y-%m-%d %H:%M:%S").timestamp()
+        except (KeyError, ValueError):
+            return None
+    
+    def catch_up_missed_runs(self, schedule_ids=None, now=None, reason=""):
+        """마지막 실행 이후 놓친 회차를 한꺼번에 계산해 스케줄별 catchup 정책 적용
+
+        건너뜀은 기록만 하고, 한 번 실행은 1회, 모두 실행은 최대 catchup_max_runs회를
+        catchup_spacing초 간격의 일회성 타이머 항목으로 예약한다 (한 번에 최대 catchup_max_total회).
+        스케줄마다 놓친 회차를 최대 catchup_max_runs + 1개까지만 세므로 오래 꺼져 있었어도 빠르다.
+        놓친 회차가 있던 스케줄 수를 반환한다.
+        """
+        try:
+            now = time.time() if now is None else now
+            with self.schedule_lock:
+                schedules = [sched for sched in self.schedules
+                             if schedule_ids is None or sched["id"] in schedule_ids]
+            
+            runs = []
+            planned = []
+            budget = self.catchup_max_total
+            limited = 0
+            for sched in schedules:
+                anchor = self.schedule_anchor(sched)
+                if anchor is None or anchor >= now:
+                    continue
+                try:
+                    rule = compile_schedule_rule(sched["time"])
+                except ValueError:
+                    continue
+                # 모두 실행이 아니면 놓친 회차가 하나인지 여럿인지만 구분
+                policy = sched.get("catchup", CATCHUP_SKIP)
+                limit = self.catchup_max_runs if policy == CATCHUP_ALL else 1
+                missed = rule.fires_between(anchor, now, limit + 1)
+                if not missed:
+                    continue
                 
-                # 다음 실행 예정 시간 로그
-                if schedule.jobs:
-                    next_run = schedule.next_run()
-                    if next_run:
-                        self.log.debug(f"다음 스케줄 실행 예정: {next_run}")
+                truncated = len(missed) > limit
+                wanted = {CATCHUP_ONCE: 1, CATCHUP_ALL: min(len(missed), self.catchup_max_runs)}.get(policy, 0)
+                count = min(wanted, budget)
+                budget -= count
+                limited += wanted - count
                 
-            except Exception as e:
-                self.log.error(f"헬스체크 오류: {str(e)}")
-        
-        self.log.info("스케줄러 헬스체크 종료")
+                self.log.info(f"놓친 실행: {sched['macro']} ({sched['time']}) "
+                              f"{len(missed) - 1 if truncated else len(missed)}회{' 이상' if truncated else ''} - "
+                              f"{CATCHUP_POLICY_NAMES.get(policy, policy)}"
+                              + (f", {count}회 따라잡기 예약" if count else "")
+                              + (f" (한도 초과로 {wanted - count}회 생략)" if wanted > count else ""))
+                runs.append((sched, now if truncated else missed[-1], "missed"))
+                if count:
+                    planned.append((sched, count))
+            
+            if not runs:
+                return 0
+            
+            # 놓친 회차를 먼저 기록해 두어 다시 시작해도 중복 계산하지 않음
+            self.record_schedule_runs(runs)
+            scheduled = sum(self.schedule_catchup_runs(sched, count) for sched, count in planned)
+            
+            self.catchup_stats["passes"] += 1
+            self.catchup_stats["schedules"] += len(runs)
+            self.catchup_stats["scheduled"] += scheduled
+            self.catchup_stats["limited"] += limited
+            self.log.warning(f"놓친 실행 처리 ({reason}): 스케줄 {len(runs)}개, 따라잡기 {scheduled}회 예약"
+                             + (f", 한도 초과 {limited}회 생략" if limited else ""))
+            return len(runs)
+            
+        except Exception as e:
+            self.log.exception(f"놓친 실행 처리 중 오류: {str(e)}")
+            return 0
+    
+    def schedule_catchup_runs(self, sched, count):
+        """따라잡기 실행 count회를 catchup_spacing초 간격으로 예약 - 예약한 횟수 반환"""
+        scheduled = 0
+        for _ in range(count):
+            slot = max(time.time() + 1.0, self.catchup_next_slot)
+            self.catchup_next_slot = slot + self.catchup_spacing
+            
+            def run_catchup(due, sched=sched):
+                return self.fire_schedule(sched, due, catchup=True)
+            
+            if self.timer_scheduler.add(("catchup", sched["id"], slot), one_shot_fire(slot), run_catchup,
+                                        name=f"{sched['macro']} [따라잡기]") is not None:
+                scheduled += 1
+        return scheduled
+    
+    def on_schedule_runs_missed(self, missed):
+        """타이머가 절전/시계 변경으로 놓친 회차를 넘겨줄 때 (타이머 스레드에서 호출)"""
+        schedule_ids = {key for key, _ in missed if not isinstance(key, tuple)}
+        if len(schedule_ids) < len(missed):
+            self.log.warning(f"놓친 따라잡기 실행 {len(missed) - len(schedule_ids)}건 생략")
+        if schedule_ids:
+            self.catch_up_missed_runs(schedule_ids, reason="절전/시계 변경")
     
     def update_macro_list(self):
         """매크로 목록 업데이트"""
@@ -1560,18 +5122,98 @@ class MacroRecorder:
             for item in self.macro_treeview.get_children():
                 self.macro_treeview.delete(item)
                 
-            # 매크로 목록 데이터 추가
+            # 매크로 목록 데이터 추가 (항목 ID = 매크로 이름)
             for macro in self.recorded_macros:
-                self.macro_treeview.insert("", tk.END, values=(
-                    macro["name"],
-                    macro["created"]
-                ))
+                self.macro_treeview.insert("", tk.END, iid=macro["name"], values=self.macro_row_values(macro))
             
             self.log.debug(f"매크로 목록 업데이트 완료: {len(self.recorded_macros)}개")
             
         except Exception as e:
             self.log.error(f"매크로 목록 업데이트 오류: {str(e)}")
     
+    def macro_row_values(self, macro):
+        """매크로 목록 행 표시 값"""
+        return (macro["name"], macro["event_count"], format_duration(macro["duration_us"]),
+                describe_macro_summary(macro.get("summary")), macro["created"])
+    
+    def update_macro_rows(self, names):
+        """바뀐 매크로 행만 추가/수정/삭제 (GUI 스레드)"""
+        try:
+            if not self.root or not self.root.winfo_exists():
+                return
+            
+            treeview = self.macro_treeview
+            for name in names:
+                macro = self.macro_index.get(name)
+                if macro is None:
+                    if treeview.exists(name):
+                        treeview.delete(name)
+                elif treeview.exists(name):
+                    treeview.item(name, values=self.macro_row_values(macro))
+                else:
+                    # 이름순 위치에 삽입
+                    position = bisect.bisect_left(treeview.get_children(), name)
+                    treeview.insert("", position, iid=name, values=self.macro_row_values(macro))
+            
+            self.log.debug(f"매크로 목록 부분 업데이트: {len(names)}개")
+            
+        except Exception as e:
+            self.log.error(f"매크로 목록 부분 업데이트 오류: {str(e)}")
+    
+    def describe_schedule_rule(self, expression):
+        """스케줄 목록 표시용 실행 규칙"""
+        try:
+            rule = compile_schedule_rule(expression)
+            return expression if rule.kind == "times" and rule.weekday_mask == ALL_WEEKDAYS and not rule.excluded \
+                else f"{expression} ({rule.describe()})"
+        except ValueError:
+            return f"{expression} (오류)"
+    
+    def describe_next_fire(self, expression, now=None):
+        """스케줄 목록 표시용 다음 실행 시각"""
+        try:
+            fire = compile_schedule_rule(expression).next_fire(time.time() if now is None else now)
+        except ValueError:
+            return "-"
+        return datetime.datetime.fromtimestamp(fire).strftime("%m-%d %H:%M:%S") if fire is not None else "없음"
+    
+    def describe_last_run(self, sched):
+        """스케줄 목록 표시용 마지막 실행 시각과 결과"""
+        if not sched.get("last_fire"):
+            return "-"
+        outcome = sched.get("last_outcome")
+        return (datetime.datetime.fromtimestamp(sched["last_fire"]).strftime("%m-%d %H:%M:%S")
+                + f" {SCHEDULE_OUTCOME_NAMES.get(outcome, outcome or '')}")
+    
+    def schedule_row_values(self, sched, now=None):
+        return (
+            sched["macro"],
+            self.describe_schedule_rule(sched["time"]),
+            self.describe_next_fire(sched["time"], now),
+            self.describe_last_run(sched),
+            PlaybackOptions.from_dict(sched.get("playback")).describe(),
+            RUN_POLICY_NAMES.get(sched.get("policy", RUN_POLICY_QUEUE), RUN_POLICY_QUEUE),
+            CATCHUP_POLICY_NAMES.get(sched.get("catchup", CATCHUP_SKIP), CATCHUP_SKIP),
+            sched["created"],
+            sched["id"]
+        )
+    
+    def update_schedule_rows(self, schedule_ids):
+        """실행 기록이 바뀐 스케줄 행만 갱신"""
+        try:
+            if not self.root or not self.root.winfo_exists():
+                return
+            
+            now = time.time()
+            wanted = set(schedule_ids)
+            with self.schedule_lock:
+                for sched in self.schedules:
+                    if sched["id"] in wanted and self.schedule_treeview.exists(sched["id"]):
+                        self.schedule_treeview.item(sched["id"], values=self.schedule_row_values(sched, now))
+                        
+        except Exception as e:
+            self.log.error(f"스케줄 행 업데이트 오류: {str(e)}")
+    
     def update_schedule_list(self):
         """스케줄 목록 업데이트"""
         try:
@@ -1584,15 +5226,12 @@ class MacroRecorder:
             for item in self.schedule_treeview.get_children():
                 self.schedule_treeview.delete(item)
                 
-            # 스케줄 목록 데이터 추가
+            # 스케줄 목록 데이터 추가 (항목 ID = 스케줄 ID)
             with self.schedule_lock:
+                now = time.time()
                 for sched in self.schedules:
-                    self.schedule_treeview.insert("", tk.END, values=(
-                        sched["macro"],
-                        sched["time"],
-                        sched["created"],
-                        sched["id"]
-                    ))
+                    self.schedule_treeview.insert("", tk.END, iid=sched["id"],
+                                                  values=self.schedule_row_values(sched, now))
             
             self.log.debug(f"스케줄 목록 업데이트 완료: {len(self.schedules)}개")
             
@@ -1604,43 +5243,107 @@ class MacroRecorder:
         try:
             # 현재 스케줄 상태 정보
             scheduled_jobs_info = []
-            if schedule.jobs:
-                for job in schedule.jobs:
-                    next_run = job.next_run.strftime("%Y-%m-%d %H:%M:%S") if job.next_run else "없음"
+            timer_jobs = self.timer_scheduler.jobs()
+            if timer_jobs:
+                for job in timer_jobs:
+                    next_run = datetime.datetime.fromtimestamp(job["due"])
                     time_until = ""
-                    if job.next_run:
-                        delta = job.next_run - datetime.datetime.now()
-                        total_seconds = int(delta.total_seconds())
-                        if total_seconds > 0:
-                            hours = total_seconds // 3600
-                            minutes = (total_seconds % 3600) // 60
-                            seconds = total_seconds % 60
-                            time_until = f" ({hours}시간 {minutes}분 {seconds}초 후)"
+                    total_seconds = int(job["due"] - time.time())
+                    if total_seconds > 0:
+                        hours = total_seconds // 3600
+                        minutes = (total_seconds % 3600) // 60
+                        seconds = total_seconds % 60
+                        time_until = f" ({hours}시간 {minutes}분 {seconds}초 후)"
+                    lateness = (f", 실행 {job['fired']}회 최근 지연 {job['last_lateness_ms']}ms"
+                                f" 최대 {job['max_lateness_ms']}ms" if job["fired"] else "")
                     
-                    scheduled_jobs_info.append(f"  - {str(job)}: {next_run}{time_until}")
+                    scheduled_jobs_info.append(f"  - {job['name']}: {next_run.strftime('%Y-%m-%d %H:%M:%S')}"
+                                               f"{time_until}{lateness}")
             else:
                 scheduled_jobs_info.append("  - 등록된 작업 없음")
             
             # 테스트 모드 상태
             test_mode_status = "비활성"
             
+            # 녹화 링 버퍼 상태
+            if self.event_buffer:
+                stats = self.event_buffer.stats()
+                buffer_info = (f"기록 {stats['written']}, 유실 {stats['dropped']}, "
+                               f"오버플로 {stats['overflows']}회, 최대 적재 {stats['high_water']}/{stats['capacity']}")
+            else:
+                buffer_info = "사용 전"
+            
+            # 클릭 엔진 방법별 통계 (SendInput 배치가 실패했을 때의 대체 경로만 집계됨)
+            click_stats = self.click_engine.stats()
+            click_info = "".join(
+                f", {method} {click_stats[method]['successes']}/{click_stats[method]['attempts']}회"
+                f" 평균 {click_stats[method]['avg_latency_ms']}ms"
+                for method in ClickEngine.METHODS if click_stats[method]['attempts'])
+            click_info = (f"대체 경로 우선 {click_stats['preferred'] or '미정'}{click_info}" if click_info
+                          else "대체 경로 사용 안 함 (SendInput 배치)")
+            
+            # 실행 대기열 상태
+            exec_stats = self.execution_scheduler.stats()
+            exec_info = (f"{self.execution_scheduler.describe()}, 완료 {exec_stats['completed']}, "
+                         f"실패 {exec_stats['failed']}, 건너뜀 {exec_stats['skipped']}, "
+                         f"교체 {exec_stats['replaced']}, 버림 {exec_stats['dropped']}")
+            
+            # 선택한 매크로 요약 (파일 헤더에서 읽은 값)
+            macro_info = "없음"
+            if self.selected_macro is not None:
+                macro = self.find_macro(self.selected_macro["name"]) or self.selected_macro
+                summary = macro.get("summary") or {}
+                bbox = summary.get("bbox")
+                macro_info = (f"{macro['name']} ({macro.get('format')}, 이벤트 {macro.get('event_count')}개, "
+                              f"길이 {format_duration(macro.get('duration_us', 0))}, "
+                              f"종류별 {summary.get('histogram', {})}, "
+                              f"좌표 범위 {tuple(bbox) if bbox else '없음'}, 키 {summary.get('keys', [])})")
+            
+            # 스케줄 실행 규칙 (최대 20개)
+            with self.schedule_lock:
+                schedules_copy = self.schedules.copy()
+            rule_lines = [f"  - {sched['macro']}: {self.describe_schedule_rule(sched['time'])}"
+                          f" → 다음 {self.describe_next_fire(sched['time'])}, 최근 {self.describe_last_run(sched)}"
+                          f", 놓친 실행 {CATCHUP_POLICY_NAMES.get(sched.get('catchup', CATCHUP_SKIP), CATCHUP_SKIP)}"
+                          for sched in schedules_copy[:20]]
+            if len(schedules_copy) > 20:
+                rule_lines.append(f"  ... 외 {len(schedules_copy) - 20}개")
+            
+            # 스케줄 실행 시간 경고
+            overrun_warnings = self.schedule_overrun_warnings(schedules_copy)
+            
             info = f"""
 디버그 정보:
 - 관리자 권한: {'예' if ctypes.windll.shell32.IsUserAnAdmin() else '아니오'}
 - 현재 후킹 방법: {self.hook_method}
-- 녹화된 이벤트 수: {len(self.current_events) if self.current_events else 0}
-- 스케줄 수: {len(self.schedules)}
-- 등록된 스케줄 작업 수: {len(schedule.jobs)}
+- 녹화된 이벤트 수: {self.recorded_event_count()}
+- 링 버퍼: {buffer_info}
+- 클릭 방법: {click_info}
+- 실행 대기열: {exec_info}
+- 매크로 수: {len(self.macro_index)} (색인)
+- 선택한 매크로: {macro_info}
+- 스케줄 수: {len(self.schedules)} (저널 레코드 {self.schedule_store.record_count}개, 압축 {self.schedule_store.compactions}회)
+- 스케줄 타이머: {self.timer_scheduler.describe()}, 깨어남 {self.timer_scheduler.stats()['wakeups']}회
+- 놓친 실행 처리: {self.catchup_stats['passes']}회, 스케줄 {self.catchup_stats['schedules']}개, 따라잡기 {self.catchup_stats['scheduled']}회 예약, 한도 초과 생략 {self.catchup_stats['limited']}회
 - 스케줄러 실행 중: {'예' if self.is_schedule_running else '아니오'}
 - 녹화 중: {'예' if self.is_recording else '아니오'}
 - 현재 시간: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
+스케줄 실행 규칙:
+{chr(10).join(rule_lines) or "  - 없음"}
+
 현재 등록된 스케줄 작업:
 {chr(10).join(scheduled_jobs_info)}
 
+스케줄 경고:
+{chr(10).join(f"  - {warning}" for warning in overrun_warnings) or "  - 없음"}
+
 스케줄 사용법:
-- 19:30으로 등록하면 매일 19:30에 실행됩니다
-- 여러 스케줄을 등록해도 모두 정상 작동합니다
+- 19:30으로 등록하면 매일 19:30에 실행됩니다 (09:00,18:00 처럼 여러 시각 가능)
+- every 5m 09:00-18:00 : 09:00~18:00 사이 5분마다 (s/m/h 단위)
+- */10 9-17 * * 1-5 : cron (분 시 일 월 요일), 일에 L=말일, LW=마지막 평일
+- 뒤에 @mon-fri / @평일 (요일 제한), !2026-12-25 (제외 날짜)를 붙일 수 있습니다
+- 같은 시각의 스케줄은 실행 대기열에서 순서대로 하나씩 실행됩니다
 
 핫키 상태:
 - F11: 녹화 시작/중지
@@ -1648,16 +5351,15 @@ class MacroRecorder:
 """
             
             # 다음 스케줄 실행 시간
-            if schedule.jobs:
-                next_run = schedule.next_run()
-                if next_run:
-                    delta = next_run - datetime.datetime.now()
-                    total_seconds = int(delta.total_seconds())
-                    if total_seconds > 0:
-                        hours = total_seconds // 3600
-                        minutes = (total_seconds % 3600) // 60
-                        seconds = total_seconds % 60
-                        info += f"\n⏰ 다음 실행: {next_run.strftime('%H:%M:%S')} ({hours}시간 {minutes}분 {seconds}초 후)"
+            next_due = self.timer_scheduler.next_due()
+            if next_due is not None:
+                next_run = datetime.datetime.fromtimestamp(next_due)
+                total_seconds = int(next_due - time.time())
+                if total_seconds > 0:
+                    hours = total_seconds // 3600
+                    minutes = (total_seconds % 3600) // 60
+                    seconds = total_seconds % 60
+                    info += f"\n⏰ 다음 실행: {next_run.strftime('%H:%M:%S')} ({hours}시간 {minutes}분 {seconds}초 후)"
             
             self.log.info("디버그 정보 표시됨")
             messagebox.showinfo("디버그 정보", info)
@@ -1752,6 +5454,11 @@ class MacroRecorder:
             self.macro_name_entry = ttk.Entry(macro_name_frame, width=30)
             self.macro_name_entry.pack(side=tk.LEFT, padx=5)
             
+            ttk.Label(macro_name_frame, text="경로 허용 오차(px):").pack(side=tk.LEFT, padx=5)
+            self.simplify_tolerance_var = tk.StringVar(value=str(self.default_simplify_tolerance))
+            self.simplify_tolerance_var.trace_add("write", self.on_simplify_tolerance_changed)
+            ttk.Entry(macro_name_frame, textvariable=self.simplify_tolerance_var, width=6).pack(side=tk.LEFT, padx=5)
+            
             # 녹화 제어 버튼
             record_frame = ttk.Frame(macro_tab)
             record_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -1803,15 +5510,21 @@ class MacroRecorder:
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
             
             # Treeview 생성
-            self.macro_treeview = ttk.Treeview(macro_list_frame, columns=("name", "created"),
+            self.macro_treeview = ttk.Treeview(macro_list_frame, columns=("name", "events", "duration", "summary", "created"),
                                              show="headings", yscrollcommand=scrollbar.set)
             self.macro_treeview.pack(fill=tk.BOTH, expand=True)
             scrollbar.config(command=self.macro_treeview.yview)
             
             # 열 설정
             self.macro_treeview.heading("name", text="매크로 이름")
+            self.macro_treeview.heading("events", text="이벤트 수")
+            self.macro_treeview.heading("duration", text="길이")
+            self.macro_treeview.heading("summary", text="내용")
             self.macro_treeview.heading("created", text="생성 시간")
             self.macro_treeview.column("name", width=200)
+            self.macro_treeview.column("events", width=80)
+            self.macro_treeview.column("duration", width=80)
+            self.macro_treeview.column("summary", width=220)
             self.macro_treeview.column("created", width=150)
             
             # 매크로 선택 이벤트
@@ -1825,6 +5538,37 @@ class MacroRecorder:
                      command=self.on_play_macro).pack(side=tk.LEFT, padx=5)
             ttk.Button(macro_control_frame, text="매크로 삭제", 
                      command=self.on_delete_macro).pack(side=tk.LEFT, padx=5)
+            ttk.Button(macro_control_frame, text="일시정지", 
+                     command=self.pause_playback).pack(side=tk.LEFT, padx=5)
+            ttk.Button(macro_control_frame, text="재개", 
+                     command=self.resume_playback).pack(side=tk.LEFT, padx=5)
+            ttk.Button(macro_control_frame, text="재생 취소", 
+                     command=self.on_cancel_playback).pack(side=tk.LEFT, padx=5)
+            
+            ttk.Label(macro_control_frame, text="타이밍:").pack(side=tk.LEFT, padx=5)
+            self.timing_mode_var = tk.StringVar(value=self.timing_mode)
+            self.timing_mode_var.trace_add("write", self.on_timing_mode_changed)
+            ttk.Combobox(macro_control_frame, textvariable=self.timing_mode_var, values=TIMING_MODES,
+                         state="readonly", width=12).pack(side=tk.LEFT, padx=5)
+            
+            # 재생 옵션 (매크로 실행 및 새 스케줄에 적용)
+            playback_frame = ttk.Frame(macro_tab)
+            playback_frame.pack(fill=tk.X, padx=5, pady=5)
+            
+            ttk.Label(playback_frame, text="재생 속도(배):").pack(side=tk.LEFT, padx=5)
+            self.playback_speed_var = tk.StringVar(value="1.0")
+            ttk.Entry(playback_frame, textvariable=self.playback_speed_var, width=6).pack(side=tk.LEFT, padx=5)
+            
+            ttk.Label(playback_frame, text="최대 대기(ms):").pack(side=tk.LEFT, padx=5)
+            self.playback_max_gap_var = tk.StringVar(value="")
+            ttk.Entry(playback_frame, textvariable=self.playback_max_gap_var, width=8).pack(side=tk.LEFT, padx=5)
+            
+            self.playback_fast_moves_var = tk.BooleanVar(value=False)
+            ttk.Checkbutton(playback_frame, text="이동 대기 생략 (클릭 직전 제외)",
+                            variable=self.playback_fast_moves_var).pack(side=tk.LEFT, padx=5)
+            
+            for var in (self.playback_speed_var, self.playback_max_gap_var, self.playback_fast_moves_var):
+                var.trace_add("write", self.on_playback_options_changed)
             
             # 스케줄 관리 탭 내용
             schedule_macro_frame = ttk.Frame(schedule_tab)
@@ -1836,10 +5580,22 @@ class MacroRecorder:
             schedule_time_frame = ttk.Frame(schedule_tab)
             schedule_time_frame.pack(fill=tk.X, padx=5, pady=5)
             
-            ttk.Label(schedule_time_frame, text="실행 시간 (HH:MM):").pack(side=tk.LEFT, padx=5)
-            self.schedule_time_entry = ttk.Entry(schedule_time_frame, width=10)
+            ttk.Label(schedule_time_frame, text="실행 규칙 (HH:MM / every 5m / cron):").pack(side=tk.LEFT, padx=5)
+            self.schedule_time_entry = ttk.Entry(schedule_time_frame, width=28)
             self.schedule_time_entry.pack(side=tk.LEFT, padx=5)
             
+            ttk.Label(schedule_time_frame, text="중복 실행:").pack(side=tk.LEFT, padx=5)
+            self.schedule_policy_var = tk.StringVar(value=RUN_POLICY_NAMES[RUN_POLICY_QUEUE])
+            ttk.Combobox(schedule_time_frame, textvariable=self.schedule_policy_var,
+                         values=[RUN_POLICY_NAMES[p] for p in RUN_POLICIES],
+                         state="readonly", width=8).pack(side=tk.LEFT, padx=5)
+            
+            ttk.Label(schedule_time_frame, text="놓친 실행:").pack(side=tk.LEFT, padx=5)
+            self.schedule_catchup_var = tk.StringVar(value=CATCHUP_POLICY_NAMES[CATCHUP_SKIP])
+            ttk.Combobox(schedule_time_frame, textvariable=self.schedule_catchup_var,
+                         values=[CATCHUP_POLICY_NAMES[p] for p in CATCHUP_POLICIES],
+                         state="readonly", width=10).pack(side=tk.LEFT, padx=5)
+            
             ttk.Button(schedule_time_frame, text="스케줄 추가", 
                      command=self.on_add_schedule).pack(side=tk.LEFT, padx=20)
             
@@ -1855,7 +5611,8 @@ class MacroRecorder:
             
             # Treeview 생성
             self.schedule_treeview = ttk.Treeview(schedule_list_frame, 
-                                               columns=("macro", "time", "created", "id"),
+                                               columns=("macro", "time", "next", "last", "playback", "policy", "catchup",
+                                                        "created", "id"),
                                                show="headings", 
                                                yscrollcommand=schedule_scrollbar.set)
             self.schedule_treeview.pack(fill=tk.BOTH, expand=True)
@@ -1863,12 +5620,22 @@ class MacroRecorder:
             
             # 열 설정
             self.schedule_treeview.heading("macro", text="매크로 이름")
-            self.schedule_treeview.heading("time", text="실행 시간")
+            self.schedule_treeview.heading("time", text="실행 규칙")
+            self.schedule_treeview.heading("next", text="다음 실행")
+            self.schedule_treeview.heading("last", text="최근 실행")
+            self.schedule_treeview.heading("playback", text="재생 옵션")
+            self.schedule_treeview.heading("policy", text="중복 실행")
+            self.schedule_treeview.heading("catchup", text="놓친 실행")
             self.schedule_treeview.heading("created", text="생성 시간")
             self.schedule_treeview.heading("id", text="ID")
             
-            self.schedule_treeview.column("macro", width=200)
-            self.schedule_treeview.column("time", width=100)
+            self.schedule_treeview.column("macro", width=160)
+            self.schedule_treeview.column("time", width=200)
+            self.schedule_treeview.column("next", width=110)
+            self.schedule_treeview.column("last", width=150)
+            self.schedule_treeview.column("playback", width=150)
+            self.schedule_treeview.column("policy", width=70)
+            self.schedule_treeview.column("catchup", width=80)
             self.schedule_treeview.column("created", width=150)
             self.schedule_treeview.column("id", width=0, stretch=tk.NO)  # ID 열 숨김
             
@@ -1893,6 +5660,9 @@ class MacroRecorder:
             self.log.debug("스케줄러 중지 버튼 생성 완료")
             
             ttk.Label(schedule_status_frame, textvariable=self.scheduler_status).pack(side=tk.LEFT, padx=20)
+            
+            self.execution_status_var = tk.StringVar(value=self.execution_scheduler.describe())
+            ttk.Label(schedule_status_frame, textvariable=self.execution_status_var).pack(side=tk.LEFT, padx=10)
             self.log.debug("스케줄러 상태 라벨 생성 완료")
             
             # 상태 표시줄
@@ -1912,8 +5682,13 @@ class MacroRecorder:
             self.log.info("GUI 초기화 완료")
             
             # 시작 알림 표시
-            self.show_recording_notification("매크로 프로그램 시작", 
-                "전역 핫키가 활성화되었습니다!\nF11: 녹화 시작/중지\nF12: 녹화 중지")
+            start_message = "전역 핫키가 활성화되었습니다!\nF11: 녹화 시작/중지\nF12: 녹화 중지"
+            if self.recovered_macros:
+                start_message += f"\n중단된 녹화 {len(self.recovered_macros)}개를 복구했습니다."
+            self.show_recording_notification("매크로 프로그램 시작", start_message)
+            
+            # 재생 진행 표시 주기 갱신 시작
+            self.root.after(self.progress_interval_ms, self.poll_playback_progress)
             
             # 메인 루프 시작
             self.root.mainloop()
@@ -1939,6 +5714,35 @@ class MacroRecorder:
         except Exception as e:
             self.log.exception(f"녹화 시작 버튼 이벤트 오류: {str(e)}")
     
+    def on_simplify_tolerance_changed(self, *args):
+        """경로 허용 오차 입력 변경 (메인 스레드에서 값을 읽어 캐시)"""
+        try:
+            value = float(self.simplify_tolerance_var.get())
+            if value >= 0:
+                self.simplify_tolerance = value
+        except ValueError:
+            pass
+    
+    def on_timing_mode_changed(self, *args):
+        """재생 타이밍 모드 변경"""
+        mode = self.timing_mode_var.get()
+        if mode in TIMING_MODES:
+            self.timing_mode = mode
+            self.log.debug(f"재생 타이밍 모드 변경: {mode}")
+    
+    def on_playback_options_changed(self, *args):
+        """재생 옵션 입력 변경 (메인 스레드에서 값을 읽어 캐시)"""
+        try:
+            speed = float(self.playback_speed_var.get() or 1.0)
+            max_gap_text = self.playback_max_gap_var.get().strip()
+            max_gap_ms = int(max_gap_text) if max_gap_text else None
+            if speed <= 0 or (max_gap_ms is not None and max_gap_ms < 0):
+                return
+            self.playback_options = PlaybackOptions(speed, max_gap_ms, self.playback_fast_moves_var.get())
+            self.log.debug(f"재생 옵션 변경: {self.playback_options.describe()}")
+        except (ValueError, tk.TclError):
+            pass
+    
     def on_macro_selected(self, event):
         """매크로 목록에서 선택했을 때"""
         try:
@@ -1956,12 +5760,11 @@ class MacroRecorder:
                 
             macro_name = values[0]
             # 선택된 매크로 찾기
-            for macro in self.recorded_macros:
-                if macro["name"] == macro_name:
-                    self.selected_macro = macro
-                    self.selected_macro_var.set(macro_name)
-                    self.log.debug(f"매크로 선택됨: {macro_name}")
-                    break
+            macro = self.find_macro(macro_name)
+            if macro is not None:
+                self.selected_macro = macro
+                self.selected_macro_var.set(macro_name)
+                self.log.debug(f"매크로 선택됨: {macro_name}")
         except Exception as e:
             self.log.exception(f"매크로 선택 이벤트 오류: {str(e)}")
 
@@ -1979,18 +5782,28 @@ class MacroRecorder:
             values = self.macro_treeview.item(item, "values")
             macro_name = values[0]
             
-            # 선택된 매크로 찾기
-            for macro in self.recorded_macros:
-                if macro["name"] == macro_name:
-                    self.log.info(f"매크로 실행 시작: {macro_name}")
-                    threading.Thread(
-                        target=self.play_macro,
-                        args=(macro["path"],),
-                        daemon=True
-                    ).start()
-                    break
+            # 선택된 매크로 찾기 (수동 실행은 스케줄 실행보다 먼저, 같은 매크로 중복 실행은 건너뜀)
+            macro = self.find_macro(macro_name)
+            if macro is not None:
+                self.log.info(f"매크로 실행 시작: {macro_name}")
+                result = self.submit_playback(macro["path"], macro_name, None,
+                                              PRIORITY_MANUAL, RUN_POLICY_SKIP)
+                if result == "skipped":
+                    messagebox.showwarning("경고", f"매크로 '{macro_name}'이(가) 이미 실행 중이거나 대기 중입니다.")
+                elif result == "dropped":
+                    messagebox.showerror("오류", "실행 대기열이 가득 찼습니다.")
         except Exception as e:
             self.log.exception(f"매크로 실행 버튼 이벤트 오류: {str(e)}")
+
+    def on_cancel_playback(self):
+        """재생 취소 버튼 이벤트"""
+        try:
+            cancelled = self.cancel_playback()
+            self.log.info(f"재생 취소 버튼: {cancelled}개 재생 취소")
+            if not cancelled:
+                self.status_var.set("실행 중인 매크로가 없습니다")
+        except Exception as e:
+            self.log.exception(f"재생 취소 버튼 이벤트 오류: {str(e)}")
     
     def on_delete_macro(self):
         """매크로 삭제 버튼 이벤트"""
@@ -2012,11 +5825,10 @@ class MacroRecorder:
                 return
                 
             # 선택된 매크로 찾기
-            for macro in self.recorded_macros:
-                if macro["name"] == macro_name:
-                    self.log.info(f"매크로 삭제 실행: {macro_name}")
-                    self.delete_macro(macro["path"])
-                    break
+            macro = self.find_macro(macro_name)
+            if macro is not None:
+                self.log.info(f"매크로 삭제 실행: {macro_name}")
+                self.delete_macro(macro["path"])
         except Exception as e:
             self.log.exception(f"매크로 삭제 버튼 이벤트 오류: {str(e)}")
     
@@ -2033,24 +5845,37 @@ class MacroRecorder:
                 
             time_input = self.schedule_time_entry.get().strip()
             if not time_input:
-                messagebox.showerror("오류", "실행 시간을 입력하세요. (HH:MM)")
+                messagebox.showerror("오류", "실행 규칙을 입력하세요. (HH:MM / every 5m / cron)")
                 return
             
-            # 시간 형식 확인
+            # 실행 규칙 확인
             try:
-                hour, minute = map(int, time_input.split(":"))
-                if not (0 <= hour < 24 and 0 <= minute < 60):
-                    raise ValueError()
-                self.log.debug(f"시간 형식 검증 통과: {time_input}")
-            except:
-                self.log.error(f"잘못된 시간 형식: {time_input}")
-                messagebox.showerror("오류", "시간 형식이 올바르지 않습니다. (HH:MM)")
+                time_input = " ".join(time_input.split())
+                rule = compile_schedule_rule(time_input)
+                self.log.debug(f"실행 규칙 검증 통과: {time_input} ({rule.describe()})")
+            except ValueError as e:
+                self.log.error(f"잘못된 실행 규칙: {time_input} - {str(e)}")
+                messagebox.showerror("오류", f"실행 규칙이 올바르지 않습니다: {str(e)}\n\n"
+                                     "예) 19:30 / 09:00,18:00 @평일 / every 5m 09:00-18:00 @mon-fri\n"
+                                     "    */10 9-17 * * 1-5 / 0 18 LW * * / 뒤에 !2026-12-25 (제외 날짜)")
                 return
             
             # 스케줄 추가
-            if self.add_schedule(selected_macro_name, time_input):
+            options = self.playback_options
+            policy_name = self.schedule_policy_var.get()
+            policy = next((p for p in RUN_POLICIES if RUN_POLICY_NAMES[p] == policy_name), RUN_POLICY_QUEUE)
+            catchup_name = self.schedule_catchup_var.get()
+            catchup = next((p for p in CATCHUP_POLICIES if CATCHUP_POLICY_NAMES[p] == catchup_name), CATCHUP_SKIP)
+            if self.add_schedule(selected_macro_name, time_input, options, policy, catchup):
                 messagebox.showinfo("알림", 
-                    f"스케줄이 추가되었습니다: {selected_macro_name} - {time_input}\n매일 {time_input}에 실행됩니다.")
+                    f"스케줄이 추가되었습니다: {selected_macro_name} - {time_input}\n{rule.describe()}에 실행됩니다."
+                    f"\n다음 실행: {self.describe_next_fire(time_input)}"
+                    f"\n재생 옵션: {options.describe()}\n중복 실행: {policy_name}\n놓친 실행: {catchup_name}")
+                
+                # 매크로 길이가 다음 실행까지의 간격보다 길면 경고 (파일 헤더의 요약 정보 사용)
+                warnings = [w for w in self.schedule_overrun_warnings() if f"'{selected_macro_name}' ({time_input})" in w]
+                if warnings:
+                    messagebox.showwarning("경고", "\n".join(warnings))
                 
                 # 입력 필드 초기화
                 self.schedule_time_entry.delete(0, tk.END)
@@ -2071,8 +5896,7 @@ class MacroRecorder:
                 return
                 
             item = selection[0]
-            values = self.schedule_treeview.item(item, "values")
-            schedule_id = values[3]  # ID는 4번째 컬럼
+            schedule_id = self.schedule_treeview.set(item, "id")
             
             # 확인 메시지
             if not messagebox.askyesno("확인", "선택한 스케줄을 삭제하시겠습니까?"):
@@ -2094,8 +5918,16 @@ class MacroRecorder:
             self.log.debug("녹화 중지 중...")
             self.stop_recording()
             
+            self.log.debug("매크로 디렉토리 감시 중지 중...")
+            self.macro_watcher.stop()
+            
+            self.log.debug("재생 취소 중...")
+            self.cancel_playback()
+            self.execution_scheduler.stop()
+            
             self.log.debug("스케줄러 중지 중...")
             self.stop_scheduler()
+            self.schedule_store.close()
             
             self.log.debug("후킹 해제 중...")
             self.stop_all_hooks()
@@ -2113,7 +5945,179 @@ class MacroRecorder:
             self.log.exception(f"프로그램 종료 중 오류: {str(e)}")
 
 
+def _synthetic_event_stream(count, interval_us=1000):
+    """벤치마크용 합성 이벤트 (대부분 마우스 이동, 주기적으로 클릭/키 입력)"""
+    stream = EventStream()
+    event_time = 0
+    for i in range(count):
+        event_time += interval_us
+        x = 200 + (i * 7) % 1500
+        y = 150 + (i * 3) % 800
+        phase = i % 50
+        if phase == 20:
+            stream.append(EV_MOUSE_DOWN, event_time, x, y, 'left')
+        elif phase == 21:
+            stream.append(EV_MOUSE_UP, event_time, x, y, 'left')
+        elif phase == 40:
+            stream.append(EV_KEY_DOWN, event_time, 0, 0, 'a')
+        elif phase == 41:
+            stream.append(EV_KEY_UP, event_time, 0, 0, 'a')
+        else:
+            stream.append(EV_MOUSE_MOVE, event_time, x, y)
+    return stream
+
+def _percentile(values, fraction):
+    """정렬된 목록의 백분위 값"""
+    if not values:
+        return 0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+def run_playback_benchmark(event_count=100_000, timing_event_count=2_000):
+    """헤드리스 재생 벤치마크 (RecordingInputBackend 사용 - Windows/디스플레이 불필요)
+
+    계획 컴파일 비용, 재생 처리량(fast 모드), 타이밍 모드별 마감시각 오차를 측정한다.
+    """
+    import tempfile
+    
+    results = {}
+    print(f"재생 벤치마크: {event_count}개 이벤트")
+    
+    # 1. 계획 컴파일 비용 (JSON 파싱 포함 / 컴파일만)
+    stream = _synthetic_event_stream(event_count)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        macro_path = os.path.join(temp_dir, "benchmark.json")
+        write_macro_file(macro_path, {"name": "benchmark", "time_unit": TIME_UNIT}, stream.to_dicts())
+        file_size = os.path.getsize(macro_path)
+        
+        start_ns = time.perf_counter_ns()
+        plan = load_macro_plan(macro_path)
+        load_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        binary_path = os.path.join(temp_dir, "benchmark.pmb")
+        convert_macro_file(macro_path, binary_path)
+        binary_size = os.path.getsize(binary_path)
+        start_ns = time.perf_counter_ns()
+        load_macro_plan(binary_path)
+        binary_load_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        
+        cache = MacroPlanCache()
+        cache.get(macro_path)
+        start_ns = time.perf_counter_ns()
+        cache.get(macro_path)
+        cache_hit_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    
+    start_ns = time.perf_counter_ns()
+    MacroPlan.compile(stream)
+    compile_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    
+    results["json_bytes"] = file_size
+    results["binary_bytes"] = binary_size
+    results["load_and_compile_ms"] = round(load_ms, 2)
+    results["binary_load_and_compile_ms"] = round(binary_load_ms, 2)
+    results["compile_ms"] = round(compile_ms, 2)
+    results["cache_hit_ms"] = round(cache_hit_ms, 3)
+    print(f"  JSON 로드+컴파일: {load_ms:.1f}ms ({file_size // 1024}KB), "
+          f"컴파일만: {compile_ms:.1f}ms, 캐시 적중: {cache_hit_ms:.3f}ms")
+    print(f"  바이너리 로드+컴파일: {binary_load_ms:.1f}ms ({binary_size // 1024}KB)")
+    
+    # 1-1. 압축 방식별 크기/해제 처리량 (레코드 영역 기준 압축률)
+    raw_bytes = len(stream) * _BINARY_RECORD.size
+    codecs = [(CODEC_NONE, False), (CODEC_NONE, True), (CODEC_ZLIB, False), (CODEC_ZLIB, True)]
+    if lzma is not None:
+        codecs.append((CODEC_LZMA, True))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for codec, delta in codecs:
+            label = f"{codec}{'+delta' if delta else ''}"
+            codec_path = os.path.join(temp_dir, f"benchmark_{codec}_{int(delta)}.pmb")
+            start_ns = time.perf_counter_ns()
+            write_macro_binary(codec_path, {"name": "benchmark"}, stream, codec, delta=delta)
+            encode_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            codec_size = os.path.getsize(codec_path)
+            
+            start_ns = time.perf_counter_ns()
+            read_macro_binary(codec_path)
+            decode_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            
+            stats = {
+                "bytes": codec_size,
+                "ratio": round(raw_bytes / codec_size, 2),
+                "encode_ms": round(encode_ms, 2),
+                "decode_ms": round(decode_ms, 2),
+                "decode_events_per_sec": int(len(stream) / max(decode_ms, 0.001) * 1000),
+            }
+            results[f"codec_{label}"] = stats
+            print(f"  압축 {label}: {codec_size // 1024}KB (압축률 {stats['ratio']}배), "
+                  f"기록 {encode_ms:.1f}ms, 해제 {decode_ms:.1f}ms ({stats['decode_events_per_sec']} 이벤트/초)")
+        
+        # 1-2. 지연 재생 (mmap 청크) 대 전체 로드 재생의 최대 메모리 (zlib+delta 파일)
+        import tracemalloc
+        codec_path = os.path.join(temp_dir, f"benchmark_{CODEC_ZLIB}_1.pmb")
+        tracemalloc.start()
+        with MacroEventReader(codec_path) as reader:
+            MacroPlayer(RecordingInputBackend(keep_actions=False), TIMING_FAST).play_chunks(
+                reader.plan_chunks(), reader.event_count)
+        stream_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        MacroPlayer(RecordingInputBackend(keep_actions=False), TIMING_FAST).play(load_macro_plan(codec_path))
+        full_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    results["stream_peak_bytes"] = stream_peak
+    results["full_load_peak_bytes"] = full_peak
+    print(f"  재생 최대 메모리: 지연 재생 {stream_peak // 1024}KB, 전체 로드 {full_peak // 1024}KB")
+    
+    # 2. 재생 처리량 (대기 없음)
+    player = MacroPlayer(RecordingInputBackend(keep_actions=False), TIMING_FAST)
+    result = player.play(plan)
+    throughput = result["events"] / max(result["elapsed_ms"], 1) * 1000
+    results["fast_events_per_sec"] = int(throughput)
+    print(f"  재생 처리량 (fast): {int(throughput)} 이벤트/초, 배치 {result['backend']['batches']}회")
+    
+    # 3. 타이밍 모드별 마감시각 오차
+    timing_plan = MacroPlan.compile(_synthetic_event_stream(timing_event_count))
+    for mode in (TIMING_STRICT, TIMING_BEST_EFFORT):
+        backend = RecordingInputBackend()
+        result = MacroPlayer(backend, mode, batch_window_us=0).play(timing_plan)
+        origin = result["origin_ns"]
+        deadlines = timing_plan.deadlines
+        errors = sorted((ts - origin - deadlines[i] * 1000) / 1e6 for ts, i, *_ in backend.actions)
+        stats = {
+            "avg_ms": round(sum(errors) / len(errors), 3) if errors else 0,
+            "p50_ms": round(_percentile(errors, 0.5), 3),
+            "p99_ms": round(_percentile(errors, 0.99), 3),
+            "max_ms": round(errors[-1], 3) if errors else 0,
+            "elapsed_ms": result["elapsed_ms"],
+            "recorded_ms": result["recorded_ms"],
+        }
+        results[f"timing_{mode}"] = stats
+        print(f"  타이밍 오차 ({mode}): 평균 {stats['avg_ms']}ms, p50 {stats['p50_ms']}ms, "
+              f"p99 {stats['p99_ms']}ms, 최대 {stats['max_ms']}ms "
+              f"(재생 {stats['elapsed_ms']}ms / 녹화 {stats['recorded_ms']}ms)")
+    
+    return results
+
+
 if __name__ == "__main__":
+    if "--convert" in sys.argv:
+        # 매크로 형식 변환: python macro.py --convert 원본.json 대상.pmb [zlib|lzma|none] [압축 레벨]
+        args = [arg for arg in sys.argv[1:] if arg != "--convert"]
+        if not 2 <= len(args) <= 4 or (len(args) > 2 and args[2] not in MACRO_CODECS):
+            print("사용법: python macro.py --convert <원본 파일> <대상 파일(.pmb/.json)> "
+                  "[zlib|lzma|none] [압축 레벨]")
+            sys.exit(2)
+        binary_options = None
+        if len(args) > 2:
+            binary_options = {"codec": args[2], "delta": args[2] != CODEC_NONE,
+                              "level": int(args[3]) if len(args) > 3 else None}
+        count = convert_macro_file(args[0], args[1], binary_options)
+        print(f"변환 완료: {args[0]} -> {args[1]} ({count}개 이벤트)")
+        sys.exit(0)
+    
+    if "--benchmark" in sys.argv:
+        # 헤드리스 재생 벤치마크: python macro.py --benchmark [이벤트 수]
+        args = [arg for arg in sys.argv[1:] if arg != "--benchmark"]
+        run_playback_benchmark(int(args[0]) if args else 100_000)
+        sys.exit(0)
+    
     try:
         print("=" * 50)
         print("Python 매크로 프로그램 시작")
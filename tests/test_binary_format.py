@@ -0,0 +1,95 @@
+import random
+import struct
+
+import pytest
+
+from macro import (CODEC_LZMA, CODEC_NONE, CODEC_ZLIB, MACRO_BINARY_MAGIC, MACRO_FLAG_DELTA,
+                   MACRO_FLAG_LZMA, MACRO_FLAG_SORTED, MACRO_FLAG_ZLIB, EventStream, convert_macro_file,
+                   load_macro_stream, lzma, read_macro_header, write_macro, write_macro_binary)
+
+
+def make_events(count, seed=1):
+    rng = random.Random(seed)
+    events = []
+    t = 0
+    x = y = 500
+    for i in range(count):
+        t += rng.randint(0, 20_000)
+        kind = rng.random()
+        if kind < 0.8:
+            x += rng.randint(-30, 30)
+            y += rng.randint(-30, 30)
+            events.append({"type": "mouse_move", "x": x, "y": y, "time": t})
+        elif kind < 0.9:
+            events.append({"type": rng.choice(["mouse_down", "mouse_up"]),
+                           "button": rng.choice(["left", "right"]), "x": x, "y": y, "time": t})
+        else:
+            events.append({"type": rng.choice(["key_down", "key_up"]), "key": rng.choice("abc"), "time": t})
+    events.append({"type": "scroll", "dy": -120, "time": t + 1})
+    return events
+
+
+CODECS = [CODEC_NONE, CODEC_ZLIB] + ([CODEC_LZMA] if lzma is not None else [])
+CODEC_FLAGS = {CODEC_NONE: 0, CODEC_ZLIB: MACRO_FLAG_ZLIB, CODEC_LZMA: MACRO_FLAG_LZMA}
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("delta", [False, True])
+def test_round_trip_for_every_codec_and_flag(tmp_path, codec, delta):
+    events = make_events(3000)
+    path = str(tmp_path / "m.pmb")
+    assert write_macro(path, {"name": "m"}, EventStream.from_dicts(events),
+                       {"codec": codec, "delta": delta}) == len(events)
+
+    header = read_macro_header(path)
+    assert header["flags"] == MACRO_FLAG_SORTED | CODEC_FLAGS[codec] | (MACRO_FLAG_DELTA if delta else 0)
+    assert header["event_count"] == len(events)
+    assert header["duration_us"] == events[-1]["time"] - events[0]["time"]
+    assert header["summary"]["event_count"] == len(events)
+
+    header, stream = load_macro_stream(path)
+    assert header["name"] == "m"
+    assert stream.to_dicts() == events
+
+
+def test_unsorted_input_is_stored_sorted(tmp_path):
+    events = make_events(50)
+    path = str(tmp_path / "m.pmb")
+    write_macro_binary(path, {"name": "m"}, EventStream.from_dicts(list(reversed(events))))
+    _, stream = load_macro_stream(path)
+    assert [event["time"] for event in stream.to_dicts()] == sorted(event["time"] for event in events)
+
+
+def test_small_record_area_is_not_compressed(tmp_path):
+    path = str(tmp_path / "m.pmb")
+    write_macro_binary(path, {}, EventStream.from_dicts(make_events(10)), codec=CODEC_ZLIB,
+                       min_compress_bytes=1 << 20)
+    assert not read_macro_header(path)["flags"] & MACRO_FLAG_ZLIB
+
+
+def test_json_conversion_round_trip(tmp_path):
+    events = make_events(200)
+    source = str(tmp_path / "m.json")
+    write_macro(source, {"name": "m"}, EventStream.from_dicts(events))
+    binary = str(tmp_path / "m.pmb")
+    back = str(tmp_path / "back.json")
+    assert convert_macro_file(source, binary, {"codec": CODEC_ZLIB, "delta": True}) == len(events)
+    assert convert_macro_file(binary, back) == len(events)
+    assert load_macro_stream(back)[1].to_dicts() == events
+
+
+def test_rejects_bad_magic_newer_version_and_truncation(tmp_path):
+    path = str(tmp_path / "m.pmb")
+    write_macro_binary(path, {}, EventStream.from_dicts(make_events(100)))
+    with open(path, "rb") as f:
+        data = f.read()
+
+    bad = str(tmp_path / "bad.pmb")
+    for payload in (b"XXXX" + data[4:],
+                    data[:4] + struct.pack("<H", 99) + data[6:],
+                    data[:-10]):
+        with open(bad, "wb") as f:
+            f.write(payload)
+        with pytest.raises(ValueError):
+            load_macro_stream(bad)
+    assert data.startswith(MACRO_BINARY_MAGIC)
@@ -0,0 +1,77 @@
+import datetime
+import logging
+import threading
+import types
+
+import pytest
+
+from macro import CATCHUP_ALL, CATCHUP_ONCE, CATCHUP_SKIP, MacroRecorder, TimerScheduler
+
+
+def ts(*args):
+    return datetime.datetime(*args).timestamp()
+
+
+def make_recorder(schedules, max_runs=3, max_total=100):
+    recorder = types.SimpleNamespace(
+        schedules=schedules, schedule_lock=threading.Lock(), log=logging.getLogger(__name__),
+        catchup_max_runs=max_runs, catchup_max_total=max_total, catchup_spacing=5.0, catchup_next_slot=0.0,
+        catchup_stats={"passes": 0, "schedules": 0, "scheduled": 0, "limited": 0},
+        timer_scheduler=TimerScheduler(), recorded=[])
+    for name in ("schedule_anchor", "catch_up_missed_runs", "schedule_catchup_runs"):
+        setattr(recorder, name, getattr(MacroRecorder, name).__get__(recorder))
+    recorder.record_schedule_runs = recorder.recorded.extend
+    recorder.fire_schedule = lambda sched, due, catchup=False: None
+    return recorder
+
+
+def schedule(schedule_id, policy, last_fire):
+    return {"id": schedule_id, "macro": f"m{schedule_id}", "time": "every 1h",
+            "catchup": policy, "last_fire": last_fire, "created": "2026-01-01 00:00:00"}
+
+
+def catchup_counts(recorder):
+    counts = {}
+    for job in recorder.timer_scheduler.jobs():
+        counts[job["key"][1]] = counts.get(job["key"][1], 0) + 1
+    return counts
+
+
+def test_policies_schedule_the_expected_number_of_runs():
+    now = ts(2026, 3, 2, 12, 30)
+    recorder = make_recorder([
+        schedule(1, CATCHUP_SKIP, ts(2026, 3, 2, 7, 0)),
+        schedule(2, CATCHUP_ONCE, ts(2026, 3, 2, 7, 0)),
+        schedule(3, CATCHUP_ALL, ts(2026, 3, 2, 10, 0)),   # 11:00, 12:00 놓침
+        schedule(4, CATCHUP_ALL, ts(2026, 3, 1, 0, 0)),    # 한도(3회)보다 많이 놓침
+        schedule(5, CATCHUP_ALL, ts(2026, 3, 2, 12, 0)),   # 놓친 회차 없음
+    ])
+    assert recorder.catch_up_missed_runs(now=now) == 4
+
+    assert catchup_counts(recorder) == {2: 1, 3: 2, 4: 3}
+    recorded = {sched["id"]: (fire, outcome) for sched, fire, outcome in recorder.recorded}
+    assert set(recorded) == {1, 2, 3, 4}
+    assert all(outcome == "missed" for _, outcome in recorded.values())
+    # 한도 이내로 놓친 경우 마지막 놓친 회차, 한도를 넘으면 현재 시각을 기록
+    assert recorded[3][0] == ts(2026, 3, 2, 12, 0)
+    assert recorded[4][0] == now
+    assert recorder.catchup_stats == {"passes": 1, "schedules": 4, "scheduled": 6, "limited": 0}
+
+    due = sorted(job["due"] for job in recorder.timer_scheduler.jobs())
+    assert all(b - a == pytest.approx(5.0) for a, b in zip(due, due[1:]))
+
+
+def test_total_budget_limits_catchup_runs():
+    now = ts(2026, 3, 2, 12, 30)
+    recorder = make_recorder([schedule(i, CATCHUP_ALL, ts(2026, 3, 1, 0, 0)) for i in range(3)],
+                             max_runs=3, max_total=5)
+    assert recorder.catch_up_missed_runs(now=now) == 3
+    assert sum(catchup_counts(recorder).values()) == 5
+    assert recorder.catchup_stats["limited"] == 4
+
+
+def test_anchor_falls_back_to_creation_time():
+    recorder = make_recorder([dict(schedule(1, CATCHUP_ONCE, None))])
+    assert recorder.schedule_anchor(recorder.schedules[0]) == ts(2026, 1, 1, 0, 0)
+    assert recorder.catch_up_missed_runs(schedule_ids={2}, now=ts(2026, 3, 2)) == 0
+    assert recorder.catch_up_missed_runs(schedule_ids={1}, now=ts(2026, 3, 2)) == 1
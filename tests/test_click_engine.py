@@ -0,0 +1,73 @@
+import macro
+from macro import ClickEngine
+
+
+def stub_engine(results, calls, **kwargs):
+    engine = ClickEngine(**kwargs)
+
+    def handler(method):
+        def click(x, y, button, action, flag):
+            calls.append(method)
+            outcome = results[method]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return click
+
+    engine._handlers = {method: handler(method) for method in ClickEngine.METHODS}
+    return engine
+
+
+def test_methods_are_tried_in_order_and_first_success_is_cached():
+    calls = []
+    results = {"mouse_event": RuntimeError("no win32"), "send_input": True, "pyautogui": True}
+    engine = stub_engine(results, calls)
+    assert engine.click(1, 2)
+    assert calls == ["mouse_event", "send_input"]
+    assert engine.preferred == "send_input"
+
+    calls.clear()
+    assert engine.click(1, 2, action="down")
+    assert calls == ["send_input"]
+
+    stats = engine.stats()
+    assert stats["preferred"] == "send_input"
+    assert stats["mouse_event"]["attempts"] == 1 and stats["mouse_event"]["failures"] == 1
+    assert stats["send_input"]["successes"] == 2
+
+
+def test_failing_preferred_method_is_demoted():
+    calls = []
+    results = {"mouse_event": False, "send_input": True, "pyautogui": True}
+    engine = stub_engine(results, calls)
+    assert engine.click(1, 2)
+    assert engine.preferred == "send_input"
+
+    results["send_input"] = False
+    calls.clear()
+    assert engine.click(1, 2)
+    assert calls == ["send_input", "mouse_event", "pyautogui"]
+    assert engine.preferred == "pyautogui"
+
+    results["pyautogui"] = False
+    assert not engine.click(1, 2)
+    assert engine.preferred is None
+
+
+def test_unknown_button_is_rejected_without_attempts():
+    calls = []
+    engine = stub_engine({method: True for method in ClickEngine.METHODS}, calls)
+    assert not engine.click(1, 2, button="x9")
+    assert calls == []
+
+
+def test_settle_defaults_to_no_sleep(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(macro.time, "sleep", sleeps.append)
+    engine = ClickEngine()
+    assert engine.move_settle == 0.0 and engine.press_settle == 0.0
+    engine._settle(engine.move_settle)
+    engine._settle(engine.press_settle)
+    assert sleeps == []
+    ClickEngine(move_settle=0.01)._settle(0.01)
+    assert sleeps == [0.01]
@@ -0,0 +1,52 @@
+from macro import RAW_KEY_NAME, RAW_MOUSE_MOVE, EventRingBuffer
+
+
+def test_capacity_rounds_up_to_power_of_two():
+    assert EventRingBuffer(100).capacity == 128
+    assert EventRingBuffer(64).capacity == 64
+
+
+def test_drain_returns_records_in_order_once():
+    buffer = EventRingBuffer(8)
+    for i in range(5):
+        buffer.push(RAW_MOUSE_MOVE, i, x=i, y=-i)
+    records = buffer.drain()
+    assert [record[0] for record in records] == [0, 1, 2, 3, 4]
+    assert records[2] == (2, RAW_MOUSE_MOVE, 2, 2, -2, None, False)
+    assert buffer.drain() == []
+
+    buffer.push(RAW_KEY_NAME, 10, detail="a", pressed=True)
+    assert buffer.drain() == [(5, RAW_KEY_NAME, 10, 0, 0, "a", True)]
+    stats = buffer.stats()
+    assert stats["written"] == 6 and stats["drained"] == 6 and stats["dropped"] == 0
+
+
+def test_overflow_skips_overwritten_records_and_counts_them():
+    buffer = EventRingBuffer(8)
+    for i in range(20):
+        buffer.push(RAW_MOUSE_MOVE, i)
+    records = buffer.drain()
+    # 마지막 한 바퀴(8개)만 남아 있음
+    assert [record[0] for record in records] == list(range(12, 20))
+    stats = buffer.stats()
+    assert stats["dropped"] == 12
+    assert stats["overflows"] == 1
+    assert stats["high_water"] == 20
+    assert stats["drained"] == 8
+
+    buffer.push(RAW_MOUSE_MOVE, 20)
+    assert [record[0] for record in buffer.drain()] == [20]
+
+
+def test_head_moving_backwards_does_not_skew_stats():
+    buffer = EventRingBuffer(8)
+    for i in range(20):
+        buffer.push(RAW_MOUSE_MOVE, i)
+    # 다른 훅 스레드의 늦은 기록으로 _head가 뒤로 간 경우
+    buffer._head = 9
+    records = buffer.drain()
+    assert [record[0] for record in records] == list(range(12, 20))
+    stats = buffer.stats()
+    assert stats["written"] == 20
+    assert stats["dropped"] == 12
+    assert stats["high_water"] == 20
@@ -0,0 +1,35 @@
+from macro import EV_KEY_DOWN, EventStream
+
+EVENTS = [
+    {"type": "mouse_move", "x": 1, "y": 2, "time": 30},
+    {"type": "key_down", "key": "shift", "time": 10},
+    {"type": "mouse_down", "button": "left", "x": 1, "y": 2, "time": 20},
+    {"type": "key_up", "key": "shift", "time": 40},
+    # 비표준 이벤트는 원본 그대로 보관
+    {"type": "scroll", "dx": 3, "time": 50},
+    {"type": "mouse_move", "x": 1.5, "y": 2, "time": 60},
+]
+
+
+def test_round_trip_is_lossless():
+    stream = EventStream.from_dicts(EVENTS)
+    assert len(stream) == len(EVENTS)
+    assert stream.to_dicts() == EVENTS
+    assert sorted(stream.extras) == [4, 5]
+    # 같은 키 이름은 문자열 테이블에 한 번만 저장
+    assert stream.strings.count("shift") == 1
+    assert stream.types[1] == EV_KEY_DOWN
+
+
+def test_legacy_seconds_are_converted_to_microseconds():
+    stream = EventStream.from_macro_data({"events": [{"type": "key_down", "key": "a", "time": 1.25}]})
+    assert stream.to_dicts() == [{"type": "key_down", "key": "a", "time": 1_250_000}]
+
+
+def test_sorted_by_time_keeps_extras_attached():
+    stream = EventStream.from_dicts(EVENTS)
+    assert not stream.is_time_sorted()
+    ordered = stream.sorted_by_time()
+    assert ordered.is_time_sorted() and ordered.time_sorted
+    assert ordered.to_dicts() == sorted(EVENTS, key=lambda event: event["time"])
+    assert ordered.sorted_by_time() is ordered
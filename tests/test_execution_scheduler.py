@@ -0,0 +1,63 @@
+import threading
+import time
+
+from macro import (PRIORITY_MANUAL, PRIORITY_SCHEDULED, RUN_POLICY_QUEUE, RUN_POLICY_REPLACE,
+                   RUN_POLICY_SKIP, ExecutionScheduler)
+
+
+def blocking_target(started, release):
+    def target(controller):
+        started.set()
+        release.wait(2.0)
+    return target
+
+
+def test_skip_and_replace_policies_and_pending_limit():
+    scheduler = ExecutionScheduler(workers=1, max_pending=2)
+    started, release = threading.Event(), threading.Event()
+    try:
+        assert scheduler.submit("busy", blocking_target(started, release)) == "queued"
+        assert started.wait(2.0)
+
+        noop = lambda controller: None
+        assert scheduler.submit("a", noop) == "queued"
+        assert scheduler.submit("a", noop, policy=RUN_POLICY_SKIP) == "skipped"
+        # 교체로 버려진 항목은 대기 수에 포함되지 않음
+        for _ in range(5):
+            assert scheduler.submit("a", noop, policy=RUN_POLICY_REPLACE) == "queued"
+        assert scheduler.stats()["pending"] == 1
+        assert scheduler.submit("b", noop, policy=RUN_POLICY_QUEUE) == "queued"
+        assert scheduler.submit("c", noop) == "dropped"
+    finally:
+        release.set()
+        scheduler.stop()
+
+
+def test_manual_job_overtakes_scheduled_job_waiting_for_device():
+    scheduler = ExecutionScheduler(workers=2)
+    started, release = threading.Event(), threading.Event()
+    order = []
+    done = threading.Event()
+
+    def record(name):
+        def target(controller):
+            order.append(name)
+            if len(order) == 2:
+                done.set()
+        return target
+
+    scheduler.submit("busy", blocking_target(started, release))
+    assert started.wait(2.0)
+    scheduler.submit("scheduled", record("scheduled"), priority=PRIORITY_SCHEDULED)
+    # 두 번째 워커가 예약 작업을 꺼내 장치를 기다릴 때까지 대기
+    for _ in range(200):
+        if scheduler._device_waiters:
+            break
+        time.sleep(0.005)
+    scheduler.submit("manual", record("manual"), priority=PRIORITY_MANUAL)
+    release.set()
+    try:
+        assert done.wait(2.0)
+    finally:
+        scheduler.stop()
+    assert order == ["manual", "scheduled"]
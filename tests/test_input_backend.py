@@ -0,0 +1,20 @@
+import pytest
+
+from macro import InputBackend, RecordingInputBackend
+
+
+def test_backend_without_inject_cannot_be_created():
+    class Incomplete(InputBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_default_send_batch_counts_successful_injects():
+    class EvenOnly(InputBackend):
+        def inject(self, plan, i):
+            return i % 2 == 0
+
+    assert EvenOnly().send_batch(None, 0, 5) == 3
+    assert RecordingInputBackend().stats()["backend"] == "recording"
@@ -0,0 +1,43 @@
+import types
+
+import macro
+from macro import (OP_KEY_UP, EventStream, MacroPlan, MacroPlayer, RecordingInputBackend,
+                   SendInputBatcher)
+
+
+def key_plan(count):
+    return MacroPlan.compile(EventStream.from_dicts(
+        [{"type": "key_down", "key": "a", "time": i} for i in range(count)]))
+
+
+def test_send_splits_ranges_larger_than_max_batch(monkeypatch):
+    calls = []
+
+    def send_input(count, inputs, size):
+        calls.append(count)
+        return count
+
+    monkeypatch.setattr(macro.ctypes, "windll",
+                        types.SimpleNamespace(user32=types.SimpleNamespace(SendInput=send_input)),
+                        raising=False)
+    batcher = SendInputBatcher(max_batch=4)
+    assert batcher.send(key_plan(10), 0, 10) == 10
+    assert calls == [4, 4, 2]
+    assert batcher.stats()["largest_batch"] == 4
+
+
+def test_send_stops_after_a_partial_chunk(monkeypatch):
+    results = iter([4, 1, 2])
+    monkeypatch.setattr(macro.ctypes, "windll",
+                        types.SimpleNamespace(user32=types.SimpleNamespace(
+                            SendInput=lambda count, inputs, size: next(results))),
+                        raising=False)
+    assert SendInputBatcher(max_batch=4).send(key_plan(10), 0, 10) == 5
+
+
+def test_release_held_respects_backend_batch_size():
+    backend = RecordingInputBackend(max_batch=4)
+    MacroPlayer(backend).release_held("m", set(range(0x41, 0x4b)), {0: (5, 6)})
+    assert backend.batch_count == 3
+    assert backend.injected_count == 11
+    assert sum(1 for action in backend.actions if action[2] == OP_KEY_UP) == 10
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+
+import pytest
+
+from macro import EventStream, MacroCatalog, write_macro
+
+EVENTS = [
+    {"type": "mouse_move", "x": 1, "y": 1, "time": 0},
+    {"type": "key_down", "key": "a", "time": 500},
+]
+
+
+def write(macros_dir, file, events=EVENTS):
+    write_macro(str(macros_dir / file), {"name": os.path.splitext(file)[0]}, EventStream.from_dicts(events))
+
+
+@pytest.fixture
+def macros_dir(tmp_path):
+    path = tmp_path / "macros"
+    path.mkdir()
+    return path
+
+
+def test_reconcile_reports_added_updated_removed(tmp_path, macros_dir):
+    write(macros_dir, "a.json")
+    write(macros_dir, "b.pmb")
+    (macros_dir / "notes.txt").write_text("not a macro")
+    catalog = MacroCatalog(str(tmp_path / "catalog.db"), str(macros_dir))
+    assert sorted(catalog.reconcile()[0]) == ["a.json", "b.pmb"]
+    assert catalog.get("a.json")["event_count"] == 2
+
+    write(macros_dir, "b.pmb", EVENTS * 2)
+    os.remove(macros_dir / "a.json")
+    write(macros_dir, "c.json")
+    assert catalog.reconcile() == (["c.json"], ["b.pmb"], ["a.json"])
+    assert catalog.get("b.pmb")["event_count"] == 4
+    catalog.close()
+
+
+def test_unchanged_files_are_not_reopened(tmp_path, macros_dir, monkeypatch):
+    write(macros_dir, "a.json")
+    catalog = MacroCatalog(str(tmp_path / "catalog.db"), str(macros_dir))
+    catalog.reconcile()
+
+    opened = []
+    original = MacroCatalog._row_values
+    monkeypatch.setattr(MacroCatalog, "_row_values",
+                        lambda self, file, stat: opened.append(file) or original(self, file, stat))
+    assert catalog.reconcile() == ([], [], [])
+    assert opened == []
+    catalog.close()
+
+    # 다시 열어도 색인이 유지됨
+    catalog = MacroCatalog(str(tmp_path / "catalog.db"), str(macros_dir))
+    assert catalog.reconcile() == ([], [], [])
+    assert opened == []
+    catalog.close()
+
+
+def test_pre_summary_database_is_migrated_and_reread(tmp_path, macros_dir):
+    write(macros_dir, "a.json")
+    stat = os.stat(macros_dir / "a.json")
+    db_path = str(tmp_path / "catalog.db")
+    db = sqlite3.connect(db_path)
+    db.execute("""CREATE TABLE macros (file TEXT PRIMARY KEY, name TEXT NOT NULL, format TEXT NOT NULL,
+                  size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, created REAL NOT NULL,
+                  event_count INTEGER NOT NULL, duration_us INTEGER NOT NULL)""")
+    db.execute("INSERT INTO macros VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+               ("a.json", "a", "json", stat.st_size, stat.st_mtime_ns, stat.st_ctime, 2, 500))
+    db.commit()
+    db.close()
+
+    catalog = MacroCatalog(db_path, str(macros_dir))
+    assert catalog.get("a.json")["summary"] is None
+    assert catalog.reconcile() == ([], ["a.json"], [])
+    assert catalog.get("a.json")["summary"]["keys"] == ["a"]
+    catalog.close()
+
+
+def test_binary_wins_over_json_with_the_same_name(tmp_path, macros_dir):
+    write(macros_dir, "same.json")
+    write(macros_dir, "same.pmb", EVENTS * 3)
+    write(macros_dir, "other.json")
+    catalog = MacroCatalog(str(tmp_path / "catalog.db"), str(macros_dir))
+    catalog.reconcile()
+    assert [(entry["name"], entry["format"]) for entry in catalog.entries()] == [
+        ("other", "json"), ("same", "binary")]
+    assert catalog.entry_for_name("same")["file"] == "same.pmb"
+    assert catalog.entry_for_name("missing") is None
+
+    os.remove(macros_dir / "same.pmb")
+    assert catalog.refresh("same.pmb") == "removed"
+    assert catalog.entry_for_name("same")["file"] == "same.json"
+    assert catalog.refresh("same.json") is None
+    catalog.close()
@@ -0,0 +1,35 @@
+import os
+import queue
+
+import pytest
+
+from macro import EventStream, MacroCatalog, MacroDirectoryWatcher, write_macro, win32file
+
+EVENTS = [{"type": "key_down", "key": "a", "time": 0}]
+
+
+@pytest.mark.skipif(win32file is not None, reason="Windows에서는 ReadDirectoryChangesW 경로를 사용")
+def test_polling_watcher_reports_deltas(tmp_path):
+    macros_dir = tmp_path / "macros"
+    macros_dir.mkdir()
+    write_macro(str(macros_dir / "old.json"), {"name": "old"}, EventStream.from_dicts(EVENTS))
+    catalog = MacroCatalog(str(tmp_path / "catalog.db"), str(macros_dir))
+    catalog.reconcile()
+
+    changes = queue.Queue()
+    watcher = MacroDirectoryWatcher(catalog, lambda *delta: changes.put(delta), poll_interval=0.05)
+    watcher.start()
+    try:
+        write_macro(str(macros_dir / "new.json"), {"name": "new"}, EventStream.from_dicts(EVENTS))
+        assert changes.get(timeout=2) == (["new.json"], [], [])
+
+        write_macro(str(macros_dir / "new.json"), {"name": "new"}, EventStream.from_dicts(EVENTS * 3))
+        assert changes.get(timeout=2) == ([], ["new.json"], [])
+
+        os.remove(macros_dir / "old.json")
+        assert changes.get(timeout=2) == ([], [], ["old.json"])
+        assert watcher.method == "polling"
+        assert changes.empty()
+    finally:
+        watcher.stop()
+        catalog.close()
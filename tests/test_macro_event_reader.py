@@ -0,0 +1,38 @@
+import pytest
+
+from macro import CODEC_ZLIB, EventStream, MacroEventReader, PlaybackOptions, load_macro_plan, write_macro
+
+from test_binary_format import make_events
+
+
+@pytest.mark.parametrize("binary_options", [{}, {"codec": CODEC_ZLIB, "delta": True}])
+def test_chunks_cover_all_events_in_order(tmp_path, binary_options):
+    events = make_events(2000)
+    path = str(tmp_path / "m.pmb")
+    write_macro(path, {"name": "m"}, EventStream.from_dicts(events), binary_options)
+    with MacroEventReader(path, chunk_events=300) as reader:
+        assert reader.event_count == len(events) and reader.time_sorted
+        chunks = list(reader.chunks())
+        assert len(chunks) > 1
+        assert max(len(chunk) for chunk in chunks) <= 300
+        assert [event for chunk in chunks for event in chunk.to_dicts()] == events
+
+
+def test_plan_chunks_match_whole_plan(tmp_path):
+    events = make_events(2000, seed=7)
+    path = str(tmp_path / "m.pmb")
+    write_macro(path, {"name": "m"}, EventStream.from_dicts(events))
+    options = PlaybackOptions(speed=1.5, max_gap_ms=10, fast_moves=True)
+    whole = load_macro_plan(path).retimed(options)
+    with MacroEventReader(path, chunk_events=256) as reader:
+        chunks = list(reader.plan_chunks(options))
+    assert len(chunks) > 1
+    assert [d for chunk in chunks for d in chunk.deadlines] == list(whole.deadlines)
+    assert [op for chunk in chunks for op in chunk.ops] == list(whole.ops)
+
+
+def test_rejects_json_macros(tmp_path):
+    path = str(tmp_path / "m.json")
+    write_macro(path, {}, EventStream.from_dicts(make_events(5)))
+    with pytest.raises(ValueError):
+        MacroEventReader(path)
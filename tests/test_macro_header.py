@@ -0,0 +1,35 @@
+import json
+
+from macro import EventStream, read_macro_header, read_macro_summary, write_macro
+
+EVENTS = [
+    {"type": "mouse_move", "x": 5, "y": 7, "time": 0},
+    {"type": "key_down", "key": "enter", "time": 100},
+    {"type": "key_up", "key": "enter", "time": 200},
+]
+
+
+def test_header_prefix_is_read_for_written_macros(tmp_path):
+    path = str(tmp_path / "m.json")
+    write_macro(path, {"name": "m", "hook_method": "pynput"}, EventStream.from_dicts(EVENTS))
+    header = read_macro_header(path)
+    assert header["name"] == "m"
+    assert header["hook_method"] == "pynput"
+    assert header["summary"]["keys"] == ["enter"]
+    assert "events" not in header
+
+
+def test_pre_summary_json_returns_full_header(tmp_path):
+    # 이전 버전 파일: 헤더 필드가 events 뒤에도 있음
+    path = str(tmp_path / "old.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{\n")
+        f.write('  "name": "old",\n  "created": "2024-01-01 00:00:00",\n')
+        f.write('  "events": ' + json.dumps([dict(e, time=e["time"] / 1e6) for e in EVENTS]) + ",\n")
+        f.write('  "hook_method": "keyboard"\n}\n')
+    header = read_macro_header(path)
+    assert header["hook_method"] == "keyboard"
+    assert "events" not in header
+    summary = read_macro_summary(path)
+    assert summary["event_count"] == 3
+    assert summary["duration_us"] == 200
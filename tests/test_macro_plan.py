@@ -0,0 +1,56 @@
+import os
+
+from macro import (OP_KEY_DOWN, OP_MOUSE_DOWN, OP_MOVE, EventStream, MacroPlan, MacroPlanCache,
+                   PlaybackOptions, write_macro)
+
+EVENTS = [
+    {"type": "mouse_move", "x": 1, "y": 1, "time": 1000},
+    {"type": "mouse_move", "x": 2, "y": 2, "time": 3000},
+    {"type": "mouse_down", "button": "left", "x": 2, "y": 2, "time": 11000},
+    {"type": "key_down", "key": "a", "time": 12000},
+    {"type": "key_down", "key": "no-such-key", "time": 13000},
+]
+
+
+def test_compile_resolves_codes_and_skips_unknown_keys():
+    plan = MacroPlan.compile(EventStream.from_dicts(EVENTS), "m")
+    assert list(plan.ops) == [OP_MOVE, OP_MOVE, OP_MOUSE_DOWN, OP_KEY_DOWN]
+    assert list(plan.deadlines) == [0, 2000, 10000, 11000]
+    assert plan.codes[3] == ord("A")
+    assert plan.event_count == 5 and plan.skipped_count == 1
+    assert plan.window_end(0, 2000, 64) == 2
+
+
+def test_retimed_applies_speed_gap_cap_and_fast_moves():
+    plan = MacroPlan.compile(EventStream.from_dicts(EVENTS))
+    assert plan.retimed(PlaybackOptions()) is plan
+    assert list(plan.retimed(PlaybackOptions(speed=2)).deadlines) == [0, 1000, 5000, 5500]
+    assert list(plan.retimed(PlaybackOptions(max_gap_ms=5)).deadlines) == [0, 2000, 7000, 8000]
+    # 클릭 직전 이동만 대기를 유지
+    assert list(plan.retimed(PlaybackOptions(fast_moves=True)).deadlines) == [0, 2000, 10000, 11000]
+    moves = MacroPlan.compile(EventStream.from_dicts([
+        {"type": "mouse_move", "x": 0, "y": 0, "time": 0},
+        {"type": "mouse_move", "x": 5, "y": 5, "time": 5000},
+        {"type": "key_down", "key": "a", "time": 6000},
+    ]))
+    assert list(moves.retimed(PlaybackOptions(fast_moves=True)).deadlines) == [0, 0, 1000]
+
+
+def test_cache_hits_until_file_changes(tmp_path):
+    path = str(tmp_path / "m.json")
+    write_macro(path, {"name": "m"}, EventStream.from_dicts(EVENTS))
+    cache = MacroPlanCache(max_entries=2)
+    first = cache.get(path)
+    assert cache.get(path) is first
+    fast = cache.get(path, PlaybackOptions(speed=2))
+    assert cache.get(path, PlaybackOptions(speed=2)) is fast
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    write_macro(path, {"name": "m"}, EventStream.from_dicts(EVENTS[:2]))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert len(cache.get(path)) == 2
+    assert cache.misses == 2
+    cache.invalidate(path)
+    cache.get(path)
+    assert cache.misses == 3
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from macro import (OP_KEY_UP, OP_MOUSE_UP, EventStream, MacroPlan, MacroPlayer, PlaybackCancelled,
+                   PlaybackController, RecordingInputBackend)
+
+
+def cancel_later(controller, delay):
+    timer = threading.Timer(delay, controller.cancel)
+    timer.start()
+    return timer
+
+
+def test_cancel_wakes_a_long_sleep():
+    controller = PlaybackController()
+    cancelled_at = []
+
+    def cancel():
+        cancelled_at.append(time.perf_counter())
+        controller.cancel()
+
+    threading.Timer(0.02, cancel).start()
+    controller.sleep(10)
+    assert time.perf_counter() - cancelled_at[0] < 0.05
+    with pytest.raises(PlaybackCancelled):
+        controller.checkpoint()
+
+
+def test_checkpoint_returns_paused_time():
+    controller = PlaybackController()
+    assert controller.checkpoint() == 0
+    controller.pause()
+    assert controller.paused
+    threading.Timer(0.05, controller.resume).start()
+    paused_ns = controller.checkpoint()
+    assert 40_000_000 <= paused_ns < 1_000_000_000
+    assert not controller.paused
+
+
+def test_cancel_releases_held_keys_and_buttons():
+    plan = MacroPlan.compile(EventStream.from_dicts([
+        {"type": "key_down", "key": "shift", "time": 0},
+        {"type": "mouse_down", "button": "left", "x": 3, "y": 4, "time": 0},
+        {"type": "key_up", "key": "shift", "time": 10_000_000},
+        {"type": "mouse_up", "button": "left", "x": 3, "y": 4, "time": 10_000_000},
+    ]))
+    backend = RecordingInputBackend()
+    controller = PlaybackController()
+    cancel_later(controller, 0.05)
+    start = time.perf_counter()
+    result = MacroPlayer(backend).play(plan, controller)
+    assert time.perf_counter() - start < 1.0
+    assert result["cancelled"] and not result["completed"]
+    assert result["events"] == 2
+    released = [(action[2], action[3], action[4], action[5]) for action in backend.actions[2:]]
+    assert sorted(released) == sorted([(OP_KEY_UP, 0, 0, 0x10), (OP_MOUSE_UP, 3, 4, plan.codes[3])])
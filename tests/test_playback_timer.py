@@ -0,0 +1,47 @@
+import time
+
+from macro import (TIMING_BEST_EFFORT, TIMING_FAST, TIMING_STRICT, EventStream, MacroPlan, MacroPlayer,
+                   PlaybackTimer, RecordingInputBackend)
+
+
+class SlowBackend(RecordingInputBackend):
+    """주입마다 5ms가 걸리는 백엔드"""
+
+    def send_batch(self, plan, start, end):
+        injected = super().send_batch(plan, start, end)
+        time.sleep(0.005)
+        return injected
+
+
+def spaced_plan(count, gap_us):
+    return MacroPlan.compile(EventStream.from_dicts(
+        [{"type": "mouse_move", "x": i, "y": i, "time": i * gap_us} for i in range(count)]))
+
+
+def test_injection_cost_does_not_accumulate_as_drift():
+    plan = spaced_plan(20, 10_000)
+    backend = SlowBackend()
+    result = MacroPlayer(backend, TIMING_STRICT, batch_window_us=0).play(plan)
+    assert backend.batch_count == 20
+
+    offsets_us = [(action[0] - result["origin_ns"]) // 1000 for action in backend.actions]
+    last_deadline = plan.deadlines[-1]
+    # 간격 합 + 주입 시간(20 x 5ms)이면 290ms가 되었을 것
+    assert last_deadline <= offsets_us[-1] < last_deadline + 20_000
+    assert all(0 <= offset - deadline < 20_000 for offset, deadline in zip(offsets_us, plan.deadlines))
+
+
+def test_best_effort_and_fast_modes():
+    plan = spaced_plan(5, 20_000)
+    result = MacroPlayer(RecordingInputBackend(), TIMING_BEST_EFFORT, batch_window_us=0).play(plan)
+    assert result["elapsed_ms"] >= 80
+    result = MacroPlayer(RecordingInputBackend(), TIMING_FAST, batch_window_us=0).play(plan)
+    assert result["elapsed_ms"] < 80
+
+
+def test_wait_until_reports_lateness_for_past_deadlines():
+    timer = PlaybackTimer(TIMING_STRICT)
+    timer.start()
+    time.sleep(0.01)
+    assert timer.wait_until(0) >= 10_000_000
+    assert timer.stats()["waits"] == 1
@@ -0,0 +1,91 @@
+import logging
+import os
+import types
+
+import pytest
+
+from macro import (MACRO_EXTENSIONS, TIME_UNIT, MacroRecorder, RecordingJournal, load_macro_stream,
+                   read_macro_header)
+
+EVENTS = [
+    {"type": "mouse_move", "x": 10, "y": 20, "time": 0},
+    {"type": "mouse_down", "button": "left", "x": 10, "y": 20, "time": 1500},
+    {"type": "mouse_up", "button": "left", "x": 10, "y": 20, "time": 1600},
+    {"type": "key_down", "key": "a", "time": 2000},
+    {"type": "key_up", "key": "a", "time": 2100},
+]
+
+
+def write_journal(path, name="녹화", torn=True):
+    journal = RecordingJournal(path, {"name": name, "created": "2026-01-01 00:00:00", "time_unit": TIME_UNIT})
+    journal.append_chunk(EVENTS[:3])
+    journal.append_chunk(EVENTS[3:])
+    journal.close()
+    if torn:
+        # 비정상 종료로 마지막 청크가 중간에 잘린 경우
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('[{"type":"mouse_move","x":1')
+
+
+def test_iter_events_ignores_torn_last_chunk(tmp_path):
+    path = str(tmp_path / "rec.journal")
+    write_journal(path)
+    assert list(RecordingJournal.iter_events(path)) == EVENTS
+
+
+@pytest.mark.parametrize("macro_format", sorted(MACRO_EXTENSIONS))
+def test_finalize_applies_header_updates(tmp_path, macro_format):
+    path = str(tmp_path / "rec.journal")
+    write_journal(path)
+    file_path = str(tmp_path / f"out{MACRO_EXTENSIONS[macro_format]}")
+    assert RecordingJournal.finalize(path, file_path, {"name": "새 이름", "recovered": True}) == len(EVENTS)
+
+    header = read_macro_header(file_path)
+    assert header["name"] == "새 이름"
+    assert header["recovered"] is True
+    assert header["summary"]["event_count"] == len(EVENTS)
+    _, stream = load_macro_stream(file_path)
+    assert stream.to_dicts() == EVENTS
+
+
+def test_recover_recording_journals_renames_inside_file(tmp_path):
+    journal_dir = tmp_path / "journal"
+    macros_dir = tmp_path / "macros"
+    journal_dir.mkdir()
+    macros_dir.mkdir()
+    write_journal(str(journal_dir / f"녹화{RecordingJournal.SUFFIX}"))
+
+    recorder = types.SimpleNamespace(journal_dir=str(journal_dir), macros_dir=str(macros_dir),
+                                     macro_format="json", log=logging.getLogger(__name__))
+    recorder.macro_file_path = lambda name, macro_format=None: MacroRecorder.macro_file_path(recorder, name, macro_format)
+    recorder.macro_binary_options = lambda: {}
+
+    assert MacroRecorder.recover_recording_journals(recorder) == ["녹화_복구"]
+    header = read_macro_header(str(macros_dir / "녹화_복구.json"))
+    assert header["name"] == "녹화_복구"
+    assert header["recovered"] is True
+    assert os.listdir(journal_dir) == []
+
+
+def test_recover_keeps_earlier_recoveries_with_the_same_name(tmp_path):
+    journal_dir = tmp_path / "journal"
+    macros_dir = tmp_path / "macros"
+    journal_dir.mkdir()
+    macros_dir.mkdir()
+    (macros_dir / "녹화_복구.pmb").write_bytes(b"earlier")
+    write_journal(str(journal_dir / f"a{RecordingJournal.SUFFIX}"))
+    write_journal(str(journal_dir / f"b{RecordingJournal.SUFFIX}"))
+    # 이벤트가 없는 저널은 정리만 하고 기존 파일은 건드리지 않음
+    RecordingJournal(str(journal_dir / f"c{RecordingJournal.SUFFIX}"), {"name": "녹화"}).close()
+
+    recorder = types.SimpleNamespace(journal_dir=str(journal_dir), macros_dir=str(macros_dir),
+                                     macro_format="json", log=logging.getLogger(__name__))
+    recorder.macro_file_path = lambda name, macro_format=None: MacroRecorder.macro_file_path(recorder, name, macro_format)
+    recorder.macro_binary_options = lambda: {}
+
+    assert sorted(MacroRecorder.recover_recording_journals(recorder)) == ["녹화_복구2", "녹화_복구3"]
+    assert (macros_dir / "녹화_복구.pmb").read_bytes() == b"earlier"
+    for name in ("녹화_복구2", "녹화_복구3"):
+        assert read_macro_header(str(macros_dir / f"{name}.json"))["name"] == name
+    assert sorted(os.listdir(macros_dir)) == ["녹화_복구.pmb", "녹화_복구2.json", "녹화_복구3.json"]
+    assert os.listdir(journal_dir) == []
@@ -0,0 +1,58 @@
+import json
+
+from macro import ScheduleJournal
+
+
+def schedule(schedule_id, time_text="09:00"):
+    return {"id": schedule_id, "macro": f"m{schedule_id}", "time": time_text}
+
+
+def test_edits_are_replayed_over_snapshot(tmp_path):
+    path = str(tmp_path / "schedules.json")
+    store = ScheduleJournal(path)
+    assert store.load() == []
+    store.add(schedule(1))
+    store.add(schedule(2))
+    store.update(1, {"time": "10:00"})
+    store.delete(2)
+    store.update_many([(1, {"last_fire": 1.5}), (3, {"time": "11:00"})])
+    store.close()
+
+    loaded = ScheduleJournal(path).load()
+    assert loaded == [dict(schedule(1), time="10:00", last_fire=1.5)]
+
+
+def test_torn_last_line_is_dropped_and_compacted(tmp_path):
+    path = str(tmp_path / "schedules.json")
+    store = ScheduleJournal(path)
+    store.add(schedule(1))
+    store.add(schedule(2))
+    store.close()
+    with open(store.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"op": "delete", "i')
+
+    store = ScheduleJournal(path)
+    assert [s["id"] for s in store.load()] == [1, 2]
+    # 손상된 줄 뒤에 이어 쓰지 않도록 스냅샷으로 정리되고 저널은 비워짐
+    assert store.compactions == 1
+    with open(path, encoding="utf-8") as f:
+        assert [s["id"] for s in json.load(f)] == [1, 2]
+    with open(store.journal_path, encoding="utf-8") as f:
+        assert f.read() == ""
+    store.add(schedule(3))
+    store.close()
+    assert [s["id"] for s in ScheduleJournal(path).load()] == [1, 2, 3]
+
+
+def test_compaction_threshold(tmp_path):
+    path = str(tmp_path / "schedules.json")
+    store = ScheduleJournal(path, compact_min_records=4, compact_ratio=1.0)
+    store.load()
+    store.add(schedule(1))
+    for index in range(3):
+        store.update(1, {"time": f"0{index}:00"})
+    assert store.needs_compaction(1)
+    store.compact([dict(schedule(1), time="02:00")])
+    assert store.record_count == 0 and not store.needs_compaction(1)
+    store.close()
+    assert ScheduleJournal(path).load() == [dict(schedule(1), time="02:00")]
@@ -0,0 +1,67 @@
+import logging
+import threading
+import types
+
+from macro import MacroRecorder, ScheduleJournal, TimerScheduler
+
+
+def make_recorder(tmp_path, schedules):
+    recorder = types.SimpleNamespace(
+        schedules=schedules, schedule_lock=threading.Lock(), log=logging.getLogger(__name__),
+        timer_scheduler=TimerScheduler(), schedule_store=ScheduleJournal(str(tmp_path / "schedules.json")),
+        is_schedule_running=True, macro_index={"m": {"name": "m", "path": "m.pmb"}},
+        safe_gui_update=lambda func: None, update_schedule_list=None)
+    recorder.schedule_store.load()
+    for name in ("find_macro", "register_schedule", "record_schedule_change", "add_schedule",
+                 "delete_schedule", "fire_schedule"):
+        setattr(recorder, name, getattr(MacroRecorder, name).__get__(recorder))
+    return recorder
+
+
+def schedule(schedule_id, time_text):
+    return {"id": schedule_id, "macro": "m", "time": time_text}
+
+
+def dues(recorder):
+    return {job["key"]: job["due"] for job in recorder.timer_scheduler.jobs()}
+
+
+def test_edits_touch_only_the_edited_timer_entry(tmp_path):
+    schedules = [schedule("a", "every 1h"), schedule("b", "09:00"), schedule("c", "0 12 * * *")]
+    recorder = make_recorder(tmp_path, schedules)
+    for sched in schedules:
+        assert recorder.register_schedule(sched)
+    before = dues(recorder)
+    heap_before = len(recorder.timer_scheduler._heap)
+
+    # 한 스케줄의 규칙 변경: 같은 ID 항목만 교체
+    schedules[1]["time"] = "every 10m"
+    assert recorder.register_schedule(schedules[1])
+    after = dues(recorder)
+    assert after["a"] == before["a"] and after["c"] == before["c"]
+    assert after["b"] != before["b"]
+    assert len(recorder.timer_scheduler) == 3
+    assert len(recorder.timer_scheduler._heap) == heap_before + 1  # 이전 항목은 지연 삭제
+
+    # 추가/삭제도 해당 항목만 반영
+    assert recorder.add_schedule("m", "18:30")
+    added = [key for key in dues(recorder) if key not in after]
+    assert len(added) == 1
+    assert recorder.delete_schedule("a")
+    remaining = dues(recorder)
+    assert "a" not in remaining
+    assert remaining["c"] == before["c"] and remaining["b"] == after["b"]
+    assert {sched["id"] for sched in recorder.schedules} == {"b", "c", added[0]}
+
+    # 저널에는 추가/삭제만 기록됨
+    recorder.schedule_store.close()
+    assert {s["id"] for s in ScheduleJournal(str(tmp_path / "schedules.json")).load()} == {added[0]}
+
+
+def test_schedule_for_missing_macro_is_unregistered(tmp_path):
+    recorder = make_recorder(tmp_path, [])
+    sched = schedule("x", "every 1h")
+    assert recorder.register_schedule(sched)
+    recorder.macro_index = {}
+    assert not recorder.register_schedule(sched)
+    assert "x" not in recorder.timer_scheduler
@@ -0,0 +1,107 @@
+import datetime
+
+import pytest
+
+from macro import ScheduleRule
+
+
+def ts(*args):
+    return datetime.datetime(*args).timestamp()
+
+
+def fires(expression, start, count):
+    rule = ScheduleRule.parse(expression)
+    result = []
+    fire = start
+    for _ in range(count):
+        fire = rule.next_fire(fire)
+        result.append(datetime.datetime.fromtimestamp(fire))
+    return result
+
+
+def test_daily_times():
+    assert fires("09:30,18:00", ts(2026, 3, 2, 10, 0), 3) == [
+        datetime.datetime(2026, 3, 2, 18, 0),
+        datetime.datetime(2026, 3, 3, 9, 30),
+        datetime.datetime(2026, 3, 3, 18, 0),
+    ]
+
+
+def test_interval_with_window():
+    assert fires("every 2h 09:00-13:00", ts(2026, 3, 2, 12, 0), 3) == [
+        datetime.datetime(2026, 3, 2, 13, 0),
+        datetime.datetime(2026, 3, 3, 9, 0),
+        datetime.datetime(2026, 3, 3, 11, 0),
+    ]
+
+
+def test_cron_stepped_day_of_month():
+    # 1, 3, 5 ... 일만 실행 (매일이 아님)
+    assert fires("0 9 */2 * *", ts(2026, 3, 1, 10, 0), 3) == [
+        datetime.datetime(2026, 3, 3, 9, 0),
+        datetime.datetime(2026, 3, 5, 9, 0),
+        datetime.datetime(2026, 3, 7, 9, 0),
+    ]
+
+
+def test_cron_stepped_day_of_week():
+    # 요일 0,2,4,6 = 일, 화, 목, 토 / 2026-03-02는 월요일
+    assert fires("0 9 * * */2", ts(2026, 3, 2, 10, 0), 4) == [
+        datetime.datetime(2026, 3, 3, 9, 0),
+        datetime.datetime(2026, 3, 5, 9, 0),
+        datetime.datetime(2026, 3, 7, 9, 0),
+        datetime.datetime(2026, 3, 8, 9, 0),
+    ]
+
+
+def test_cron_day_and_weekday_use_or_rule():
+    # 15일 또는 월요일
+    assert fires("0 9 15 * 1", ts(2026, 3, 10, 10, 0), 3) == [
+        datetime.datetime(2026, 3, 15, 9, 0),
+        datetime.datetime(2026, 3, 16, 9, 0),
+        datetime.datetime(2026, 3, 23, 9, 0),
+    ]
+
+
+def test_cron_stepped_day_with_weekday_uses_and_rule():
+    # 일 필드가 "*"로 시작하면 OR가 아니라 AND
+    assert fires("0 9 */2 * 1", ts(2026, 3, 1, 0, 0), 2) == [
+        datetime.datetime(2026, 3, 9, 9, 0),
+        datetime.datetime(2026, 3, 23, 9, 0),
+    ]
+
+
+def test_cron_last_day():
+    assert fires("30 23 L * *", ts(2026, 1, 31, 23, 30), 2) == [
+        datetime.datetime(2026, 2, 28, 23, 30),
+        datetime.datetime(2026, 3, 31, 23, 30),
+    ]
+
+
+def test_cron_last_weekday():
+    # 2026-05-31은 일요일 -> 5/29(금), 2026-06-30은 화요일
+    assert fires("0 18 LW * *", ts(2026, 5, 1, 0, 0), 2) == [
+        datetime.datetime(2026, 5, 29, 18, 0),
+        datetime.datetime(2026, 6, 30, 18, 0),
+    ]
+
+
+def test_weekday_filter_and_excluded_dates():
+    # 2026-03-06(금) 제외, 주말은 건너뜀
+    assert fires("08:00 @weekdays !2026-03-06", ts(2026, 3, 5, 9, 0), 2) == [
+        datetime.datetime(2026, 3, 9, 8, 0),
+        datetime.datetime(2026, 3, 10, 8, 0),
+    ]
+
+
+def test_fires_between_respects_end_and_limit():
+    rule = ScheduleRule.parse("every 15m")
+    start = ts(2026, 3, 2, 9, 0)
+    assert len(rule.fires_between(start, ts(2026, 3, 2, 10, 0), 100)) == 4
+    assert len(rule.fires_between(start, ts(2026, 3, 2, 10, 0), 2)) == 2
+
+
+@pytest.mark.parametrize("expression", ["", "25:00", "every 0m", "0 9 32 * *", "08:00 !2026-13-01"])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        ScheduleRule.parse(expression)
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from macro import TimerScheduler, one_shot_fire
+
+
+def test_pop_due_reschedules_and_drops_finished_entries():
+    timer = TimerScheduler()
+    timer.add("every", lambda after: (int(after) // 10 + 1) * 10, lambda due: None, now=100.0)
+    timer.add("once", one_shot_fire(105.0), lambda due: None, now=100.0)
+    assert timer.next_due() == 105.0
+
+    due_entries, missed = timer._pop_due(112.0)
+    assert sorted((entry.key, due) for entry, due, _ in due_entries) == [("every", 110.0), ("once", 105.0)]
+    assert missed == []
+    assert "once" not in timer and "every" in timer
+    assert timer.next_due() == 120.0
+
+
+def test_remove_is_lazy_and_skipped_on_pop():
+    timer = TimerScheduler()
+    timer.add("a", one_shot_fire(10.0), lambda due: None, now=0.0)
+    timer.add("b", one_shot_fire(20.0), lambda due: None, now=0.0)
+    assert timer.remove("a")
+    assert not timer.remove("a")
+    assert timer.next_due() == 20.0
+    due_entries, _ = timer._pop_due(30.0)
+    assert [entry.key for entry, _, _ in due_entries] == ["b"]
+
+
+def test_late_entries_are_reported_as_missed():
+    timer = TimerScheduler(missed_after=60.0, on_missed=lambda missed: None)
+    timer.add("late", one_shot_fire(100.0), lambda due: None, now=0.0)
+    due_entries, missed = timer._pop_due(1000.0)
+    assert due_entries == []
+    assert missed == [("late", 100.0)]
+    assert timer.stats()["missed"] == 1
+
+
+def test_callback_results_of_one_batch_are_handed_over_together():
+    batches = []
+    done = threading.Event()
+
+    def on_batch(results):
+        batches.append(results)
+        done.set()
+
+    timer = TimerScheduler(on_batch=on_batch)
+    due = time.time() + 0.05
+    for key in range(5):
+        timer.add(key, one_shot_fire(due), lambda fire, key=key: (key, fire))
+    timer.add("silent", one_shot_fire(due), lambda fire: None)
+    timer.start()
+    try:
+        assert done.wait(2.0)
+    finally:
+        timer.stop()
+    assert len(batches) == 1
+    assert sorted(batches[0]) == [(key, due) for key in range(5)]
+    assert timer.stats()["fired"] == 6
@@ -0,0 +1,48 @@
+import math
+
+from macro import TrajectorySimplifier
+
+
+def simplify(points, tolerance, max_interval=10**9):
+    simplifier = TrajectorySimplifier(tolerance, max_interval)
+    kept = [point for point in (simplifier.push(x, y, t) for x, y, t in points) if point]
+    last = simplifier.flush()
+    if last:
+        kept.append(last)
+    return simplifier, kept
+
+
+def distance_to_segment(point, start, end):
+    (px, py), (ax, ay), (bx, by) = point[:2], start[:2], end[:2]
+    dx, dy = bx - ax, by - ay
+    length = dx * dx + dy * dy
+    t = 0.0 if not length else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length))
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def test_straight_line_keeps_only_end_points():
+    points = [(i, 2 * i, i * 1000) for i in range(100)]
+    simplifier, kept = simplify(points, 1.0)
+    assert kept == [points[0], points[-1]]
+    assert simplifier.input_count == 100 and simplifier.output_count == 2
+
+
+def test_dropped_samples_stay_within_tolerance():
+    points = [(int(200 * math.cos(i / 20)), int(200 * math.sin(i / 20)), i * 1000) for i in range(200)]
+    _, kept = simplify(points, 2.0)
+    assert kept[0] == points[0] and kept[-1] == points[-1]
+    assert len(kept) < len(points) // 4
+    segment = 0
+    for point in points:
+        while point[2] > kept[segment + 1][2]:
+            segment += 1
+        assert distance_to_segment(point, kept[segment], kept[segment + 1]) <= 2.0 + 1e-9
+
+
+def test_zero_tolerance_and_max_interval_keep_samples():
+    points = [(i, 0, i * 1000) for i in range(10)]
+    assert simplify(points, 0)[1] == points
+    # 꼭짓점 간격이 max_interval을 넘지 않도록 직선 위의 점도 확정
+    _, kept = simplify(points, 1.0, max_interval=3000)
+    assert all(b[2] - a[2] <= 4000 for a, b in zip(kept, kept[1:]))
+    assert len(kept) > 2